@@ -3,17 +3,23 @@ import numpy as np
 import logging
 import scipy.interpolate as spi
 from scipy.integrate import solve_ivp as ODEsolve
+from scipy.special import sph_harm
 from collections.abc import Iterable
 from glob import glob as FilesMatchingPattern
+from importlib.metadata import version
 from scipy.io import savemat, loadmat
-from PlanetProfile import _Test, _Defaults
+from PlanetProfile import _ROOT, _Test, _Defaults
 from PlanetProfile.Utilities.defineStructs import Constants, EOSlist
 from PlanetProfile.MagneticInduction.Moments import Excitations
 from PlanetProfile.GetConfig import FigMisc, SigParams
 from MoonMag.asymmetry_funcs import read_Benm as GetBenm, BiList as BiAsym, get_chipq_from_CSpq_single as GeodesyNorm2chipq, \
-    get_all_Xid as LoadXid, get_rsurf as GetrSurf, norm4pi as normFactor_4pi
+    get_all_Xid as LoadXid, norm4pi as normFactor_4pi
 from MoonMag.symmetry_funcs import InducedAeList as AeList
 
+# Version of the on-disk format for cached Xid tables. Increment if the cache layout changes.
+XidCacheVer = 1
+MoonMagVer = version('MoonMag')
+
 # Assign logger
 log = logging.getLogger('PlanetProfile')
 
@@ -332,16 +338,14 @@ def CalcAsymContours(Planet, Params):
                 desc = f'{zMean_km:.1f} km depth'
             else:
                 desc = f'{abs(zMean_km):.1f} km altitude'
-            log.debug(f'Calculating topographic data for zMean = {desc} with {360/FigMisc.nLonMap:.1f} deg resolution. This may take some time.')
+            log.debug(f'Calculating topographic data for zMean = {desc} with {360/FigMisc.nLonMap:.1f} deg resolution.')
             if (i == Planet.Magnetic.nAsymBds - 1 and Planet.Magnetic.ionosBounds_m is None) or zMean_km == 0:
-                rSurf_m = np.real(GetrSurf(Planet.Magnetic.pLin, Planet.Magnetic.qLin, Planet.Magnetic.gravShape_m[iLayer, ...],
-                                           Planet.Bulk.R_m, FigMisc.thetaMap_rad, FigMisc.phiMap_rad,
-                                           do_parallel=Params.DO_PARALLEL and not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM)))
+                rSurf_m = EvalAsymSurf(Planet.Magnetic.pLin, Planet.Magnetic.qLin, Planet.Magnetic.gravShape_m[iLayer, ...],
+                                       Planet.Bulk.R_m, FigMisc.thetaMap_rad, FigMisc.phiMap_rad)
                 Planet.Magnetic.asymPlotType = 'surf'
             else:
-                rSurf_m = np.real(GetrSurf(Planet.Magnetic.pLin, Planet.Magnetic.qLin, Planet.Magnetic.asymShape_m[iLayer, ...],
-                                           Planet.Bulk.R_m - zMean_km*1e3, FigMisc.thetaMap_rad, FigMisc.phiMap_rad,
-                                           do_parallel=Params.DO_PARALLEL and not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM)))
+                rSurf_m = EvalAsymSurf(Planet.Magnetic.pLin, Planet.Magnetic.qLin, Planet.Magnetic.asymShape_m[iLayer, ...],
+                                       Planet.Bulk.R_m - zMean_km*1e3, FigMisc.thetaMap_rad, FigMisc.phiMap_rad)
                 if zMean_km < 0:
                     Planet.Magnetic.asymPlotType = 'ionos'
                 elif zMean_km == Planet.zb_km:
@@ -374,6 +378,58 @@ def CalcAsymContours(Planet, Params):
     return Planet
 
 
+def GetYpqMap(pMax, thetaMap_rad, phiMap_rad):
+    """ Get the matrix of fully normalized spherical harmonics Ypq evaluated over
+        a lat/lon map, for all p up to pMax. Basis matrices are cached in EOSlist
+        by map resolution, so that repeat evaluations for each boundary (and each
+        model) need only a matrix-vector product.
+
+        Returns:
+            YpqMap (complex, shape nTheta*nPhi x (pMax+1)**2): Ypq values, with
+                column p**2 + p + q corresponding to degree p and order q.
+    """
+    nTheta = np.size(thetaMap_rad)
+    nPhi = np.size(phiMap_rad)
+    YpqLabel = f'YpqMap_p{pMax}_{nTheta}x{nPhi}_theta{thetaMap_rad[0]:.4f}-{thetaMap_rad[-1]:.4f}' + \
+               f'_phi{phiMap_rad[0]:.4f}-{phiMap_rad[-1]:.4f}'
+    if YpqLabel in EOSlist.loaded.keys():
+        YpqMap = EOSlist.loaded[YpqLabel]
+    else:
+        theta, phi = np.meshgrid(thetaMap_rad, phiMap_rad, indexing='ij')
+        pAll = np.array([p for p in range(pMax+1) for _ in range(-p, p+1)])
+        qAll = np.array([q for p in range(pMax+1) for q in range(-p, p+1)])
+        YpqMap = sph_harm(qAll[np.newaxis, :], pAll[np.newaxis, :],
+                          phi.flatten()[:, np.newaxis], theta.flatten()[:, np.newaxis])
+        EOSlist.loaded[YpqLabel] = YpqMap
+        EOSlist.ranges[YpqLabel] = f'{nTheta}x{nPhi}'
+
+    return YpqMap
+
+
+def EvalAsymSurf(pLin, qLin, asymShape_m, rMean_m, thetaMap_rad, phiMap_rad):
+    """ Evaluate the radius of an asymmetric boundary over a lat/lon map, from its
+        shape coefficients chi_pq in m.
+
+        Args:
+            pLin, qLin (int, shape Npq): Linear lists of p, q values to include.
+            asymShape_m (complex, shape 2 x pMax+1 x pMax+1): Boundary shape coefficients,
+                such that asymShape_m[int(q<0), p, abs(q)] = chi_pq.
+            rMean_m (float): Mean radius of the boundary in m.
+        Returns:
+            rSurf_m (float, shape nTheta x nPhi): Radius of the boundary at each map point.
+    """
+    pMax = np.shape(asymShape_m)[1] - 1
+    YpqMap = GetYpqMap(pMax, thetaMap_rad, phiMap_rad)
+    # Linearize the shape coefficients to match the columns of the basis matrix
+    chipqLin_m = np.zeros((pMax+1)**2, dtype=np.complex_)
+    for p, q in zip(np.asarray(pLin, dtype=np.int_), np.asarray(qLin, dtype=np.int_)):
+        if p <= pMax:
+            chipqLin_m[p**2 + p + q] += asymShape_m[int(q<0), p, abs(q)]
+    rSurf_m = rMean_m + np.real(YpqMap @ chipqLin_m)
+
+    return np.reshape(rSurf_m, (np.size(thetaMap_rad), np.size(phiMap_rad)))
+
+
 def ReloadAsym(Planet, Params, fNameOverride=None):
     # Reload calculated boundary deviations from disk
 
@@ -569,15 +625,10 @@ def SetupInduction(Planet, Params):
                 Planet.Magnetic.nAsymBds = np.size(Planet.Magnetic.zMeanAsym_km)
 
                 # Fetch Xid array
-                XidLabel = f''
+                nMax = Planet.Magnetic.nprmMax + Planet.Magnetic.pMax
+                XidLabel = f'Xid_n{Planet.Magnetic.nprmMax}_p{Planet.Magnetic.pMax}_np{nMax}'
                 if XidLabel not in EOSlist.loaded.keys():
-                    nMax = Planet.Magnetic.nprmMax + Planet.Magnetic.pMax
-                    # Make local copies of nLin and mLin here, because we only need to do this
-                    # for an unusual use case
-                    nLin = [n for n in range(1, nMax+1) for _ in range(-n, n+1)]
-                    mLin = [m for n in range(1, nMax+1) for m in range(-n, n+1)]
-                    Planet.Magnetic.Xid = LoadXid(Planet.Magnetic.nprmMax, Planet.Magnetic.pMax, nMax,
-                                  nLin, mLin, reload=True, do_parallel=False)
+                    Planet.Magnetic.Xid = GetXid(Planet.Magnetic.nprmMax, Planet.Magnetic.pMax, Params)
                     EOSlist.loaded[XidLabel] = Planet.Magnetic.Xid
                     EOSlist.ranges[XidLabel] = f'{Planet.Magnetic.nprmMax}x{Planet.Magnetic.pMax}x{nMax}'
                 else:
@@ -614,6 +665,61 @@ def SetupInduction(Planet, Params):
     return Planet, Params
 
 
+def GetXid(nprmMax, pMax, Params):
+    """ Fetch the mixing coefficient table Xid used in asymmetric induction calculations
+        from a persistent on-disk cache, calculating and saving it if it is not found.
+        Cached tables are keyed by nprmMax, pMax, and the MoonMag version, and are
+        memory-mapped on load. Xid does not depend on the boundary shapes, so no shape
+        information is needed to identify a cached table. MoonMag calculates Xid with mpmath,
+        but the table is returned as float64 whether or not it is cached, matching the
+        precision of the tables MoonMag itself saves and reloads.
+
+        Args:
+            nprmMax (int): Maximum excitation degree n'.
+            pMax (int): Maximum boundary shape degree p.
+        Returns:
+            Xid (float, shape 2x(nMax+1)x(nMax+1)x2x(pMax+1)x(pMax+1)x2x(nprmMax+1)x(nprmMax+1)):
+                Mixing coefficients, with nMax = nprmMax + pMax.
+    """
+    nMax = nprmMax + pMax
+    # Make local copies of nLin and mLin here, because we only need to do this
+    # for an unusual use case
+    nLin = [n for n in range(1, nMax+1) for _ in range(-n, n+1)]
+    mLin = [m for n in range(1, nMax+1) for m in range(-n, n+1)]
+    if not Params.Sig.CACHE_XID:
+        return LoadXid(nprmMax, pMax, nMax, nLin, mLin, reload=True, do_parallel=False).astype(np.float_)
+
+    # Relative cache paths are kept with the package, as Xid does not depend on the body
+    cacheDir = os.path.join(_ROOT, 'MagneticInduction', Params.Sig.XidCacheDir)
+    cacheFile = os.path.join(cacheDir,
+                             f'Xid_n{nprmMax}_p{pMax}_np{nMax}_v{XidCacheVer}_MoonMag{MoonMagVer}.npy')
+    if os.path.isfile(cacheFile):
+        try:
+            Xid = np.load(cacheFile, mmap_mode='r')
+        except (OSError, ValueError) as err:
+            log.warning(f'Unable to load cached Xid table from {cacheFile}. It will be recalculated. ' +
+                        f'The error reported was:\n{err}')
+        else:
+            log.debug(f'Loaded cached Xid table from file: {cacheFile}')
+            return Xid
+
+    log.debug(f'Calculating Xid table for nprmMax = {nprmMax}, pMax = {pMax}. This may take some time.')
+    Xid = LoadXid(nprmMax, pMax, nMax, nLin, mLin, reload=True, do_parallel=False).astype(np.float_)
+    try:
+        os.makedirs(cacheDir, exist_ok=True)
+        # Write to a temporary file first and then move, so that parallel runs never see a partial file
+        tmpFile = f'{cacheFile[:-4]}_{os.getpid()}.tmp.npy'
+        np.save(tmpFile, Xid)
+        os.replace(tmpFile, cacheFile)
+    except OSError as err:
+        log.warning(f'Unable to save Xid table to cache file {cacheFile}. The error reported was:\n{err}')
+    else:
+        log.debug(f'Saved Xid table to cache file: {cacheFile}')
+        Xid = np.load(cacheFile, mmap_mode='r')
+
+    return Xid
+
+
 def GetBexc(bodyname, era, model, excSelection, MPmodel=None, nprmMax=1, pMax=0):
     """ Read in magnetic excitation information, including oscillation
         frequencies/periods and complex amplitudes and phases (moments).
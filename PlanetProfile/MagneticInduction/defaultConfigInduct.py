@@ -3,7 +3,7 @@ import numpy as np
 from PlanetProfile.Utilities.defineStructs import InductOgramParamsStruct, \
     ExcitationSpectrumParamsStruct, ConductLayerParamsStruct, Constants
 
-configInductVersion = 6  # Integer number for config file version. Increment when new settings are added to the default config file.
+configInductVersion = 7  # Integer number for config file version. Increment when new settings are added to the default config file.
 
 def inductAssign():
     inductOtype = 'rho'  # Type of inductogram plot to make. Options are "Tb", "phi", "rho", "sigma", where the first 3 are vs. salinity, and sigma is vs. thickness. Sigma/D plot is not self-consistent.
@@ -32,6 +32,8 @@ def GetInductParams(inductOtype, cLevels, dftC, cfmt):
     SigParams.CONCENTRIC_ASYM = False  # Whether to map a single asymmetric shape to all layers, concentrically, scaling by their radii.
     SigParams.ALLOW_LOW_PMAX = False  # Whether to allow Magnetic.pMax to be set to an integer less than 2.
     SigParams.asymFstring = 'Shape_4piNormDepth'
+    SigParams.CACHE_XID = True  # Whether to save and reload asymmetric induction mixing coefficient (Xid) tables from an on-disk cache. Saves substantial time for large pMax.
+    SigParams.XidCacheDir = 'XidCache'  # Directory in which to store cached Xid tables. Relative paths are within the PlanetProfile/MagneticInduction package directory.
 
     # Excitation spectrum settings
     ExcSpecParams.nOmegaPts = 100  # Resolution in log frequency space for magnetic excitation spectra
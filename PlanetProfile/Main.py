@@ -2,12 +2,14 @@
 import os, sys, time, importlib
 import numpy as np
 import logging
+import h5py
 from scipy.io import savemat, loadmat
 from copy import deepcopy
 from distutils.util import strtobool
 from collections.abc import Iterable
 from os.path import isfile
 from glob import glob as FilesMatchingPattern
+from functools import reduce
 
 # Import all function definitions for this file
 from PlanetProfile import _Defaults, _TestImport, CopyCarefully
@@ -18,27 +20,63 @@ from PlanetProfile.Plotting.ProfilePlots import GeneratePlots, PlotExploreOgram,
 from PlanetProfile.Plotting.MagPlots import GenerateMagPlots, PlotInductOgram, \
     PlotInductOgramPhaseSpace
 from PlanetProfile.Thermodynamics.LayerPropagators import IceLayers, OceanLayers, InnerLayers
-from PlanetProfile.Thermodynamics.Electrical import ElecConduct
-from PlanetProfile.Thermodynamics.Seismic import SeismicCalcs, WriteSeismic
-from PlanetProfile.Thermodynamics.Viscosity import ViscosityCalcs
-from PlanetProfile.Utilities.defineStructs import Constants, FigureFilesSubstruct, PlanetStruct, ExplorationResults
+from PlanetProfile.Thermodynamics.LayerProperties import LayerPropertyCalcs
+from PlanetProfile.Thermodynamics.Seismic import WriteSeismic
+from PlanetProfile.Thermodynamics.ThermalProfiles.IceConduction import UnloadIceShells
+from PlanetProfile.Thermodynamics.ThermalProfiles.ThermalProfiles import LoadTmeltTable, UnloadTmeltTable
+from PlanetProfile.Utilities.defineStructs import Constants, FigureFilesSubstruct, PlanetStruct, ExplorationResults, \
+    ExplorationStruct
 from PlanetProfile.Utilities.SetupInit import SetupInit, SetupFilenames, SetCMR2strings
 from PlanetProfile.Utilities.PPversion import ppVerNum
+from PlanetProfile.Utilities.PoolManager import PoolSession, GetPool, ReleasePool
 from PlanetProfile.Utilities.SummaryTables import GetLayerMeans, PrintGeneralSummary, PrintLayerSummaryLatex, PrintLayerTableLatex
 
-# Parallel processing
-import multiprocessing as mtp
-import platform
-plat = platform.system()
-if plat == 'Windows':
-    mtpType = 'spawn'
-else:
-    mtpType = 'fork'
-mtpContext = mtp.get_context(mtpType)
-
 # Assign logger
 log = logging.getLogger('PlanetProfile')
 
+# Planet attributes saved as floats in profile file headers, in the order they are printed
+profileHeaderFloats = [
+    'Ocean.wOcean_ppt', 'Sil.wPore_ppt', 'Bulk.R_m', 'Bulk.M_kg', 'Bulk.Cmeasured',
+    'Bulk.CuncertaintyLower', 'Bulk.CuncertaintyUpper', 'Bulk.Psurf_MPa', 'Bulk.Tsurf_K',
+    'qSurf_Wm2', 'qCon_Wm2',
+    'Bulk.Tb_K', 'zb_km', 'zClath_m', 'D_km', 'Pb_MPa', 'PbI_MPa',
+    'Ocean.deltaP', 'Mtot_kg', 'CMR2mean', 'CMR2less', 'CMR2more', 'Ocean.QfromMantle_W',
+    'Ocean.rhoMean_kgm3', 'Sil.phiCalc_frac', 'Sil.Qrad_Wkg', 'Sil.HtidalMean_Wm3',
+    'Sil.Rmean_m', 'Sil.Rrange_m', 'Sil.rhoMean_kgm3', 'Core.Rmean_m', 'Core.Rrange_m',
+    'Core.rhoMean_kgm3', 'MH2O_kg', 'Mrock_kg', 'Mcore_kg', 'Mice_kg',
+    'Msalt_kg', 'MporeSalt_kg', 'Mocean_kg', 'Mfluid_kg', 'MporeFluid_kg',
+    'Mclath_kg', 'MclathGas_kg', 'Ocean.sigmaMean_Sm', 'Sil.sigmaPoreMean_Sm',
+    'Sil.sigmaPorousLayerMean_Sm', 'Tconv_K', 'etaConv_Pas', 'RaConvect', 'RaConvectIII', 'RaConvectV',
+    'RaCrit', 'RaCritIII', 'RaCritV', 'eLid_m', 'eLidIII_m', 'eLidV_m',
+    'Dconv_m', 'DconvIII_m', 'DconvV_m', 'deltaTBL_m', 'deltaTBLIII_m', 'deltaTBLV_m']
+# Planet attributes saved as integers in profile file headers
+profileHeaderSteps = ['Steps.nClath', 'Steps.nIceI', 'Steps.nIceIIILitho', 'Steps.nIceVLitho',
+                      'Steps.nHydro', 'Steps.nSil', 'Steps.nCore']
+# Planet attributes saved as columns in profile files, in the order they are printed
+profileCols = ['P_MPa', 'T_K', 'r_m', 'phase', 'rho_kgm3', 'Cp_JkgK', 'alpha_pK', 'g_ms2', 'phi_frac',
+               'sigma_Sm', 'kTherm_WmK', 'Seismic.VP_kms', 'Seismic.VS_kms', 'Seismic.QS',
+               'Seismic.KS_GPa', 'Seismic.GS_GPa', 'Ppore_MPa', 'rhoMatrix_kgm3', 'rhoPore_kgm3',
+               'MLayer_kg', 'VLayer_m3', 'Htidal_Wm3', 'eta_Pas']
+# Printf-style format strings for one row of columnar data in text profile files
+profileRowFmt = ' '.join(['%8d' if name == 'phase' else '%24.17e' for name in profileCols]) + '\n'
+mantCoreRowFmt = '%24.17e %24.17e %24.17e\n '
+# Exploration attributes saved as HDF5 attributes in explore-o-gram files
+exploreAttrs = ['bodyname', 'NO_H2O', 'CMR2str', 'Cmeasured', 'Cupper', 'Clower', 'xName', 'yName']
+# Exploration attributes saved as one dataset each in explore-o-gram files
+exploreFields = ['wOcean_ppt', 'oceanComp', 'R_m', 'Tb_K', 'xFeS', 'rhoSilInput_kgm3', 'silPhi_frac',
+                 'icePhi_frac', 'silPclosure_MPa', 'icePclosure_MPa', 'ionosTop_km', 'sigmaIonos_Sm',
+                 'Htidal_Wm3', 'Qrad_Wkg', 'qSurf_Wm2', 'rhoSilMean_kgm3', 'rhoCoreMean_kgm3', 'sigmaMean_Sm',
+                 'sigmaTop_Sm', 'Tmean_K', 'D_km', 'zb_km', 'zSeafloor_km', 'dzIceI_km', 'dzClath_km',
+                 'dzIceIII_km', 'dzIceIIIund_km', 'dzIceV_km', 'dzIceVund_km', 'dzIceVI_km', 'dzWetHPs_km',
+                 'eLid_km', 'Rcore_km', 'silPhiCalc_frac', 'Pseafloor_MPa', 'phiSeafloor_frac', 'CMR2calc',
+                 'VALID', 'invalidReason']
+# Additional datasets saved in inversion explore-o-gram files
+invertFields = ['Amp', 'phase', 'RMSe', 'chiSquared', 'stdDev', 'Rsquared']
+# Inversion fields holding a dict of excitation values keyed by spacecraft name in each grid cell
+invertScFields = ['Amp', 'phase']
+# Datasets needed by PlotExploreOgramDsigma
+exploreDsigmaFields = ['D_km', 'sigmaMean_Sm', 'zb_km', 'oceanComp']
+
 """ MAIN RUN BLOCK """
 def run(bodyname=None, opt=None, fNames=None):
 
@@ -83,10 +121,14 @@ def run(bodyname=None, opt=None, fNames=None):
         if bodyname == '':
             raise ValueError('A single body must be specified for an ExploreOgram.')
         else:
-            Exploration, Params = ExploreOgram(bodyname, Params)
+            if Params.SKIP_PLOTS:
+                plotFields = None
+            else:
+                plotFields = ExplorePlotFields(Params)
+            Exploration, Params = ExploreOgram(bodyname, Params, fields=plotFields)
         if not Params.SKIP_PLOTS:
             if Params.COMPARE:
-                exploreOgramFiles = FilesMatchingPattern(os.path.join(Params.DataFiles.fNameExplore+'*.mat'))
+                exploreOgramFiles = FilesMatchingPattern(os.path.join(Params.DataFiles.fNameExplore+'*.h5'))
                 Params.nModels = np.size(exploreOgramFiles)
                 ExplorationList = np.empty(Params.nModels, dtype=object)
                 ExplorationList[0] = deepcopy(Exploration)
@@ -95,7 +137,8 @@ def run(bodyname=None, opt=None, fNames=None):
                     exploreOgramFiles.remove(Params.DataFiles.exploreOgramFile)
                     exploreOgramFiles.insert(0, Params.DataFiles.exploreOgramFile)
                 for i, reloadExplore in enumerate(exploreOgramFiles[1:]):
-                    ExplorationList[i+1] = ReloadExploreOgram(bodyname, Params, fNameOverride=reloadExplore)[0]
+                    ExplorationList[i+1] = ReloadExploreOgram(bodyname, Params, fNameOverride=reloadExplore,
+                                                              fields=plotFields)[0]
             else:
                 ExplorationList = [Exploration]
             if isinstance(Params.Explore.zName, list):
@@ -145,7 +188,8 @@ def run(bodyname=None, opt=None, fNames=None):
         """ Post-processing """
         # Loading BodyProfile...txt files to plot them together
         if Params.COMPARE and not Params.RUN_ALL_PROFILES:
-            fNamesToCompare = np.array(FilesMatchingPattern(os.path.join(PlanetList[0].bodyname, f'{PlanetList[0].name}Profile*.txt')))
+            fNamesToCompare = np.array(FilesMatchingPattern(os.path.join(PlanetList[0].bodyname, f'{PlanetList[0].name}Profile*.txt'))
+                                     + FilesMatchingPattern(os.path.join(PlanetList[0].bodyname, f'{PlanetList[0].name}Profile*.npz')))
             isProfile = [Params.DataFiles.saveFile != fName and 'mantle' not in fName for fName in fNamesToCompare]
             fProfiles = fNamesToCompare[isProfile]
             nCompare = np.size(fProfiles) + 1
@@ -201,9 +245,7 @@ def PlanetProfile(Planet, Params):
         if not Planet.Do.NO_OCEAN:
             Planet = OceanLayers(Planet, Params)
         Planet = InnerLayers(Planet, Params)
-        Planet = ElecConduct(Planet, Params)
-        Planet = SeismicCalcs(Planet, Params)
-        Planet = ViscosityCalcs(Planet, Params)
+        Planet = LayerPropertyCalcs(Planet, Params)
 
         # Save data after modeling
         if (not Params.NO_SAVEFILE) and Planet.Do.VALID and (not Params.INVERSION_IN_PROGRESS):
@@ -264,8 +306,7 @@ def InteriorEtc(Planet, Params):
     """
 
     Planet = InnerLayers(Planet, Params)
-    Planet = ElecConduct(Planet, Params)
-    Planet = SeismicCalcs(Planet, Params)
+    Planet = LayerPropertyCalcs(Planet, Params)
     if not Params.SKIP_INDUCTION and (Params.CALC_CONDUCT and Params.CALC_NEW_INDUCT):
         # Calculate induced magnetic moments
         Planet, Params = MagneticInduction(Planet, Params)
@@ -398,6 +439,10 @@ def ExecOpts(Params, bodyname, opt, fNames=None):
 
 def WriteProfile(Planet, Params):
     """ Write out all profile calculations to disk """
+    if Params.DataFiles.saveFile.endswith('.npz'):
+        WriteProfileBin(Planet, Params)
+        return
+
     headerLines = [
         f'PlanetProfile version = {ppVerNum}',
         f'MoI label = {Planet.tradeLabel}',
@@ -508,50 +553,83 @@ def WriteProfile(Planet, Params):
         f.write(Planet.label + '\n')
         f.write('\n  '.join(headerLines) + '\n')
         f.write(' '.join(colHeaders) + '\n')
-        # Now print the columnar data
-        for i in range(Planet.Steps.nTotal):
-            f.write(' '.join([
-                f'{Planet.P_MPa[i]:24.17e}',
-                f'{Planet.T_K[i]:24.17e}',
-                f'{Planet.r_m[i]:24.17e}',
-                f'{Planet.phase[i]:8d}',
-                f'{Planet.rho_kgm3[i]:24.17e}',
-                f'{Planet.Cp_JkgK[i]:24.17e}',
-                f'{Planet.alpha_pK[i]:24.17e}',
-                f'{Planet.g_ms2[i]:24.17e}',
-                f'{Planet.phi_frac[i]:24.17e}',
-                f'{Planet.sigma_Sm[i]:24.17e}',
-                f'{Planet.kTherm_WmK[i]:24.17e}',
-                f'{Planet.Seismic.VP_kms[i]:24.17e}',
-                f'{Planet.Seismic.VS_kms[i]:24.17e}',
-                f'{Planet.Seismic.QS[i]:24.17e}',
-                f'{Planet.Seismic.KS_GPa[i]:24.17e}',
-                f'{Planet.Seismic.GS_GPa[i]:24.17e}',
-                f'{Planet.Ppore_MPa[i]:24.17e}',
-                f'{Planet.rhoMatrix_kgm3[i]:24.17e}',
-                f'{Planet.rhoPore_kgm3[i]:24.17e}',
-                f'{Planet.MLayer_kg[i]:24.17e}',
-                f'{Planet.VLayer_m3[i]:24.17e}',
-                f'{Planet.Htidal_Wm3[i]:24.17e}',
-                f'{Planet.eta_Pas[i]:24.17e}']) + '\n')
+        # Now print the columnar data, formatting all rows in a single operation
+        nTotal = Planet.Steps.nTotal
+        profileData = np.column_stack([GetPlanetAttr(Planet, name)[:nTotal] for name in profileCols])
+        f.write((profileRowFmt * nTotal) % tuple(profileData.ravel().tolist()))
 
     # Write out data from core/mantle trade
     with open(Params.DataFiles.mantCoreFile, 'w') as f:
         f.write(' '.join(['RsilTrade (m)'.ljust(24),
                           'RcoreTrade (m)'.ljust(24),
                           'rhoSilTrade (kg/m3)']) + '\n')
-        for i in range(np.size(Planet.Sil.Rtrade_m)):
-            line = ' '.join([
-                f'{Planet.Sil.Rtrade_m[i]:24.17e}',
-                f'{Planet.Core.Rtrade_m[i]:24.17e}',
-                f'{Planet.Sil.rhoTrade_kgm3[i]:24.17e}\n '
-            ])
-            f.write(line)
+        tradeData = np.column_stack((Planet.Sil.Rtrade_m, Planet.Core.Rtrade_m, Planet.Sil.rhoTrade_kgm3))
+        f.write((mantCoreRowFmt * np.size(Planet.Sil.Rtrade_m)) % tuple(tradeData.ravel().tolist()))
+
+    log.info(f'Profile saved to file: {Params.DataFiles.saveFile}')
+    return
+
+
+def WriteProfileBin(Planet, Params):
+    """ Write out all profile calculations to disk as named arrays in a single binary .npz file,
+        including the core/mantle trade data.
+    """
+    np.savez(Params.DataFiles.saveFile,
+             label=Planet.label,
+             ppVerNum=ppVerNum,
+             tradeLabel=Planet.tradeLabel,
+             Fe_CORE=Planet.Do.Fe_CORE,
+             POROUS_ICE=Planet.Do.POROUS_ICE,
+             mantleEOS=str(Planet.Sil.mantleEOS),
+             coreEOS=str(Planet.Core.coreEOS),
+             oceanComp=Planet.Ocean.comp,
+             poreComp=str(Planet.Sil.poreComp),
+             headerNames=profileHeaderFloats,
+             header=np.array([GetPlanetAttr(Planet, name) for name in profileHeaderFloats], dtype=np.float64),
+             stepsNames=profileHeaderSteps,
+             steps=np.array([GetPlanetAttr(Planet, name) for name in profileHeaderSteps], dtype=np.int_),
+             profileCols=profileCols,
+             profile=np.vstack([GetPlanetAttr(Planet, name)[:Planet.Steps.nTotal] for name in profileCols]),
+             mantCore=np.vstack((Planet.Sil.Rtrade_m, Planet.Core.Rtrade_m, Planet.Sil.rhoTrade_kgm3)))
 
     log.info(f'Profile saved to file: {Params.DataFiles.saveFile}')
     return
 
 
+def ReloadProfileBin(Planet, Params):
+    """ Reload a profile saved with WriteProfileBin """
+    with np.load(Params.DataFiles.saveFile) as data:
+        Planet.label = str(data['label'])
+        Planet.tradeLabel = str(data['tradeLabel'])
+        Planet.Do.Fe_CORE = bool(data['Fe_CORE'])
+        Planet.Do.POROUS_ICE = bool(data['POROUS_ICE'])
+        Planet.Sil.mantleEOS = str(data['mantleEOS'])
+        Planet.Core.coreEOS = str(data['coreEOS'])
+        Planet.Ocean.comp = str(data['oceanComp'])
+        Planet.Sil.poreComp = str(data['poreComp'])
+        for name, value in zip(data['headerNames'], data['header']):
+            SetPlanetAttr(Planet, name, float(value))
+        for name, value in zip(data['stepsNames'], data['steps']):
+            SetPlanetAttr(Planet, name, int(value))
+        for name, values in zip(data['profileCols'], data['profile']):
+            SetPlanetAttr(Planet, name, values)
+        Planet.Sil.Rtrade_m, Planet.Core.Rtrade_m, Planet.Sil.rhoTrade_kgm3 = data['mantCore']
+
+    return Planet
+
+
+def GetPlanetAttr(Planet, name):
+    """ Get a (possibly nested) attribute of Planet by its dotted name, e.g. 'Bulk.R_m'. """
+    return reduce(getattr, name.split('.'), Planet)
+
+
+def SetPlanetAttr(Planet, name, value):
+    """ Set a (possibly nested) attribute of Planet by its dotted name, e.g. 'Bulk.R_m'. """
+    *parents, attr = name.split('.')
+    setattr(reduce(getattr, parents, Planet), attr, value)
+    return
+
+
 def ReloadProfile(Planet, Params, fnameOverride=None):
     """ Reload previously saved PlanetProfile run from disk """
     if Planet is None:
@@ -574,64 +652,73 @@ def ReloadProfile(Planet, Params, fnameOverride=None):
         raise ValueError(f'CALC_NEW is set to False in configPP.py but the reload file at {Params.DataFiles.saveFile} ' +
                          'was not found.\nRe-run with CALC_NEW set to True to generate the profile.')
 
-    with open(Params.DataFiles.saveFile) as f:
-        # Get legend label for differentiating runs
-        Planet.label = f.readline().strip()
-        # Get number of header lines to read in from (and skip for columnar data)
-        Params.nHeadLines = int(f.readline().split('=')[-1])
-        # Skip version number read-in
-        _ = f.readline()
-        # Get MoI-included label for tradeoff plots
-        Planet.tradeLabel = f.readline().split('=')[-1].strip()
-        # Get whether iron core is modeled
-        Planet.Do.Fe_CORE = bool(strtobool(f.readline().split('=')[-1].strip()))
-        # Get silicate mantle Perple_X EOS file
-        Planet.Sil.mantleEOS = f.readline().split('=')[-1].strip()
-        # Get iron core Perple_X EOS file
-        Planet.Core.coreEOS = f.readline().split('=')[-1].strip() 
-        # Get dissolved salt supposed for ocean (present in filename, but this is intended for future-proofing when we move to a database lookup)
-        Planet.Ocean.comp = f.readline().split('=')[-1].strip()
-        # Get dissolved salt supposed for pore space
-        Planet.Sil.poreComp = f.readline().split('=')[-1].strip()
-        # Get float values from header
-        Planet.Ocean.wOcean_ppt, Planet.Sil.wPore_ppt, Planet.Bulk.R_m, Planet.Bulk.M_kg, Planet.Bulk.Cmeasured, \
-        Planet.Bulk.CuncertaintyLower, Planet.Bulk.CuncertaintyUpper, Planet.Bulk.Psurf_MPa, Planet.Bulk.Tsurf_K, \
-        Planet.qSurf_Wm2, Planet.qCon_Wm2, \
-        Planet.Bulk.Tb_K, Planet.zb_km, Planet.zClath_m, Planet.D_km, Planet.Pb_MPa, Planet.PbI_MPa, \
-        Planet.Ocean.deltaP, Planet.Mtot_kg, Planet.CMR2mean, Planet.CMR2less, Planet.CMR2more, Planet.Ocean.QfromMantle_W, \
-        Planet.Ocean.rhoMean_kgm3, Planet.Sil.phiCalc_frac, Planet.Sil.Qrad_Wkg, Planet.Sil.HtidalMean_Wm3, \
-        Planet.Sil.Rmean_m, Planet.Sil.Rrange_m, Planet.Sil.rhoMean_kgm3, Planet.Core.Rmean_m, Planet.Core.Rrange_m, \
-        Planet.Core.rhoMean_kgm3, Planet.MH2O_kg, Planet.Mrock_kg, Planet.Mcore_kg, Planet.Mice_kg, \
-        Planet.Msalt_kg, Planet.MporeSalt_kg, Planet.Mocean_kg, Planet.Mfluid_kg, Planet.MporeFluid_kg, \
-        Planet.Mclath_kg, Planet.MclathGas_kg, Planet.Ocean.sigmaMean_Sm, Planet.Sil.sigmaPoreMean_Sm, \
-        Planet.Sil.sigmaPorousLayerMean_Sm, Planet.Tconv_K, Planet.etaConv_Pas, Planet.RaConvect, Planet.RaConvectIII, Planet.RaConvectV, \
-        Planet.RaCrit, Planet.RaCritIII, Planet.RaCritV, Planet.eLid_m, Planet.eLidIII_m, Planet.eLidV_m, \
-        Planet.Dconv_m, Planet.DconvIII_m, Planet.DconvV_m, Planet.deltaTBL_m, Planet.deltaTBLIII_m, Planet.deltaTBLV_m \
-            = (float(f.readline().split('=')[-1]) for _ in range(64))
-        # Note porosity flags
-        Planet.Do.POROUS_ICE = bool(strtobool(f.readline().split('=')[-1].strip()))
-        Planet.Do.POROUS_ROCK = not np.isnan(Planet.Sil.phiCalc_frac)
-        # Get integer values from header (nSteps values)
-        Planet.Steps.nClath, Planet.Steps.nIceI, \
-        Planet.Steps.nIceIIILitho, Planet.Steps.nIceVLitho, \
-        Planet.Steps.nHydro, Planet.Steps.nSil, Planet.Steps.nCore \
-            = (int(f.readline().split('=')[-1]) for _ in range(7))
-
-        if Planet.Ocean.comp == 'none':
-            Planet.Do.NO_H2O = True
-        if Planet.Do.NO_H2O:
-            Planet.Bulk.qSurf_Wm2 = Planet.qSurf_Wm2 + 0.0
+    if Params.DataFiles.saveFile.endswith('.npz'):
+        Planet = ReloadProfileBin(Planet, Params)
+    else:
+        with open(Params.DataFiles.saveFile) as f:
+            # Get legend label for differentiating runs
+            Planet.label = f.readline().strip()
+            # Get number of header lines to read in from (and skip for columnar data)
+            Params.nHeadLines = int(f.readline().split('=')[-1])
+            # Skip version number read-in
+            _ = f.readline()
+            # Get MoI-included label for tradeoff plots
+            Planet.tradeLabel = f.readline().split('=')[-1].strip()
+            # Get whether iron core is modeled
+            Planet.Do.Fe_CORE = bool(strtobool(f.readline().split('=')[-1].strip()))
+            # Get silicate mantle Perple_X EOS file
+            Planet.Sil.mantleEOS = f.readline().split('=')[-1].strip()
+            # Get iron core Perple_X EOS file
+            Planet.Core.coreEOS = f.readline().split('=')[-1].strip() 
+            # Get dissolved salt supposed for ocean (present in filename, but this is intended for future-proofing when we move to a database lookup)
+            Planet.Ocean.comp = f.readline().split('=')[-1].strip()
+            # Get dissolved salt supposed for pore space
+            Planet.Sil.poreComp = f.readline().split('=')[-1].strip()
+            # Get float values from header
+            Planet.Ocean.wOcean_ppt, Planet.Sil.wPore_ppt, Planet.Bulk.R_m, Planet.Bulk.M_kg, Planet.Bulk.Cmeasured, \
+            Planet.Bulk.CuncertaintyLower, Planet.Bulk.CuncertaintyUpper, Planet.Bulk.Psurf_MPa, Planet.Bulk.Tsurf_K, \
+            Planet.qSurf_Wm2, Planet.qCon_Wm2, \
+            Planet.Bulk.Tb_K, Planet.zb_km, Planet.zClath_m, Planet.D_km, Planet.Pb_MPa, Planet.PbI_MPa, \
+            Planet.Ocean.deltaP, Planet.Mtot_kg, Planet.CMR2mean, Planet.CMR2less, Planet.CMR2more, Planet.Ocean.QfromMantle_W, \
+            Planet.Ocean.rhoMean_kgm3, Planet.Sil.phiCalc_frac, Planet.Sil.Qrad_Wkg, Planet.Sil.HtidalMean_Wm3, \
+            Planet.Sil.Rmean_m, Planet.Sil.Rrange_m, Planet.Sil.rhoMean_kgm3, Planet.Core.Rmean_m, Planet.Core.Rrange_m, \
+            Planet.Core.rhoMean_kgm3, Planet.MH2O_kg, Planet.Mrock_kg, Planet.Mcore_kg, Planet.Mice_kg, \
+            Planet.Msalt_kg, Planet.MporeSalt_kg, Planet.Mocean_kg, Planet.Mfluid_kg, Planet.MporeFluid_kg, \
+            Planet.Mclath_kg, Planet.MclathGas_kg, Planet.Ocean.sigmaMean_Sm, Planet.Sil.sigmaPoreMean_Sm, \
+            Planet.Sil.sigmaPorousLayerMean_Sm, Planet.Tconv_K, Planet.etaConv_Pas, Planet.RaConvect, Planet.RaConvectIII, Planet.RaConvectV, \
+            Planet.RaCrit, Planet.RaCritIII, Planet.RaCritV, Planet.eLid_m, Planet.eLidIII_m, Planet.eLidV_m, \
+            Planet.Dconv_m, Planet.DconvIII_m, Planet.DconvV_m, Planet.deltaTBL_m, Planet.deltaTBLIII_m, Planet.deltaTBLV_m \
+                = (float(f.readline().split('=')[-1]) for _ in range(64))
+            # Note porosity flags
+            Planet.Do.POROUS_ICE = bool(strtobool(f.readline().split('=')[-1].strip()))
+            # Get integer values from header (nSteps values)
+            Planet.Steps.nClath, Planet.Steps.nIceI, \
+            Planet.Steps.nIceIIILitho, Planet.Steps.nIceVLitho, \
+            Planet.Steps.nHydro, Planet.Steps.nSil, Planet.Steps.nCore \
+                = (int(f.readline().split('=')[-1]) for _ in range(7))
+
+        # Read in columnar data that follows header lines -- full-body
+        Planet.P_MPa, Planet.T_K, Planet.r_m, Planet.phase, Planet.rho_kgm3, Planet.Cp_JkgK, Planet.alpha_pK, \
+        Planet.g_ms2, Planet.phi_frac, Planet.sigma_Sm, Planet.kTherm_WmK, Planet.Seismic.VP_kms, Planet.Seismic.VS_kms,\
+        Planet.Seismic.QS, Planet.Seismic.KS_GPa, Planet.Seismic.GS_GPa, Planet.Ppore_MPa, Planet.rhoMatrix_kgm3, \
+        Planet.rhoPore_kgm3, Planet.MLayer_kg, Planet.VLayer_m3, Planet.Htidal_Wm3, Planet.eta_Pas \
+            = np.loadtxt(Params.DataFiles.saveFile, skiprows=Params.nHeadLines, unpack=True)
+
+        # Read in data for core/mantle trade
+        Planet.Sil.Rtrade_m, Planet.Core.Rtrade_m, Planet.Sil.rhoTrade_kgm3, \
+            = np.loadtxt(Params.DataFiles.mantCoreFile, skiprows=1, unpack=True)
+
+    # Rock porosity is modeled if a porosity was calculated
+    Planet.Do.POROUS_ROCK = not np.isnan(Planet.Sil.phiCalc_frac)
+    if Planet.Ocean.comp == 'none':
+        Planet.Do.NO_H2O = True
+    if Planet.Do.NO_H2O:
+        Planet.Bulk.qSurf_Wm2 = Planet.qSurf_Wm2 + 0.0
 
     Planet.Steps.nIbottom = Planet.Steps.nClath + Planet.Steps.nIceI
     Planet.Steps.nIIIbottom = Planet.Steps.nIbottom + Planet.Steps.nIceIIILitho
     Planet.Steps.nSurfIce = Planet.Steps.nIIIbottom + Planet.Steps.nIceVLitho
     Planet.Steps.nTotal = Planet.Steps.nHydro + Planet.Steps.nSil + Planet.Steps.nCore
-    # Read in columnar data that follows header lines -- full-body
-    Planet.P_MPa, Planet.T_K, Planet.r_m, Planet.phase, Planet.rho_kgm3, Planet.Cp_JkgK, Planet.alpha_pK, \
-    Planet.g_ms2, Planet.phi_frac, Planet.sigma_Sm, Planet.kTherm_WmK, Planet.Seismic.VP_kms, Planet.Seismic.VS_kms,\
-    Planet.Seismic.QS, Planet.Seismic.KS_GPa, Planet.Seismic.GS_GPa, Planet.Ppore_MPa, Planet.rhoMatrix_kgm3, \
-    Planet.rhoPore_kgm3, Planet.MLayer_kg, Planet.VLayer_m3, Planet.Htidal_Wm3, Planet.eta_Pas \
-        = np.loadtxt(Params.DataFiles.saveFile, skiprows=Params.nHeadLines, unpack=True)
     Planet.r_m = np.concatenate((Planet.r_m, [0]))
     Planet.z_m = Planet.Bulk.R_m - Planet.r_m
     Planet.phase = Planet.phase.astype(np.int_)
@@ -639,10 +726,6 @@ def ReloadProfile(Planet, Params, fnameOverride=None):
     if np.sum(Planet.phase == 0) < 10:
         Planet.THIN_OCEAN = True
 
-    # Read in data for core/mantle trade
-    Planet.Sil.Rtrade_m, Planet.Core.Rtrade_m, Planet.Sil.rhoTrade_kgm3, \
-        = np.loadtxt(Params.DataFiles.mantCoreFile, skiprows=1, unpack=True)
-
     return Planet, Params
 
 
@@ -1355,13 +1438,12 @@ def GridPlanetProfileFunc(FuncName, PlanetGrid, Params):
     if Params.DO_PARALLEL:
         # Prevent slowdowns from competing process spawning when #cores > #jobs
         nCores = np.min([Params.maxCores, np.prod(np.shape(PlanetList1D)), Params.threadLimit])
-        pool = mtpContext.Pool(nCores)
+        pool, SESSION = GetPool(nCores)
         parResult = [pool.apply_async(FuncName, (deepcopy(Planet), deepcopy(Params))) for Planet in PlanetList1D]
-        pool.close()
-        pool.join()
 
         for i, result in enumerate(parResult):
             PlanetList1D[i] = result.get()[0]
+        ReleasePool(pool, SESSION)
     else:
         log.profile('Running grid without parallel processing. This may take some time.')
         PlanetList1D = np.array([FuncName(deepcopy(Planet), deepcopy(Params)) for Planet in PlanetList1D])[:, 0]
@@ -1371,9 +1453,10 @@ def GridPlanetProfileFunc(FuncName, PlanetGrid, Params):
     return PlanetGrid
 
 
-def ExploreOgram(bodyname, Params, RETURN_GRID=False, Magnetic=None):
+def ExploreOgram(bodyname, Params, RETURN_GRID=False, Magnetic=None, fields=None):
     """ Run PlanetProfile models over a variety of settings to get interior
-        properties for each input.
+        properties for each input. If reloading, only the datasets listed in
+        fields are read (all if None).
     """
     if Params.CALC_NEW:
         log.info(f'Running {Params.Explore.xName} x {Params.Explore.yName} explore-o-gram for {bodyname}.')
@@ -1417,8 +1500,20 @@ def ExploreOgram(bodyname, Params, RETURN_GRID=False, Magnetic=None):
         Params.NO_SAVEFILE = True
         Params.ALLOW_BROKEN_MODELS = True
 
+        TMELT_LOOKUP = Params.Explore.CONVECT_LOOKUP and not (Planet.Do.NO_H2O or Planet.Do.NO_ICE_CONVECTION)
+        if TMELT_LOOKUP:
+            LoadTmeltTable()
+
         tMarks = np.append(tMarks, time.time())
-        PlanetGrid = ParPlanetExplore(Planet, Params, xList, yList)
+        try:
+            with PoolSession(Params):
+                PlanetGrid = ParPlanetExplore(Planet, Params, xList, yList)
+        finally:
+            # Only explore-o-gram models use the lookup table
+            if TMELT_LOOKUP:
+                UnloadTmeltTable()
+            if Params.REUSE_ICE_SHELLS:
+                UnloadIceShells()
         tMarks = np.append(tMarks, time.time())
         dt = tMarks[-1] - tMarks[-2]
         log.info(f'Parallel run elapsed time: {dt:.1f} s.')
@@ -1489,7 +1584,7 @@ def ExploreOgram(bodyname, Params, RETURN_GRID=False, Magnetic=None):
         WriteExploreOgram(Exploration, Params)
     else:
         log.info(f'Reloading explore-o-gram for {bodyname}.')
-        Exploration, Params = ReloadExploreOgram(bodyname, Params)
+        Exploration, Params = ReloadExploreOgram(bodyname, Params, fields=fields)
         PlanetGrid = None
         if RETURN_GRID:
             log.warning(f'Reloaded ExploreOgram and RETURN_GRID is True. No PlanetGrid is available, None will be returned.')
@@ -1596,78 +1691,49 @@ def AssignPlanetVal(Planet, name, val):
 
 
 def WriteExploreOgram(Exploration, Params, INVERSION=False):
-    """ Organize Exploration results from an explore-o-gram run into a dict
-        and print to a .mat file.
+    """ Save Exploration results from an explore-o-gram run to an HDF5 file, with
+        one chunked, compressed dataset per output field and the run parameters as
+        file attributes. Inversion Amp and phase are saved as one group each, with one
+        dataset per spacecraft.
     """
 
-    saveDict = {
-        'bodyname': Exploration.bodyname,
-        'NO_H2O': Exploration.NO_H2O,
-        'CMR2str': Exploration.CMR2str,
-        'Cmeasured': Exploration.Cmeasured,
-        'Cupper': Exploration.Cupper,
-        'Clower': Exploration.Clower,
-        'xName': Exploration.xName,
-        'yName': Exploration.yName,
-        'wOcean_ppt': Exploration.wOcean_ppt,
-        'oceanComp': Exploration.oceanComp,
-        'R_m': Exploration.R_m,
-        'Tb_K': Exploration.Tb_K,
-        'xFeS': Exploration.xFeS,
-        'rhoSilInput_kgm3': Exploration.rhoSilInput_kgm3,
-        'silPhi_frac': Exploration.silPhi_frac,
-        'icePhi_frac': Exploration.icePhi_frac,
-        'silPclosure_MPa': Exploration.silPclosure_MPa,
-        'icePclosure_MPa': Exploration.icePclosure_MPa,
-        'ionosTop_km': Exploration.ionosTop_km,
-        'sigmaIonos_Sm': Exploration.sigmaIonos_Sm,
-        'Htidal_Wm3': Exploration.Htidal_Wm3,
-        'Qrad_Wkg': Exploration.Qrad_Wkg,
-        'rhoSilMean_kgm3': Exploration.rhoSilMean_kgm3,
-        'rhoCoreMean_kgm3': Exploration.rhoCoreMean_kgm3,
-        'sigmaMean_Sm': Exploration.sigmaMean_Sm,
-        'sigmaTop_Sm': Exploration.sigmaTop_Sm,
-        'Tmean_K': Exploration.Tmean_K,
-        'D_km': Exploration.D_km,
-        'zb_km': Exploration.zb_km,
-        'zSeafloor_km': Exploration.zSeafloor_km,
-        'dzIceI_km': Exploration.dzIceI_km,
-        'dzClath_km': Exploration.dzClath_km,
-        'dzIceIII_km': Exploration.dzIceIII_km,
-        'dzIceIIIund_km': Exploration.dzIceIIIund_km,
-        'dzIceV_km': Exploration.dzIceV_km,
-        'dzIceVund_km': Exploration.dzIceVund_km,
-        'dzIceVI_km': Exploration.dzIceVI_km,
-        'dzWetHPs_km': Exploration.dzWetHPs_km,
-        'eLid_km': Exploration.eLid_km,
-        'Rcore_km': Exploration.Rcore_km,
-        'silPhiCalc_frac': Exploration.silPhiCalc_frac,
-        'Pseafloor_MPa': Exploration.Pseafloor_MPa,
-        'phiSeafloor_frac': Exploration.phiSeafloor_frac,
-        'CMR2calc': Exploration.CMR2calc,
-        'VALID': Exploration.VALID,
-        'invalidReason': Exploration.invalidReason
-    }
-
     if INVERSION:
-        saveDict['Amp'] = Exploration.Amp
-        saveDict['phase'] = Exploration.phase
-        saveDict['RMSe'] = Exploration.RMSe
-        saveDict['chiSquared'] = Exploration.chiSquared
-        saveDict['stdDev'] = Exploration.stdDev
-        saveDict['Rsquared'] = Exploration.Rsquared
         fName = Params.DataFiles.invertOgramFile
+        fields = exploreFields + invertFields
     else:
         fName = Params.DataFiles.exploreOgramFile
-
-    savemat(fName, saveDict)
+        fields = exploreFields
+
+    tmpFname = f'{fName}.tmp'
+    with h5py.File(tmpFname, 'w') as f:
+        for name in exploreAttrs:
+            f.attrs[name] = getattr(Exploration, name)
+        for name in fields:
+            values = np.asarray(getattr(Exploration, name))
+            if name in invertScFields and values.dtype.kind == 'O':
+                # Write one group per field, with one (nx, ny, nExc) dataset per spacecraft
+                group = f.create_group(name)
+                for scName in values.flat[0].keys():
+                    scValues = np.array([[np.asarray(cell[scName], dtype=np.float64) for cell in line]
+                                         for line in values])
+                    group.create_dataset(scName, data=scValues)
+                continue
+            if values.dtype.kind == 'U':
+                values = np.char.encode(values, 'utf-8')
+            if np.ndim(values) > 0 and np.size(values) > 0:
+                f.create_dataset(name, data=values, chunks=True, compression='lzf', shuffle=True)
+            else:
+                f.create_dataset(name, data=values)
+    os.replace(tmpFname, fName)
     log.info(f'Saved explore-o-gram {fName} to disk.')
 
     return
 
 
-def ReloadExploreOgram(bodyname, Params, fNameOverride=None, INVERSION=False):
-    """ Reload a previously run explore-o-gram from disk.
+def ReloadExploreOgram(bodyname, Params, fNameOverride=None, INVERSION=False, fields=None):
+    """ Reload a previously run explore-o-gram from disk. Run parameters are always
+        loaded; pass a list of Exploration attribute names as fields to read only those
+        datasets from the file, e.g. for plotting.
     """
 
     if fNameOverride is None:
@@ -1685,69 +1751,50 @@ def ReloadExploreOgram(bodyname, Params, fNameOverride=None, INVERSION=False):
             fName = Params.DataFiles.invertOgramFile
         else:
             fName = Params.DataFiles.exploreOgramFile
-        reload = loadmat(fName)
     else:
-        reload = loadmat(fNameOverride)
-
-    Exploration = ExplorationResults
-    Exploration.bodyname = reload['bodyname'][0]
-    Exploration.NO_H2O = reload['NO_H2O'][0]
-    Exploration.CMR2str = reload['CMR2str'][0]
-    Exploration.Cmeasured = reload['Cmeasured'][0]
-    Exploration.Cupper = reload['Cupper'][0]
-    Exploration.Clower = reload['Clower'][0]
-    Exploration.xName = reload['xName'][0]
-    Exploration.yName = reload['yName'][0]
-    Exploration.wOcean_ppt = reload['wOcean_ppt']
-    Exploration.oceanComp = reload['oceanComp']
-    Exploration.R_m = reload['R_m']
-    Exploration.Tb_K = reload['Tb_K']
-    Exploration.xFeS = reload['xFeS']
-    Exploration.rhoSilInput_kgm3 = reload['rhoSilInput_kgm3']
-    Exploration.silPhi_frac = reload['silPhi_frac']
-    Exploration.icePhi_frac = reload['icePhi_frac']
-    Exploration.silPclosure_MPa = reload['silPclosure_MPa']
-    Exploration.icePclosure_MPa = reload['icePclosure_MPa']
-    Exploration.ionosTop_km = reload['ionosTop_km']
-    Exploration.sigmaIonos_Sm = reload['sigmaIonos_Sm']
-    Exploration.Htidal_Wm3 = reload['Htidal_Wm3']
-    Exploration.Qrad_Wkg = reload['Qrad_Wkg']
-    Exploration.rhoSilMean_kgm3 = reload['rhoSilMean_kgm3']
-    Exploration.rhoCoreMean_kgm3 = reload['rhoCoreMean_kgm3']
-    Exploration.sigmaMean_Sm = reload['sigmaMean_Sm']
-    Exploration.sigmaTop_Sm = reload['sigmaTop_Sm']
-    Exploration.Tmean_K = reload['Tmean_K']
-    Exploration.D_km = reload['D_km']
-    Exploration.zb_km = reload['zb_km']
-    Exploration.zSeafloor_km = reload['zSeafloor_km']
-    Exploration.dzIceI_km = reload['dzIceI_km']
-    Exploration.dzClath_km = reload['dzClath_km']
-    Exploration.dzIceIII_km = reload['dzIceIII_km']
-    Exploration.dzIceIIIund_km = reload['dzIceIIIund_km']
-    Exploration.dzIceV_km = reload['dzIceV_km']
-    Exploration.dzIceVund_km = reload['dzIceVund_km']
-    Exploration.dzIceVI_km = reload['dzIceVI_km']
-    Exploration.dzWetHPs_km = reload['dzWetHPs_km']
-    Exploration.eLid_km = reload['eLid_km']
-    Exploration.Rcore_km = reload['Rcore_km']
-    Exploration.Pseafloor_MPa = reload['Pseafloor_MPa']
-    Exploration.phiSeafloor_frac = reload['phiSeafloor_frac']
-    Exploration.silPhiCalc_frac = reload['silPhiCalc_frac']
-    Exploration.CMR2calc = reload['CMR2calc']
-    Exploration.VALID = reload['VALID']
-    Exploration.invalidReason = reload['invalidReason']
-    
-    if INVERSION:
-        Exploration.Amp = reload['Amp']
-        Exploration.phase = reload['phase']
-        Exploration.RMSe = reload['RMSe']
-        Exploration.chiSquared = reload['chiSquared']
-        Exploration.stdDev = reload['stdDev']
-        Exploration.Rsquared = reload['Rsquared']
+        fName = fNameOverride
+
+    if fields is None:
+        fields = exploreFields
+        if INVERSION:
+            fields = fields + invertFields
+
+    Exploration = ExplorationStruct()
+    with h5py.File(fName, 'r') as f:
+        for name in exploreAttrs:
+            value = f.attrs[name]
+            if isinstance(value, np.generic):
+                value = value.item()
+            setattr(Exploration, name, value)
+        for name in dict.fromkeys(fields):
+            if name not in f:
+                raise ValueError(f'Field "{name}" not found in explore-o-gram file {fName}.')
+            if isinstance(f[name], h5py.Group):
+                # Rebuild the per-cell dicts of excitation values keyed by spacecraft name
+                scValues = {scName: f[name][scName][()] for scName in f[name].keys()}
+                nx, ny = np.shape(next(iter(scValues.values())))[:2]
+                values = np.empty((nx, ny), dtype=object)
+                for i in range(nx):
+                    for j in range(ny):
+                        values[i, j] = {scName: scVals[i, j] for scName, scVals in scValues.items()}
+                setattr(Exploration, name, values)
+                continue
+            values = f[name][()]
+            if isinstance(values, np.ndarray) and values.dtype.kind == 'S':
+                values = np.char.decode(values, 'utf-8')
+            setattr(Exploration, name, values)
 
     return Exploration, Params
 
 
+def ExplorePlotFields(Params):
+    """ Get the names of Exploration datasets needed to make explore-o-gram plots,
+        so that reloading for plotting only reads those fields from disk.
+    """
+    return [Params.Explore.xName, Params.Explore.yName, 'VALID'] \
+        + list(np.atleast_1d(Params.Explore.zName)) + exploreDsigmaFields
+
+
 def LoadPPfiles(Params, fNames, bodyname=''):
     """ Loads the settings in bodyname/fName.py to run or reload a specific model
         or models.
@@ -8,7 +8,7 @@ from scipy.interpolate import interp1d
 from PlanetProfile.GetConfig import Color, Style, FigLbl, FigSize, FigMisc
 from PlanetProfile.Plotting.PTPlots import PlotHydroPhase, PlotPvThydro, PlotPvTPerpleX
 from PlanetProfile.Thermodynamics.RefProfiles.RefProfiles import CalcRefProfiles, ReloadRefProfiles
-from PlanetProfile.Utilities.Indexing import GetPhaseIndices, PhaseConv
+from PlanetProfile.Utilities.Indexing import GetPlanetPhaseIndices, PhaseConv
 from PlanetProfile.Utilities.defineStructs import Constants
 
 # Assign logger
@@ -256,7 +256,7 @@ def PlotHydrosphereProps(PlanetList, Params):
 
             if DO_SIGS or DO_SOUNDS:
                 indsLiq, indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund, indsV, indsVund, indsVI, indsVIund, \
-                indsClath, indsClathWet, _, indsSilLiq, _, _, _, _, _, _ = GetPhaseIndices(Planet.phase)
+                indsClath, indsClathWet, _, indsSilLiq, _, _, _, _, _, _ = GetPlanetPhaseIndices(Planet)
 
                 indsIce = np.sort(np.concatenate((indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund,
                                                   indsV, indsVund, indsVI, indsVIund, indsClath, indsClathWet)))
@@ -8,6 +8,7 @@ from matplotlib import patches
 from PlanetProfile import _healpixSphere
 from PlanetProfile.GetConfig import Color, Style, FigLbl, FigSize, FigMisc
 from PlanetProfile.TrajecAnalysis.MagneticFields import BiTrajecSingle
+from PlanetProfile.Utilities.PoolManager import PoolSession
 from PlanetProfile.TrajecAnalysis.FlybyEvents import GetFlybyCA
 from PlanetProfile.TrajecAnalysis.SpiceFuncs import parentGM, spiceCode, spiceSCname, BodyVel_kms
 from PlanetProfile.Utilities.defineStructs import xyzComps, Constants
@@ -350,8 +351,11 @@ def PlotTrajecs(Params, modelData, FlybyCA):
 def PlotMagCA(PlanetList, Params, scName):
 
     FlybyCA = GetFlybyCA()
-    for Planet in PlanetList:
-        Bx, By, Bz = BiTrajecSingle(Planet, Params, scName, np.fromiter(FlybyCA[scName].etCA[Planet.bodyname].values(), dtype=np.float_))
+    # Evaluate fields for all models with the same worker pool
+    with PoolSession(Params):
+        BxyzList = [BiTrajecSingle(Planet, Params, scName, np.fromiter(FlybyCA[scName].etCA[Planet.bodyname].values(), dtype=np.float_))
+                    for Planet in PlanetList]
+    for Planet, (Bx, By, Bz) in zip(PlanetList, BxyzList):
         # Sum over all excitation periods
         Bx = np.sum(Bx, axis=0)
         By = np.sum(By, axis=0)
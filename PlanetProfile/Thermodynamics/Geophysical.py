@@ -2,6 +2,7 @@ import numpy as np
 import logging
 from PlanetProfile.Thermodynamics.HydroEOS import GetIceEOS
 from PlanetProfile.Utilities.Indexing import PhaseConv
+from PlanetProfile.Utilities.Tracing import LogLayers
 from PlanetProfile.Thermodynamics.ThermalProfiles.ThermalProfiles import ConductiveTemperature
 from PlanetProfile.Utilities.defineStructs import Constants, EOSlist
 
@@ -53,26 +54,20 @@ def PorosityCorrectionVacIce(Planet, Params, iStart, iEnd, EOS, P_MPa, T_K):
     # low enough to be below our modeling threshold
     Planet.rho_kgm3[iStart:iEnd][iSolid] = Planet.rhoMatrix_kgm3[iStart:iEnd][iSolid]
     # Correct each quantity according to J rules (see Thermodynamics.InnerEOS)
-    Planet.rho_kgm3[iStart:iEnd][iEval] = EOS.fn_porosCorrect(
-        Planet.rhoMatrix_kgm3[iStart:iEnd][iEval], 0,
-        Planet.phi_frac[iStart:iEnd][iEval], Planet.Ocean.Jrho)
-    Planet.Cp_JkgK[iStart:iEnd][iEval] = EOS.fn_porosCorrect(
-        Planet.Cp_JkgK[iStart:iEnd][iEval] * Planet.rhoMatrix_kgm3[iStart:iEnd][iEval], 0,
-        Planet.phi_frac[iStart:iEnd][iEval], Planet.Ocean.JCp) / Planet.rho_kgm3[iStart:iEnd][iEval]
-    Planet.alpha_pK[iStart:iEnd][iEval] = EOS.fn_porosCorrect(
-        Planet.alpha_pK[iStart:iEnd][iEval], 0,
-        Planet.phi_frac[iStart:iEnd][iEval], Planet.Ocean.Jalpha)
-    Planet.kTherm_WmK[iStart:iEnd][iEval] = EOS.fn_porosCorrect(
-        Planet.kTherm_WmK[iStart:iEnd][iEval], 0,
-        Planet.phi_frac[iStart:iEnd][iEval], Planet.Ocean.JkTherm)
+    Planet.rho_kgm3[iStart:iEnd][iEval], Planet.Cp_JkgK[iStart:iEnd][iEval], Planet.alpha_pK[iStart:iEnd][iEval], \
+        Planet.kTherm_WmK[iStart:iEnd][iEval] = PorousIceMix(Planet, EOS, Planet.phi_frac[iStart:iEnd][iEval],
+            Planet.rhoMatrix_kgm3[iStart:iEnd][iEval], Planet.Cp_JkgK[iStart:iEnd][iEval],
+            Planet.alpha_pK[iStart:iEnd][iEval], Planet.kTherm_WmK[iStart:iEnd][iEval])
 
     return Planet
 
 
-def PorosityCorrectionFilledIce(Planet, Params, iStart, iEnd, EOS, EOSpore):
+def PorosityCorrectionFilledIce(Planet, Params, iStart, iEnd, EOS, EOSpore, rtol=1e-12):
     """ Correct ice layer properties retrieved with EvalLayerProperties according
         to the porosity of the material. This function assumes pores contain
-        ocean fluids.
+        ocean fluids. Pore pressures depend on the porosity of overlying layers, so
+        they are found together with the porosity by fixed-point iteration over the
+        whole layer range, using the existing layer depths and gravity.
 
         Args:
             iStart, iEnd (int): Layer array indices to start and end the calculations.
@@ -81,60 +76,232 @@ def PorosityCorrectionFilledIce(Planet, Params, iStart, iEnd, EOS, EOSpore):
                 containing functions for the listed layer properties to be calculated,
                 including fn_phi_frac.
             EOSpore (EOSStruct): Ocean EOS to evaluate for pore material.
+            rtol = 1e-12 (float): Relative tolerance on pore pressures for ending the iteration.
         Assigns Planet attributes:
             Ppore_MPa, phi_frac, rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK
         Returns:
             phasePore
     """
 
-    alphaPeff = Planet.Ocean.alphaPeff[EOS.phaseStr]
-    DeltaPpore_MPa = 0.0
+    alphaPeff = Planet.Ocean.alphaPeff[PhaseConv(EOS.phaseID)]
+    # Pores contain only liquid; see PropagateAdiabaticPorousFilledIce
+    phasePore = np.zeros(iEnd - iStart, dtype=np.int_)
     if iStart == 0:
-        # Record last entry in Ppore, and set it as needed to ensure
-        # Ppore[i-1] reference will work correctly in loop
-        PporeSave = Planet.Ppore_MPa[-1] + 0.0
-        Planet.Ppore_MPa[-1] = Planet.P_MPa[0] + 0.0
-    elif Planet.Ppore_MPa[iStart-1] == 0:
-        # Make sure Ppore[i-1] has been assigned, and set it so Ppore[iStart] = P_MPa[iStart],
-        # because we are at the top of a porous layer, above which is liquid or vacuum
-        Planet.Ppore_MPa[iStart-1] = Planet.P_MPa[iStart] + 0.0
-
-    for i in range(iStart, iEnd):
-        Planet.Ppore_MPa[i] = Planet.Ppore_MPa[i-1] + DeltaPpore_MPa
-        Peff_MPa = Planet.P_MPa[i] - alphaPeff * Planet.Ppore_MPa[i]
-        Planet.phi_frac[i] = EOS.fn_phi_frac(Peff_MPa, Planet.T_K[i])
-        if Planet.phi_frac[i] >= Planet.Ocean.phiMin_frac:
-            # In ices, assume pores are filled only with liquid.
-            rhoPore_kgm3 =   EOSpore.fn_rho_kgm3(  Planet.Ppore_MPa[i], Planet.T_K[i])
-            CpPore_JkgK =    EOSpore.fn_Cp_JkgK(   Planet.Ppore_MPa[i], Planet.T_K[i])
-            alphaPore_pK =   EOSpore.fn_alpha_pK(  Planet.Ppore_MPa[i], Planet.T_K[i])
-            kThermPore_WmK = EOSpore.fn_kTherm_WmK(Planet.Ppore_MPa[i], Planet.T_K[i])
-
-            # Correct each quantity according to J rules (see Thermodynamics.InnerEOS)
-            Planet.rho_kgm3[i] = EOS.fn_porosCorrect(Planet.rhoMatrix_kgm3[i], rhoPore_kgm3,
-                                                       Planet.phi_frac[i], Planet.Ocean.Jrho)
-            Planet.Cp_JkgK[i] = EOS.fn_porosCorrect(Planet.Cp_JkgK[i] * Planet.rhoMatrix_kgm3[i], CpPore_JkgK * rhoPore_kgm3,
-                                                       Planet.phi_frac[i], Planet.Ocean.JCp) / Planet.rho_kgm3[i]
-            Planet.alpha_pK[i] = EOS.fn_porosCorrect(Planet.alpha_pK[i], alphaPore_pK,
-                                                       Planet.phi_frac[i], Planet.Ocean.Jalpha)
-            Planet.kTherm_WmK[i] = EOS.fn_porosCorrect(Planet.kTherm_WmK[i], kThermPore_WmK,
-                                                       Planet.phi_frac[i], Planet.Ocean.JkTherm)
-            # Get approximate pore pressure change, using the previous depth change. This value
-            # should be close to the correct value -- we do it this way to avoid array indexing
-            # issues at the start/end points and the need to calculate the depth change twice
-            DeltaPpore_MPa = 1e-6 * rhoPore_kgm3 * Planet.g_ms2[i] * (Planet.z_m[i] - Planet.z_m[i-1])
+        PporeAbove_MPa = Planet.P_MPa[0] + 0.0
+        PAbove_MPa, zAbove_m = Planet.P_MPa[0], Planet.z_m[0]
+    else:
+        if Planet.Ppore_MPa[iStart-1] == 0:
+            # We are at the top of a porous layer, above which is liquid or vacuum
+            Planet.Ppore_MPa[iStart-1] = Planet.P_MPa[iStart] + 0.0
+        PporeAbove_MPa = Planet.Ppore_MPa[iStart-1]
+        PAbove_MPa, zAbove_m = Planet.P_MPa[iStart-1], Planet.z_m[iStart-1]
+    P_MPa = Planet.P_MPa[iStart:iEnd]
+    dP_MPa = np.diff(np.concatenate(([PAbove_MPa], P_MPa)))
+    dz_m = np.diff(np.concatenate(([zAbove_m], Planet.z_m[iStart:iEnd])))
+    matrixProps = (Planet.rhoMatrix_kgm3[iStart:iEnd], Planet.Cp_JkgK[iStart:iEnd],
+                   Planet.alpha_pK[iStart:iEnd], Planet.kTherm_WmK[iStart:iEnd])
+
+    # Start from pore pressures with no porosity anywhere
+    Ppore_MPa = P_MPa + 0.0
+    for _ in range(iEnd - iStart + 1):
+        phi_frac, rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK, rhoPore_kgm3, iFilled \
+            = PorousIceMixRange(Planet, EOS, P_MPa - alphaPeff * Ppore_MPa, Planet.T_K[iStart:iEnd],
+                                *matrixProps, EOSpore=EOSpore, Ppore_MPa=Ppore_MPa)
+        DeltaPpore_MPa = np.where(iFilled, 1e-6 * rhoPore_kgm3 * Planet.g_ms2[iStart:iEnd] * dz_m, dP_MPa)
+        PporeNew_MPa = GetPorePressure(P_MPa, PporeAbove_MPa, DeltaPpore_MPa, iFilled)
+        CONVERGED = np.allclose(PporeNew_MPa, Ppore_MPa, rtol=rtol, atol=0, equal_nan=True)
+        Ppore_MPa = PporeNew_MPa
+        if CONVERGED:
+            break
+
+    Planet.Ppore_MPa[iStart:iEnd] = Ppore_MPa
+    Planet.phi_frac[iStart:iEnd] = phi_frac
+    Planet.rho_kgm3[iStart:iEnd] = rho_kgm3
+    Planet.Cp_JkgK[iStart:iEnd] = Cp_JkgK
+    Planet.alpha_pK[iStart:iEnd] = alpha_pK
+    Planet.kTherm_WmK[iStart:iEnd] = kTherm_WmK
+
+    return Planet, phasePore
+
+
+def PorousIceMix(Planet, EOS, phi_frac, rhoMatrix_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK,
+                 rhoPore_kgm3=0, CpPore_JkgK=0, alphaPore_pK=0, kThermPore_WmK=0):
+    """ Combine matrix and pore material properties of porous ice according to J rules
+        (see Thermodynamics.InnerEOS). Pore properties default to 0 for empty pores.
+
+        Args:
+            EOS (EOSStruct): Ice EOS for the matrix material.
+            phi_frac (float, shape N): Porosity of each layer.
+            rhoMatrix_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK (float, shape N): Matrix properties.
+            rhoPore_kgm3, ... kThermPore_WmK (float, shape N): Pore material properties.
+        Returns:
+            rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK (float, shape N): Combined properties.
+    """
+    rho_kgm3 = EOS.fn_porosCorrect(rhoMatrix_kgm3, rhoPore_kgm3, phi_frac, Planet.Ocean.Jrho)
+    Cp_JkgK = EOS.fn_porosCorrect(Cp_JkgK * rhoMatrix_kgm3, CpPore_JkgK * rhoPore_kgm3,
+                                  phi_frac, Planet.Ocean.JCp) / rho_kgm3
+    alpha_pK = EOS.fn_porosCorrect(alpha_pK, alphaPore_pK, phi_frac, Planet.Ocean.Jalpha)
+    kTherm_WmK = EOS.fn_porosCorrect(kTherm_WmK, kThermPore_WmK, phi_frac, Planet.Ocean.JkTherm)
+
+    return rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK
+
+
+def PorousIceMixRange(Planet, EOS, Peff_MPa, T_K, rhoMatrix_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK,
+                      EOSpore=None, Ppore_MPa=None):
+    """ Get porosity and combined properties of a range of porous ice layers from their
+        matrix properties. Porosity below Ocean.phiMin_frac is set to zero and ignored.
+
+        Args:
+            Peff_MPa, T_K (float, shape N): Effective pressure for pore closure and temperature.
+            rhoMatrix_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK (float, shape N): Matrix properties.
+            EOSpore = None (EOSStruct): Ocean EOS for pore fluids. If None, pores are empty.
+            Ppore_MPa = None (float, shape N): Pore pressure, required if EOSpore is set.
+        Returns:
+            phi_frac, rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK, rhoPore_kgm3 (float, shape N):
+                Porosity, combined properties, and pore fluid density (0 where not porous).
+            iFilled (bool, shape N): Whether porosity is modeled in each layer.
+    """
+    phi_frac = EOS.fn_phi_frac(Peff_MPa, T_K)
+    # Only model porosity if above some threshold amount, to save on computation when
+    # the porosity is negligible. This also takes care of negative porosity values
+    # that can happen from our RectBivariateSpline implementation.
+    iFilled = phi_frac >= Planet.Ocean.phiMin_frac
+    phi_frac[~iFilled] = 0.0
+    rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK = rhoMatrix_kgm3 + 0.0, Cp_JkgK + 0.0, alpha_pK + 0.0, kTherm_WmK + 0.0
+    rhoPore_kgm3 = np.zeros_like(phi_frac)
+    if np.any(iFilled):
+        if EOSpore is None:
+            poreProps = ()
         else:
-            Planet.phi_frac[i] = 0.0
-            Planet.rho_kgm3[i] = Planet.rhoMatrix_kgm3[i] + 0.0
-            Planet.Ppore_MPa[i] = Planet.P_MPa[i] + 0.0
-            DeltaPpore_MPa = Planet.P_MPa[i] - Planet.P_MPa[i-1]
+            # In ices, assume pores are filled only with liquid. Find liquid physical properties
+            PporeEval_MPa, TEval_K = Ppore_MPa[iFilled], T_K[iFilled]
+            rhoPore_kgm3[iFilled] = EOSpore.fn_rho_kgm3(PporeEval_MPa, TEval_K)
+            poreProps = (rhoPore_kgm3[iFilled], EOSpore.fn_Cp_JkgK(PporeEval_MPa, TEval_K),
+                         EOSpore.fn_alpha_pK(PporeEval_MPa, TEval_K), EOSpore.fn_kTherm_WmK(PporeEval_MPa, TEval_K))
+        rho_kgm3[iFilled], Cp_JkgK[iFilled], alpha_pK[iFilled], kTherm_WmK[iFilled] \
+            = PorousIceMix(Planet, EOS, phi_frac[iFilled], rhoMatrix_kgm3[iFilled], Cp_JkgK[iFilled],
+                           alpha_pK[iFilled], kTherm_WmK[iFilled], *poreProps)
 
-    # Restore final Ppore entry if it was beyond those affected by the loop,
-    # because we used it as the -1 index to start the loop
-    if iStart == 0 and iEnd < np.size(Planet.Ppore_MPa):
-        Planet.Ppore_MPa[-1] = PporeSave
+    return phi_frac, rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK, rhoPore_kgm3, iFilled
 
-    return Planet, phasePore
+
+def GetPorePressure(P_MPa, PporeAbove_MPa, DeltaPpore_MPa, iFilled):
+    """ Propagate pore pressure through a range of layers, assuming pore connectivity.
+        Pore pressure increases by DeltaPpore_MPa from each layer to the next, starting
+        from PporeAbove_MPa in the first layer, and is reset to the overburden pressure in
+        layers without modeled porosity.
+
+        Args:
+            P_MPa (float, shape N): Overburden pressure of each layer.
+            PporeAbove_MPa (float): Pore pressure in the first layer.
+            DeltaPpore_MPa (float, shape N): Pore pressure increase from each layer to the next.
+            iFilled (bool, shape N): Whether porosity is modeled in each layer.
+        Returns:
+            Ppore_MPa (float, shape N): Pore pressure of each layer.
+    """
+    nLayers = np.size(P_MPa)
+    PporeSum_MPa = np.cumsum(np.concatenate(([PporeAbove_MPa], DeltaPpore_MPa[:-1])))
+    # Find the last layer above each one where pore pressure was reset (-1 if none)
+    iReset = np.maximum.accumulate(np.where(iFilled, -1, np.arange(nLayers)))
+    iReset = np.concatenate(([-1], iReset[:-1]))
+    RESET = iReset >= 0
+    Ppore_MPa = PporeSum_MPa + 0.0
+    Ppore_MPa[RESET] = P_MPa[iReset[RESET]] + PporeSum_MPa[RESET] - PporeSum_MPa[iReset[RESET]]
+
+    return np.where(iFilled, Ppore_MPa, P_MPa)
+
+
+def HydroGeometry(Planet, iStart, iEnd, rhoAbove_kgm3, gAbove_ms2, MAbove_kg, gBase_ms2):
+    """ Integrate the depths, radii, masses, and gravity of layers iStart to iEnd from the
+        layer pressures as cumulative sums, starting from the values for layer iStart-1.
+        Each layer is propagated using the density and gravity of the layer above it.
+
+        Args:
+            iStart, iEnd (int): Layer array indices of the first layer to evaluate and the
+                end of the range.
+            rhoAbove_kgm3, gAbove_ms2 (float, shape iEnd-iStart): Density and gravity of the
+                layer above each layer, i.e. for layers iStart-1 to iEnd-1.
+            MAbove_kg (float): Mass above layer iStart-1.
+            gBase_ms2 (float, shape iEnd-iStart): Gravity assigned before integrating: constant
+                gravity values for Do.CONSTANT_GRAVITY, otherwise zero.
+        Returns:
+            z_m, r_m, g_ms2 (float, shape iEnd-iStart): Depth, radius, and gravity for
+                layers iStart to iEnd-1.
+            MLayer_kg (float, shape iEnd-iStart): Masses of layers iStart-1 to iEnd-2.
+    """
+    dP_Pa = (Planet.P_MPa[iStart:iEnd] - Planet.P_MPa[iStart-1:iEnd-1]) * 1e6
+    # Increment depth based on change in pressure, combined with gravity and density
+    z_m = np.cumsum(np.concatenate(([Planet.z_m[iStart-1]], dP_Pa / gAbove_ms2 / rhoAbove_kgm3)))[1:]
+    # Convert depth to radius
+    r_m = Planet.Bulk.R_m - z_m
+    # Calculate masses of the overlying layers
+    MLayer_kg = 4/3*np.pi * rhoAbove_kgm3 * (np.concatenate(([Planet.r_m[iStart-1]], r_m[:-1]))**3 - r_m**3)
+    MBelow_kg = Planet.Bulk.M_kg - np.cumsum(np.concatenate(([MAbove_kg], MLayer_kg)))[1:]
+    # Use remaining mass below in Gauss's law for gravity to get g at the top of each layer
+    g_ms2 = gBase_ms2 + int(not Planet.Do.CONSTANT_GRAVITY) * Constants.G * MBelow_kg / r_m**2
+
+    return z_m, r_m, g_ms2, MLayer_kg
+
+
+def HydroGravityBase(Planet, iStart, MAbove_kg):
+    """ Assign gravity for layers from iStart downward before integrating with HydroGeometry:
+        the constant value from the mass below layer iStart-1 for Do.CONSTANT_GRAVITY,
+        otherwise zero.
+
+        Args:
+            iStart (int): Layer array index of the first layer to evaluate.
+            MAbove_kg (float): Mass above layer iStart-1.
+        Assigns Planet attributes:
+            g_ms2
+    """
+    if Planet.Do.CONSTANT_GRAVITY:
+        Planet.g_ms2[iStart:] = Constants.G * (Planet.Bulk.M_kg - MAbove_kg) / Planet.r_m[iStart-1]**2
+    else:
+        # Ensure g values to be assigned are zero since we will be adding to them
+        Planet.g_ms2[iStart:] = 0
+
+    return Planet
+
+
+def PropagateHydroGeometry(Planet, iStart, iEnd, rhoAbove_kgm3, MAbove_kg=None):
+    """ Integrate depths, radii, masses, and gravity for hydrosphere layers iStart to iEnd
+        with densities that are already known. With constant gravity, layer thicknesses do
+        not depend on the layers above, so all layers are evaluated at once with HydroGeometry.
+        Otherwise, each layer thickness depends on the gravity at the layer above, so we step
+        down one layer at a time.
+
+        Args:
+            iStart, iEnd (int): Layer array indices of the first layer to evaluate and the
+                end of the range.
+            rhoAbove_kgm3 (float, shape iEnd-iStart): Densities of layers iStart-1 to iEnd-2.
+            MAbove_kg = None (float): Mass above layer iStart-1. If None, the sum of layer
+                masses above iStart-1 is used.
+        Assigns Planet attributes:
+            z_m, r_m, MLayer_kg, g_ms2
+    """
+    if MAbove_kg is None:
+        MAbove_kg = np.sum(Planet.MLayer_kg[:iStart-1])
+    Planet = HydroGravityBase(Planet, iStart, MAbove_kg)
+    if iEnd <= iStart:
+        return Planet
+
+    if Planet.Do.CONSTANT_GRAVITY:
+        gBase_ms2 = Planet.g_ms2[iStart:iEnd] + 0.0
+        gAbove_ms2 = np.concatenate(([Planet.g_ms2[iStart-1]], gBase_ms2[:-1]))
+        Planet.z_m[iStart:iEnd], Planet.r_m[iStart:iEnd], Planet.g_ms2[iStart:iEnd], \
+            Planet.MLayer_kg[iStart-1:iEnd-1] = HydroGeometry(Planet, iStart, iEnd, rhoAbove_kgm3, gAbove_ms2,
+                                                              MAbove_kg, gBase_ms2)
+    else:
+        for i in range(iStart, iEnd):
+            # Increment depth based on change in pressure, combined with gravity and density
+            Planet.z_m[i] = Planet.z_m[i-1] + (Planet.P_MPa[i] - Planet.P_MPa[i-1]) * 1e6 / Planet.g_ms2[i-1] / \
+                            rhoAbove_kgm3[i-iStart]
+            Planet.r_m[i] = Planet.Bulk.R_m - Planet.z_m[i]
+            Planet.MLayer_kg[i-1] = 4/3*np.pi * rhoAbove_kgm3[i-iStart] * (Planet.r_m[i-1]**3 - Planet.r_m[i]**3)
+            MAbove_kg += Planet.MLayer_kg[i-1]
+            Planet.g_ms2[i] = Constants.G * (Planet.Bulk.M_kg - MAbove_kg) / Planet.r_m[i]**2
+
+    return Planet
 
 
 def PropagateConduction(Planet, Params, iStart, iEnd):
@@ -152,31 +319,13 @@ def PropagateConduction(Planet, Params, iStart, iEnd):
     # Add a catch in case we call with invalid indices, which is convenient
     # after convection calculations when no convection is happening
     if iStart < iEnd:
-        thisMAbove_kg = np.sum(Planet.MLayer_kg[:iStart])
-        # Get constant gravity if we will be assigning it
-        if Planet.Do.CONSTANT_GRAVITY:
-            Planet.g_ms2[iStart+1:] = Constants.G * (Planet.Bulk.M_kg - thisMAbove_kg) / Planet.r_m[iStart]**2
-        else:
-            # Ensure g values to be assigned are zero since we will be adding to them
-            Planet.g_ms2[iStart+1:] = 0
-        # Assign 0 or 1 multiplier for constant/variable gravity calcs in loop
-        VAR_GRAV = int(not Planet.Do.CONSTANT_GRAVITY)
-
-        for i in range(iStart+1, iEnd+1):
-            # Increment depth based on change in pressure, combined with gravity and density
-            Planet.z_m[i] = Planet.z_m[i-1] + (Planet.P_MPa[i] - Planet.P_MPa[i-1]) * 1e6 / Planet.g_ms2[i-1] / \
-                            Planet.rho_kgm3[i-1]
-            Planet.r_m[i] = Planet.Bulk.R_m - Planet.z_m[i]
-            Planet.MLayer_kg[i-1] = 4/3*np.pi * Planet.rho_kgm3[i-1] * (Planet.r_m[i-1] ** 3 - Planet.r_m[i] ** 3)
-            thisMAbove_kg += Planet.MLayer_kg[i-1]
-            thisMBelow_kg = Planet.Bulk.M_kg - thisMAbove_kg
-            Planet.g_ms2[i] += VAR_GRAV * Constants.G * thisMBelow_kg / Planet.r_m[i]**2
-            log.debug(f'il: {i:d}; P_MPa: {Planet.P_MPa[i]:.3f}; T_K: {Planet.T_K[i]:.3f}; phase: {Planet.phase[i]:d}')
+        Planet = PropagateHydroGeometry(Planet, iStart+1, iEnd+1, Planet.rho_kgm3[iStart:iEnd])
+        LogLayers(Params, iStart+1, iEnd+1, Planet.P_MPa, Planet.T_K, Planet.phase)
 
     return Planet
 
 
-def PropagateAdiabaticSolid(Planet, Params, iStart, iEnd, EOS):
+def PropagateAdiabaticSolid(Planet, Params, iStart, iEnd, EOS, rtol=1e-12):
     """ Use layer-top values and assumption of an adiabatic thermal profile
         to evaluate the conditions at the bottom of each layer in the specified
         zone (iStart to iEnd). This function assumes no porosity.
@@ -186,46 +335,63 @@ def PropagateAdiabaticSolid(Planet, Params, iStart, iEnd, EOS):
                 layer and the end of the conductive profile (e.g. material transition),
                 respectively.
             EOS (EOSStruct): Ice, ocean, sil, or core EOS to query for layer properties.
+            rtol = 1e-12 (float): Relative tolerance on layer temperatures, densities, and
+                gravity for ending the iteration.
         Assigns Planet attributes:
             z_m, r_m, MLayer_kg, g_ms2, rhoMatrix_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK,
             rho_kgm3
     """
 
-    thisMAbove_kg = np.sum(Planet.MLayer_kg[:iStart-1])
-    # Get constant gravity if we will be assigning it
-    if Planet.Do.CONSTANT_GRAVITY:
-        Planet.g_ms2[iStart:] = Constants.G * (Planet.Bulk.M_kg - thisMAbove_kg) / Planet.r_m[iStart-1]**2
-    else:
-        # Ensure g values to be assigned are zero since we will be adding to them
-        Planet.g_ms2[iStart:] = 0
-    # Assign 0 or 1 multiplier for constant/variable gravity calcs in loop
-    VAR_GRAV = int(not Planet.Do.CONSTANT_GRAVITY)
-
-    for i in range(iStart, iEnd):
-        # Increment depth based on change in pressure, combined with gravity and density
-        Planet.z_m[i] = Planet.z_m[i-1] + (Planet.P_MPa[i] - Planet.P_MPa[i-1]) * 1e6 / Planet.g_ms2[i-1] / \
-                        Planet.rhoMatrix_kgm3[i-1]
-        # Convert depth to radius
-        Planet.r_m[i] = Planet.Bulk.R_m - Planet.z_m[i]
-        # Calculate layer mass
-        Planet.MLayer_kg[i-1] = 4/3*np.pi * Planet.rhoMatrix_kgm3[i-1] * (Planet.r_m[i-1] ** 3 - Planet.r_m[i] ** 3)
-        thisMAbove_kg += Planet.MLayer_kg[i-1]
-        thisMBelow_kg = Planet.Bulk.M_kg - thisMAbove_kg
-        # Use remaining mass below in Gauss's law for gravity to get g at the top of this layer
-        Planet.g_ms2[i] += VAR_GRAV * Constants.G * thisMBelow_kg / Planet.r_m[i] ** 2
-
+    MAbove_kg = np.sum(Planet.MLayer_kg[:iStart-1])
+    # Get constant gravity if we will be assigning it, or else zero for the variable gravity calcs
+    Planet = HydroGravityBase(Planet, iStart, MAbove_kg)
+    if iEnd <= iStart:
+        return Planet
+    gBase_ms2 = Planet.g_ms2[iStart:iEnd] + 0.0
+    P_MPa = Planet.P_MPa[iStart:iEnd]
+    dP_Pa = (P_MPa - Planet.P_MPa[iStart-1:iEnd-1]) * 1e6
+
+    # Each layer depends on the properties of the one above it, so we use the same implicit
+    # predictor as PropagateAdiabaticPorousIce: overlying layer properties throughout at first,
+    # then integrate and evaluate the EOS for all layers until the profile stops changing
+    nLayers = iEnd - iStart
+    T_K, rhoMatrix_kgm3, Cp_JkgK, alpha_pK, g_ms2 = (np.full(nLayers, layerArray[iStart-1]) for layerArray in
+        [Planet.T_K, Planet.rhoMatrix_kgm3, Planet.Cp_JkgK, Planet.alpha_pK, Planet.g_ms2])
+    for nIter in range(1, nLayers + 2):
+        # Properties of the overlying layer for each layer
+        rhoAbove_kgm3, CpAbove_JkgK, alphaAbove_pK, gAbove_ms2 = \
+            (np.concatenate(([layerArray[iStart-1]], thisProp[:-1])) for layerArray, thisProp in
+             [(Planet.rhoMatrix_kgm3, rhoMatrix_kgm3), (Planet.Cp_JkgK, Cp_JkgK), (Planet.alpha_pK, alpha_pK),
+              (Planet.g_ms2, g_ms2)])
+        z_m, r_m, gNew_ms2, MLayer_kg = HydroGeometry(Planet, iStart, iEnd, rhoAbove_kgm3, gAbove_ms2,
+                                                      MAbove_kg, gBase_ms2)
         # Propagate adiabatic thermal profile
-        Planet.T_K[i] = Planet.T_K[i-1] + Planet.T_K[i-1] * Planet.alpha_pK[i-1] / \
-                        Planet.Cp_JkgK[i-1] / Planet.rhoMatrix_kgm3[i-1] * (Planet.P_MPa[i] - Planet.P_MPa[i-1]) * 1e6
-        # Now use P and T for this layer to get physical properties
-        Planet.rhoMatrix_kgm3[i] = EOS.fn_rho_kgm3(  Planet.P_MPa[i], Planet.T_K[i])
-        Planet.Cp_JkgK[i] =        EOS.fn_Cp_JkgK(   Planet.P_MPa[i], Planet.T_K[i])
-        Planet.alpha_pK[i] =       EOS.fn_alpha_pK(  Planet.P_MPa[i], Planet.T_K[i])
-        Planet.kTherm_WmK[i] =     EOS.fn_kTherm_WmK(Planet.P_MPa[i], Planet.T_K[i])
-
-        log.debug(f'il: {i:d}; P_MPa: {Planet.P_MPa[i]:.3f}; T_K: {Planet.T_K[i]:.3f}; phase: {Planet.phase[i]:d}')
-
-    Planet.rho_kgm3[iStart:iEnd] = Planet.rhoMatrix_kgm3[iStart:iEnd] + 0.0
+        TNew_K = Planet.T_K[iStart-1] * np.cumprod(1 + alphaAbove_pK / CpAbove_JkgK / rhoAbove_kgm3 * dP_Pa)
+        # Now use P and T for each layer to get physical properties
+        rhoNew_kgm3 = EOS.fn_rho_kgm3(P_MPa, TNew_K)
+        Cp_JkgK = EOS.fn_Cp_JkgK(P_MPa, TNew_K)
+        alpha_pK = EOS.fn_alpha_pK(P_MPa, TNew_K)
+
+        CONVERGED = np.allclose(TNew_K, T_K, rtol=rtol, atol=0, equal_nan=True) \
+                    and np.allclose(rhoNew_kgm3, rhoMatrix_kgm3, rtol=rtol, atol=0, equal_nan=True) \
+                    and np.allclose(gNew_ms2, g_ms2, rtol=rtol, atol=0, equal_nan=True)
+        T_K, rhoMatrix_kgm3, g_ms2 = TNew_K, rhoNew_kgm3, gNew_ms2
+        if CONVERGED:
+            break
+    log.debug(f'Adiabatic profile for layers {iStart:d} to {iEnd:d} converged after {nIter:d} iterations.')
+
+    Planet.z_m[iStart:iEnd] = z_m
+    Planet.r_m[iStart:iEnd] = r_m
+    Planet.MLayer_kg[iStart-1:iEnd-1] = MLayer_kg
+    Planet.g_ms2[iStart:iEnd] = g_ms2
+    Planet.T_K[iStart:iEnd] = T_K
+    Planet.rhoMatrix_kgm3[iStart:iEnd] = rhoMatrix_kgm3
+    Planet.Cp_JkgK[iStart:iEnd] = Cp_JkgK
+    Planet.alpha_pK[iStart:iEnd] = alpha_pK
+    Planet.kTherm_WmK[iStart:iEnd] = EOS.fn_kTherm_WmK(P_MPa, T_K)
+    Planet.rho_kgm3[iStart:iEnd] = rhoMatrix_kgm3 + 0.0
+
+    LogLayers(Params, iStart, iEnd, Planet.P_MPa, Planet.T_K, Planet.phase)
 
     return Planet
 
@@ -245,58 +411,7 @@ def PropagateAdiabaticPorousVacIce(Planet, Params, iStart, iEnd, EOS):
             phi_frac, rho_kgm3
     """
 
-    if iStart == 0:
-        raise RuntimeError('Adiabatic calculations rely on overlying layer properties to begin recursion.')
-
-    thisMAbove_kg = np.sum(Planet.MLayer_kg[:iStart-1])
-    # Get constant gravity if we will be assigning it
-    if Planet.Do.CONSTANT_GRAVITY:
-        Planet.g_ms2[iStart:] = Constants.G * (Planet.Bulk.M_kg - thisMAbove_kg) / Planet.r_m[iStart-1]**2
-    else:
-        # Ensure g values to be assigned are zero since we will be adding to them
-        Planet.g_ms2[iStart:] = 0
-    # Assign 0 or 1 multiplier for constant/variable gravity calcs in loop
-    VAR_GRAV = int(not Planet.Do.CONSTANT_GRAVITY)
-
-    for i in range(iStart, iEnd):
-        # Increment depth based on change in pressure, combined with gravity and density
-        Planet.z_m[i] = Planet.z_m[i-1] + (Planet.P_MPa[i] - Planet.P_MPa[i-1])*1e6 / Planet.g_ms2[i-1] / Planet.rho_kgm3[i-1]
-        # Convert depth to radius
-        Planet.r_m[i] = Planet.Bulk.R_m - Planet.z_m[i]
-        # Calculate layer mass
-        Planet.MLayer_kg[i-1] = 4/3*np.pi * Planet.rho_kgm3[i-1] * (Planet.r_m[i-1]**3 - Planet.r_m[i]**3)
-        thisMAbove_kg += Planet.MLayer_kg[i-1]
-        thisMBelow_kg = Planet.Bulk.M_kg - thisMAbove_kg
-        # Use remaining mass below in Gauss's law for gravity to get g at the top of this layer
-        Planet.g_ms2[i] += VAR_GRAV * Constants.G * thisMBelow_kg / Planet.r_m[i]**2
-
-        # Propagate adiabatic thermal profile
-        Planet.T_K[i] = Planet.T_K[i-1] + Planet.T_K[i-1] * Planet.alpha_pK[i-1] / \
-                        Planet.Cp_JkgK[i-1] / Planet.rho_kgm3[i-1] * (Planet.P_MPa[i] - Planet.P_MPa[i-1])*1e6
-        # Now use P and T for this layer to get physical properties
-        Planet.rhoMatrix_kgm3[i] = EOS.fn_rho_kgm3(  Planet.P_MPa[i], Planet.T_K[i])
-        Planet.Cp_JkgK[i] =        EOS.fn_Cp_JkgK(   Planet.P_MPa[i], Planet.T_K[i])
-        Planet.alpha_pK[i] =       EOS.fn_alpha_pK(  Planet.P_MPa[i], Planet.T_K[i])
-        Planet.kTherm_WmK[i] =     EOS.fn_kTherm_WmK(Planet.P_MPa[i], Planet.T_K[i])
-
-        # Correct for porosity in ice I layers, assuming pores are empty.
-        Planet.phi_frac[i] = EOS.fn_phi_frac(Planet.P_MPa[i], Planet.T_K[i])
-        # Only model porosity if above some threshold amount, to save on computation when
-        # the porosity is negligible.
-        if Planet.phi_frac[i] >= Planet.Ocean.phiMin_frac:
-            Planet.rho_kgm3[i] = EOS.fn_porosCorrect(Planet.rhoMatrix_kgm3[i], 0,
-                                                       Planet.phi_frac[i], Planet.Ocean.Jrho)
-            Planet.Cp_JkgK[i] = EOS.fn_porosCorrect(Planet.Cp_JkgK[i] * Planet.rhoMatrix_kgm3[i], 0,
-                                                       Planet.phi_frac[i], Planet.Ocean.JCp) / Planet.rho_kgm3[i]
-            Planet.alpha_pK[i] = EOS.fn_porosCorrect(Planet.alpha_pK[i], 0,
-                                                       Planet.phi_frac[i], Planet.Ocean.Jalpha)
-            Planet.kTherm_WmK[i] = EOS.fn_porosCorrect(Planet.kTherm_WmK[i], 0,
-                                                       Planet.phi_frac[i], Planet.Ocean.JkTherm)
-        else:
-            Planet.phi_frac[i] = 0.0
-            Planet.rho_kgm3[i] = Planet.rhoMatrix_kgm3[i] + 0.0
-
-        log.debug(f'il: {i:d}; P_MPa: {Planet.P_MPa[i]:.3f}; T_K: {Planet.T_K[i]:.3f}; phase: {Planet.phase[i]:d}')
+    Planet, _ = PropagateAdiabaticPorousIce(Planet, Params, iStart, iEnd, EOS)
 
     return Planet
 
@@ -320,101 +435,120 @@ def PropagateAdiabaticPorousFilledIce(Planet, Params, iStart, iEnd, EOS, EOSpore
             phasePore
     """
 
-    # Get the coupling between pore pressure and effective pressure (how effectively
-    # the pressure of pore materials resists their closure) for this material, so
-    # we don't have to keep evaluating it as we do here.
-    alphaPeff = Planet.Ocean.alphaPeff[EOS.phaseStr]
+    return PropagateAdiabaticPorousIce(Planet, Params, iStart, iEnd, EOS, EOSpore=EOSpore)
 
-    # Assign phasePore all zeros. Since we assume pores contain liquid, we won't
-    # change any of these values. This is for forward compatibility, in case the
-    # assumption of pores containing ocean fluid is relaxed.
-    phasePore = np.zeros(iEnd - iStart, dtype=np.int_)
-    # Initialize DeltaPpore at 0 so we can use it to set the top pore pressure
-    # equal to the pressure of the overlying material. In this, we're assuming
-    # iStart corresponds to a layer for which there is communication between
-    # the overlying material and pore space, i.e. that overlying ocean fluids
-    # contribute the layer-top pressure for both matrix and pore materials.
-    DeltaPpore_MPa = 0.0
+
+def PropagateAdiabaticPorousIce(Planet, Params, iStart, iEnd, EOS, EOSpore=None, rtol=1e-12):
+    """ Propagate an adiabatic thermal profile through porous ice layers iStart to iEnd,
+        evaluating whole layer ranges at once. Each layer depends on the properties of
+        the one above it, so we use an implicit predictor: the properties of the overlying
+        layer are first assumed throughout, then the depths, gravity, temperatures, and pore
+        pressures are integrated from the current properties as cumulative sums and products
+        and all EOSs are evaluated for the new profile, until the profile stops changing.
+        The result is the same as for stepping down one layer at a time, to within rtol,
+        and layers are always exact after (iEnd - iStart) iterations.
+
+        Args:
+            iStart, iEnd (int): Layer array indices corresponding to the last evaluated
+                layer and the end of the conductive profile (e.g. material transition),
+                respectively.
+            EOS (EOSStruct): Ice EOS to query for layer properties.
+            EOSpore = None (EOSStruct): Ocean EOS to query for pore material properties.
+                If None, pores are assumed to be empty.
+            rtol = 1e-12 (float): Relative tolerance on layer temperatures, densities, and pore
+                pressures for ending the iteration.
+        Assigns Planet attributes:
+            z_m, r_m, MLayer_kg, g_ms2, rhoMatrix_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK,
+            phi_frac, rho_kgm3, Ppore_MPa (if EOSpore is set)
+        Returns:
+            phasePore (int, shape iEnd-iStart): Phase of pore material, all zeros since we
+                assume pores contain liquid. This is for forward compatibility, in case the
+                assumption of pores containing ocean fluid is relaxed.
+    """
 
     if iStart == 0:
         raise RuntimeError('Adiabatic calculations rely on overlying layer properties to begin recursion.')
-    # Initialize overlying mass
-    thisMAbove_kg = np.sum(Planet.MLayer_kg[:iStart-1])
-    # Ensure the top-layer pore pressure will be incremented up to the matching overburden pressure
-    Planet.Ppore_MPa[iStart-1] = Planet.P_MPa[iStart] + 0.0
 
-    # Get constant gravity if we will be assigning it
-    if Planet.Do.CONSTANT_GRAVITY:
-        Planet.g_ms2[iStart:] = Constants.G * (Planet.Bulk.M_kg - thisMAbove_kg) / Planet.r_m[iStart-1]**2
-    else:
-        # Ensure g values to be assigned are zero since we will be adding to them
-        Planet.g_ms2[iStart:] = 0
-    # Assign 0 or 1 multiplier for constant/variable gravity calcs in loop
-    VAR_GRAV = int(not Planet.Do.CONSTANT_GRAVITY)
-
-    # Begin adiabatic profile propagation
-    for i in range(iStart, iEnd):
-        # Increment depth based on change in pressure, combined with gravity and density
-        Planet.z_m[i] = Planet.z_m[i-1] + (Planet.P_MPa[i] - Planet.P_MPa[i-1])*1e6 / Planet.g_ms2[i-1] / Planet.rho_kgm3[i-1]
-        # Convert depth to radius
-        Planet.r_m[i] = Planet.Bulk.R_m - Planet.z_m[i]
-        # Calculate layer mass
-        Planet.MLayer_kg[i-1] = 4/3*np.pi * Planet.rho_kgm3[i-1] * (Planet.r_m[i-1]**3 - Planet.r_m[i]**3)
-        thisMAbove_kg += Planet.MLayer_kg[i-1]
-        thisMBelow_kg = Planet.Bulk.M_kg - thisMAbove_kg
-        # Use remaining mass below in Gauss's law for gravity to get g at the top of this layer
-        Planet.g_ms2[i] += VAR_GRAV * Constants.G * thisMBelow_kg / Planet.r_m[i]**2
+    FILLED = EOSpore is not None
+    phasePore = np.zeros(iEnd - iStart, dtype=np.int_)
+    if iEnd <= iStart:
+        return Planet, phasePore
 
+    # Get the coupling between pore pressure and effective pressure (how effectively
+    # the pressure of pore materials resists their closure) for this material
+    alphaPeff = Planet.Ocean.alphaPeff[PhaseConv(EOS.phaseID)] if FILLED else 0
+    # Initialize overlying mass
+    MAbove_kg = np.sum(Planet.MLayer_kg[:iStart-1])
+    # Get constant gravity if we will be assigning it, or else zero for the variable gravity calcs
+    Planet = HydroGravityBase(Planet, iStart, MAbove_kg)
+    gBase_ms2 = Planet.g_ms2[iStart:iEnd] + 0.0
+
+    P_MPa = Planet.P_MPa[iStart:iEnd]
+    dP_MPa = P_MPa - Planet.P_MPa[iStart-1:iEnd-1]
+    dP_Pa = dP_MPa * 1e6
+    # The top-layer pore pressure matches the overburden pressure, as we assume iStart
+    # corresponds to a layer for which there is communication between the overlying
+    # material and pore space
+    PporeTop_MPa = P_MPa[0] + 0.0
+
+    # Predictor: overlying layer properties throughout, with no porosity
+    nLayers = iEnd - iStart
+    T_K, rho_kgm3, Cp_JkgK, alpha_pK, g_ms2 = (np.full(nLayers, layerArray[iStart-1]) for layerArray in
+        [Planet.T_K, Planet.rho_kgm3, Planet.Cp_JkgK, Planet.alpha_pK, Planet.g_ms2])
+    rhoPore_kgm3, iFilled = np.zeros(nLayers), np.zeros(nLayers, dtype=bool)
+    Ppore_MPa = P_MPa + 0.0
+    for nIter in range(1, nLayers + 2):
+        # Properties of the overlying layer for each layer
+        rhoAbove_kgm3, CpAbove_JkgK, alphaAbove_pK, gAbove_ms2 = \
+            (np.concatenate(([layerArray[iStart-1]], thisProp[:-1])) for layerArray, thisProp in
+             [(Planet.rho_kgm3, rho_kgm3), (Planet.Cp_JkgK, Cp_JkgK), (Planet.alpha_pK, alpha_pK),
+              (Planet.g_ms2, g_ms2)])
+        z_m, r_m, gNew_ms2, MLayer_kg = HydroGeometry(Planet, iStart, iEnd, rhoAbove_kgm3, gAbove_ms2,
+                                                      MAbove_kg, gBase_ms2)
         # Propagate adiabatic thermal profile
-        Planet.T_K[i] = Planet.T_K[i-1] + Planet.T_K[i-1] * Planet.alpha_pK[i-1] / \
-                        Planet.Cp_JkgK[i-1] / Planet.rho_kgm3[i-1] * (Planet.P_MPa[i] - Planet.P_MPa[i-1])*1e6
-        # Now use P and T for this layer to get physical properties
-        Planet.rhoMatrix_kgm3[i] = EOS.fn_rho_kgm3(  Planet.P_MPa[i], Planet.T_K[i])
-        Planet.Cp_JkgK[i] =        EOS.fn_Cp_JkgK(   Planet.P_MPa[i], Planet.T_K[i])
-        Planet.alpha_pK[i] =       EOS.fn_alpha_pK(  Planet.P_MPa[i], Planet.T_K[i])
-        Planet.kTherm_WmK[i] =     EOS.fn_kTherm_WmK(Planet.P_MPa[i], Planet.T_K[i])
-
-        # Correct for porosity in ice I layers
-        # First, increment pore pressure based on hydrostatic pressure from
-        # overlying pore material, assuming pore connectivity.
-        Planet.Ppore_MPa[i] = Planet.Ppore_MPa[i-1] + DeltaPpore_MPa
-        # Next, use pore pressure coupling constant (alpha) to find effective
-        # pore closure pressure
-        Peff_MPa = Planet.P_MPa[i] - alphaPeff * Planet.Ppore_MPa[i]
-        # Use Peff to find porosity (alpha = 0 for Do.P_EFFECTIVE = False)
-        Planet.phi_frac[i] = EOS.fn_phi_frac(Peff_MPa, Planet.T_K[i])
-
-        # Only model porosity if above some threshold amount, to save on computation when
-        # the porosity is negligible.
-        if Planet.phi_frac[i] >= Planet.Ocean.phiMin_frac:
-            # In ices, assume pores are filled only with liquid. Find liquid physical properties
-            rhoPore_kgm3 =   EOSpore.fn_rho_kgm3(  Planet.Ppore_MPa[i], Planet.T_K[i])
-            CpPore_JkgK =    EOSpore.fn_Cp_JkgK(   Planet.Ppore_MPa[i], Planet.T_K[i])
-            alphaPore_pK =   EOSpore.fn_alpha_pK(  Planet.Ppore_MPa[i], Planet.T_K[i])
-            kThermPore_WmK = EOSpore.fn_kTherm_WmK(Planet.Ppore_MPa[i], Planet.T_K[i])
-
-            # Combine them with matrix physical properties
-            Planet.rho_kgm3[i] = EOS.fn_porosCorrect(Planet.rhoMatrix_kgm3[i], rhoPore_kgm3,
-                                                       Planet.phi_frac[i], Planet.Ocean.Jrho)
-            Planet.Cp_JkgK[i] = EOS.fn_porosCorrect(Planet.Cp_JkgK[i] * Planet.rhoMatrix_kgm3[i], CpPore_JkgK * rhoPore_kgm3,
-                                                       Planet.phi_frac[i], Planet.Ocean.JCp) / Planet.rho_kgm3[i]
-            Planet.alpha_pK[i] = EOS.fn_porosCorrect(Planet.alpha_pK[i], alphaPore_pK,
-                                                       Planet.phi_frac[i], Planet.Ocean.Jalpha)
-            Planet.kTherm_WmK[i] = EOS.fn_porosCorrect(Planet.kTherm_WmK[i], kThermPore_WmK,
-                                                       Planet.phi_frac[i], Planet.Ocean.JkTherm)
-            # Get approximate pore pressure change, using the previous depth change. This value
-            # should be close to the correct value -- we do it this way to avoid array indexing
-            # issues at the start/end points and the need to calculate the depth change twice
-            DeltaPpore_MPa = 1e-6 * rhoPore_kgm3 * Planet.g_ms2[i] * (Planet.z_m[i] - Planet.z_m[i-1])
+        TNew_K = Planet.T_K[iStart-1] * np.cumprod(1 + alphaAbove_pK / CpAbove_JkgK / rhoAbove_kgm3 * dP_Pa)
+        # Now use P and T for each layer to get physical properties
+        rhoMatrix_kgm3 = EOS.fn_rho_kgm3(P_MPa, TNew_K)
+        matrixProps = (rhoMatrix_kgm3, EOS.fn_Cp_JkgK(P_MPa, TNew_K), EOS.fn_alpha_pK(P_MPa, TNew_K),
+                       EOS.fn_kTherm_WmK(P_MPa, TNew_K))
+        if FILLED:
+            # Increment pore pressure based on hydrostatic pressure from overlying pore material.
+            # Layers without modeled porosity reset it to the overburden pressure.
+            dz_m = np.diff(np.concatenate(([Planet.z_m[iStart-1]], z_m)))
+            DeltaPpore_MPa = np.where(iFilled, 1e-6 * rhoPore_kgm3 * gNew_ms2 * dz_m, dP_MPa)
+            PporeNew_MPa = GetPorePressure(P_MPa, PporeTop_MPa, DeltaPpore_MPa, iFilled)
         else:
-            # Zero out porosity and ignore it if it's below threshold (this also takes care of
-            # negative porosity values that can happen from our RectBivariateSpline implementation).
-            Planet.phi_frac[i] = 0.0
-            Planet.rho_kgm3[i] = Planet.rhoMatrix_kgm3[i] + 0.0
-            Planet.Ppore_MPa[i] = Planet.P_MPa[i] + 0.0
-            DeltaPpore_MPa = Planet.P_MPa[i] - Planet.P_MPa[i-1]
-
-        log.debug(f'il: {i:d}; P_MPa: {Planet.P_MPa[i]:.3f}; T_K: {Planet.T_K[i]:.3f}; phase: {Planet.phase[i]:d}')
+            PporeNew_MPa = Ppore_MPa
+        # Use Peff to find porosity (alpha = 0 for empty pores or Do.P_EFFECTIVE = False)
+        phi_frac, rhoNew_kgm3, CpNew_JkgK, alpha_pK, kTherm_WmK, rhoPore_kgm3, iFilled \
+            = PorousIceMixRange(Planet, EOS, P_MPa - alphaPeff * PporeNew_MPa, TNew_K, *matrixProps,
+                                EOSpore=EOSpore, Ppore_MPa=PporeNew_MPa)
+
+        CONVERGED = np.allclose(TNew_K, T_K, rtol=rtol, atol=0, equal_nan=True) \
+                    and np.allclose(rhoNew_kgm3, rho_kgm3, rtol=rtol, atol=0, equal_nan=True) \
+                    and np.allclose(gNew_ms2, g_ms2, rtol=rtol, atol=0, equal_nan=True) \
+                    and np.allclose(PporeNew_MPa, Ppore_MPa, rtol=rtol, atol=0, equal_nan=True)
+        T_K, rho_kgm3, Cp_JkgK, g_ms2, Ppore_MPa = TNew_K, rhoNew_kgm3, CpNew_JkgK, gNew_ms2, PporeNew_MPa
+        if CONVERGED:
+            break
+    log.debug(f'Adiabatic profile for layers {iStart:d} to {iEnd:d} converged after {nIter:d} iterations.')
+
+    Planet.z_m[iStart:iEnd] = z_m
+    Planet.r_m[iStart:iEnd] = r_m
+    Planet.MLayer_kg[iStart-1:iEnd-1] = MLayer_kg
+    Planet.g_ms2[iStart:iEnd] = g_ms2
+    Planet.T_K[iStart:iEnd] = T_K
+    Planet.rhoMatrix_kgm3[iStart:iEnd] = matrixProps[0]
+    Planet.Cp_JkgK[iStart:iEnd] = Cp_JkgK
+    Planet.alpha_pK[iStart:iEnd] = alpha_pK
+    Planet.kTherm_WmK[iStart:iEnd] = kTherm_WmK
+    Planet.phi_frac[iStart:iEnd] = phi_frac
+    Planet.rho_kgm3[iStart:iEnd] = rho_kgm3
+    if FILLED:
+        Planet.Ppore_MPa[iStart-1] = PporeTop_MPa
+        Planet.Ppore_MPa[iStart:iEnd] = Ppore_MPa
+
+    LogLayers(Params, iStart, iEnd, Planet.P_MPa, Planet.T_K, Planet.phase)
 
     return Planet, phasePore
 
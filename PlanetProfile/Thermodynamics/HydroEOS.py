@@ -766,6 +766,55 @@ def GetTfreeze(oceanEOS, P_MPa, T_K, TfreezeRange_K=50, TRes_K=0.05):
     return Tfreeze_K
 
 
+def GetTfreezeBatched(oceanEOS, P_MPa, T_K, TfreezeRange_K=50, TRes_K=0.05, Ttol_K=1e-9):
+    """ Returns the melting temperature at each of an array of pressures, by bisecting on the
+        phase lookup for all pressures at once. Gives the same results as calling GetTfreeze for
+        each pressure, to within Ttol_K, but with one phase lookup call per bisection step
+        instead of one per pressure per step.
+
+        Args:
+            oceanEOS (OceanEOSStruct): Interpolator functions for evaluating the ocean EOS
+            P_MPa (float, shape N): Pressures of the fluid in MPa
+            T_K (float, shape 1 or N): Temperature of the fluid in K, below the melting temperature
+                at every P_MPa
+            TfreezeRange_K (float, shape 1 or N): Range above T_K to search for melting temperatures
+            TRes_K (float): Temperature resolution of the phase lookup. Tfreeze_K is offset by TRes_K/5,
+                as in GetTfreeze.
+            Ttol_K (float): Bracket width in K at which to stop bisection.
+        Returns:
+            Tfreeze_K (float, shape N): Temperature of nearest higher-temperature solid-liquid phase
+                transition at each pressure
+    """
+    P_MPa = np.asarray(P_MPa, dtype=np.float_)
+    Tlow_K = np.zeros_like(P_MPa) + T_K
+    Tupp_K = Tlow_K + TfreezeRange_K
+    SOLIDlow = oceanEOS.fn_phase(P_MPa, Tlow_K) > 0
+    SOLIDupp = oceanEOS.fn_phase(P_MPa, Tupp_K) > 0
+    if not np.all(SOLIDlow):
+        log.warning('Attempting to get phase change from liquid to solid, not solid to liquid as expected.')
+    noChange = SOLIDlow == SOLIDupp
+    if np.any(noChange):
+        iBad = np.where(noChange)[0][0]
+        raise ValueError(f'No melting temperature was found above {Tlow_K[iBad]:.3f} K ' +
+                         f'for ice {PhaseConv(oceanEOS.fn_phase(P_MPa[iBad], Tlow_K[iBad]))} at pressure {P_MPa[iBad]:.3f} MPa. ' +
+                          'Check to see if T_K is close to default Ocean.THydroMax_K value. ' +
+                          'If so, increase Ocean.THydroMax_K. Otherwise, increase TfreezeRange_K ' +
+                          'until a melting temperature is found.')
+
+    nSteps = int(np.ceil(np.log2(np.max(TfreezeRange_K) / Ttol_K)))
+    for _ in range(nSteps):
+        Tmid_K = (Tlow_K + Tupp_K) / 2
+        SOLIDmid = oceanEOS.fn_phase(P_MPa, Tmid_K) > 0
+        # Keep the half of each bracket that still contains a phase change
+        LOWER = SOLIDmid == SOLIDlow
+        Tlow_K = np.where(LOWER, Tmid_K, Tlow_K)
+        Tupp_K = np.where(LOWER, Tupp_K, Tmid_K)
+
+    Tfreeze_K = (Tlow_K + Tupp_K) / 2 + TRes_K/5
+
+    return Tfreeze_K
+
+
 def kThermIsobaricAnderssonInaba2005(T_K, phase):
     """ Calculate thermal conductivity of ice at a fixed pressure according to
         Andersson and Inaba (2005) as a function of temperature.
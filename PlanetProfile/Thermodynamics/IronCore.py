@@ -89,8 +89,8 @@ def IronCoreLayers(Planet, Params,
             Mtot_kg = MAbove_kg + thisMLayerCore_kg[:,-1]
             iCoreMatch[iProf] = next(ii[0] for ii,val in np.ndenumerate(Mtot_kg) if val < Planet.Bulk.M_kg)
             nSilFinal[iProf] = iCoreStart[iValid] + iCoreMatch[iProf]
-            log.debug(f'Core match for iProf = {iProf:d} with Steps.nSil = {nSilFinal[iProf]:d} ' +
-                      f'and M = {Mtot_kg[iCoreMatch[iProf]]/Planet.Bulk.M_kg:.4f} M_{Planet.name[0]}.')
+            log.debug('Core match for iProf = %d with Steps.nSil = %d and M = %.4f M_%s.',
+                      iProf, nSilFinal[iProf], Mtot_kg[iCoreMatch[iProf]]/Planet.Bulk.M_kg, Planet.name[0])
         else:
             # Number of steps in the silicate layer is fixed for the constant-density approach,
             # but we repeat one layer for the core start so stop 1 short.
@@ -3,9 +3,11 @@ import logging
 from scipy.signal import savgol_filter
 
 from PlanetProfile.Thermodynamics.IronCore import IronCoreLayers
+from PlanetProfile.Thermodynamics.Geophysical import PropagateHydroGeometry
 from PlanetProfile.Thermodynamics.HydroEOS import GetPfreeze, GetTfreeze, \
     GetIceEOS, GetOceanEOS
 from PlanetProfile.Utilities.Indexing import PhaseConv, GetPhaseIndices
+from PlanetProfile.Utilities.Tracing import TraceLayers, LogLayer
 from PlanetProfile.Thermodynamics.InnerEOS import GetHtidalFunc, GetphiCalc, GetInnerEOS
 from PlanetProfile.Thermodynamics.Silicates import SilicateLayers
 from PlanetProfile.Thermodynamics.ThermalProfiles.Convection import IceIConvectSolid, IceIConvectPorous, \
@@ -448,8 +450,9 @@ def OceanLayers(Planet, Params):
 
         # Do initial ocean step separately in order to catch potential Melosh layer--
         # see Melosh et al. (2004): https://doi.org/10.1016/j.icarus.2003.11.026
-        log.debug(f'il: {Planet.Steps.nSurfIce:d}; P_MPa: {POcean_MPa[0]:.3f}; ' +
-                  f'T_K: {TOcean_K[0]:.3f}; phase: {Planet.phase[Planet.Steps.nSurfIce]:d}')
+        TRACE = TraceLayers(Params)
+        if TRACE:
+            LogLayer(Planet.Steps.nSurfIce, POcean_MPa[0], TOcean_K[0], Planet.phase[Planet.Steps.nSurfIce])
         rhoOcean_kgm3[0] = Planet.Ocean.EOS.fn_rho_kgm3(POcean_MPa[0], TOcean_K[0])
         CpOcean_JkgK[0] = Planet.Ocean.EOS.fn_Cp_JkgK(POcean_MPa[0], TOcean_K[0])
         alphaOcean_pK[0] = Planet.Ocean.EOS.fn_alpha_pK(POcean_MPa[0], TOcean_K[0])
@@ -488,8 +491,8 @@ def OceanLayers(Planet, Params):
                     alphaOcean_pK[i] = Planet.Ocean.EOS.fn_alpha_pK(POcean_MPa[i], TOcean_K[i])
                     kThermOcean_WmK[i] = Planet.Ocean.EOS.fn_kTherm_WmK(POcean_MPa[i], TOcean_K[i])
                     Planet.phase[Planet.Steps.nSurfIce+i] = Planet.Ocean.EOS.fn_phase(POcean_MPa[i], TOcean_K[i]).astype(np.int_)
-                    log.debug(f'il: {Planet.Steps.nSurfIce+i:d}; P_MPa: {POcean_MPa[i]:.3f}; ' +
-                              f'T_K: {TOcean_K[i]:.3f}; phase: {Planet.phase[Planet.Steps.nSurfIce+i]:d}')
+                    if TRACE:
+                        LogLayer(Planet.Steps.nSurfIce+i, POcean_MPa[i], TOcean_K[i], Planet.phase[Planet.Steps.nSurfIce+i])
             iStart = i
             # Reset pressure profile to use standard pressure step below Melosh layer bottom
             POcean_MPa[i+1:] = np.linspace(POcean_MPa[i], POcean_MPa[-1], Planet.Steps.nOceanMax - i)[1:]
@@ -512,8 +515,8 @@ def OceanLayers(Planet, Params):
                 Planet.THIN_OCEAN = True
                 TOcean_K[i] = GetTfreeze(Planet.Ocean.EOS, POcean_MPa[i], TOcean_K[i]) + Planet.Ocean.TfreezeOffset_K
                 Planet.phase[Planet.Steps.nSurfIce+i] = 0
-            log.debug(f'il: {Planet.Steps.nSurfIce+i:d}; P_MPa: {POcean_MPa[i]:.3f}; ' +
-                      f'T_K: {TOcean_K[i]:.3f}; phase: {Planet.phase[Planet.Steps.nSurfIce+i]:d}')
+            if TRACE:
+                LogLayer(Planet.Steps.nSurfIce+i, POcean_MPa[i], TOcean_K[i], Planet.phase[Planet.Steps.nSurfIce+i])
             if Planet.phase[Planet.Steps.nSurfIce+i] < 2:
                 # Liquid water layers -- get fluid properties for the present layer but with the
                 # overlaying layer's temperature. Note that we include ice Ih in these layers because
@@ -575,24 +578,9 @@ def OceanLayers(Planet, Params):
             Planet.kTherm_WmK[HPphases] = savgol_filter(Planet.kTherm_WmK[HPphases], window, Planet.Ocean.smoothingPolyOrder)
 
         # Evaluate remaining physical quantities for ocean layers
-        MAbove_kg = np.sum(Planet.MLayer_kg[:Planet.Steps.nSurfIce])
-        # Get constant gravity if we will be assigning it
-        if Planet.Do.CONSTANT_GRAVITY:
-            Planet.g_ms2[Planet.Steps.nSurfIce:] = Constants.G * (Planet.Bulk.M_kg - MAbove_kg) / Planet.r_m[Planet.Steps.nSurfIce-1]**2
-        else:
-            # Ensure g values to be assigned are zero since we will be adding to them
-            Planet.g_ms2[Planet.Steps.nSurfIce:] = 0
-        # Assign 0 or 1 multiplier for constant/variable gravity calcs in loop
-        VAR_GRAV = int(not Planet.Do.CONSTANT_GRAVITY)
-
-        for i in range(Planet.Steps.nSurfIce, Planet.Steps.nSurfIce + Planet.Steps.nOceanMax):
-            Planet.z_m[i] = Planet.z_m[i-1] + (Planet.P_MPa[i] - Planet.P_MPa[i-1]) * 1e6 / Planet.g_ms2[i-1] / \
-                            Planet.rho_kgm3[i-1]
-            Planet.r_m[i] = Planet.Bulk.R_m - Planet.z_m[i]
-            Planet.MLayer_kg[i-1] = 4/3*np.pi * Planet.rho_kgm3[i-1] * (Planet.r_m[i-1]**3 - Planet.r_m[i]**3)
-            MAbove_kg += Planet.MLayer_kg[i-1]
-            MBelow_kg = Planet.Bulk.M_kg - MAbove_kg
-            Planet.g_ms2[i] += VAR_GRAV * Constants.G * MBelow_kg / Planet.r_m[i]**2
+        Planet = PropagateHydroGeometry(Planet, Planet.Steps.nSurfIce, Planet.Steps.nSurfIce + Planet.Steps.nOceanMax,
+                                        Planet.rho_kgm3[Planet.Steps.nSurfIce-1:Planet.Steps.nSurfIce + Planet.Steps.nOceanMax-1],
+                                        MAbove_kg=np.sum(Planet.MLayer_kg[:Planet.Steps.nSurfIce]))
 
         if Planet.Do.CLATHRATE:
             if Planet.Bulk.clathType == 'whole':
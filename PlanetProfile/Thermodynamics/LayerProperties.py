@@ -0,0 +1,248 @@
+import numpy as np
+import logging
+import scipy.interpolate as spi
+from PlanetProfile.Thermodynamics.HydroEOS import GetOceanEOS, GetIceEOS
+from PlanetProfile.Thermodynamics.Electrical import CalcElecPorRock
+from PlanetProfile.Thermodynamics.Seismic import CalcIceQS, CalcSeisInner
+from PlanetProfile.Thermodynamics.Viscosity import CalcViscPorRock, CalcViscSolidRock, CalcViscCore
+from PlanetProfile.Utilities.Indexing import GetPlanetPhaseIndices
+from PlanetProfile.Utilities.defineStructs import EOSlist
+
+# Assign logger
+log = logging.getLogger('PlanetProfile')
+
+def LayerPropertyCalcs(Planet, Params):
+    """ Calculate electrical conductivity, seismic properties, and viscosity for each layer
+        in one pass over the phase groups, for those enabled with Params.CALC_CONDUCT,
+        Params.CALC_SEISMIC, and Params.CALC_VISCOSITY. Each hydrosphere phase group is visited
+        only once: EOS inputs are gathered once, the ocean EOS is evaluated once per group for
+        the pore fluid, and the porosity correction is applied to all properties together.
+
+        Assigns Planet attributes:
+            sigma_Sm, eta_Pas, Seismic.VP_kms, Seismic.VS_kms, Seismic.QS, Seismic.KS_GPa,
+            Seismic.GS_GPa, Ocean.sigmaMean_Sm, Ocean.sigmaTop_Sm, Sil.sigmaPoreMean_Sm,
+            Sil.sigmaPorousLayerMean_Sm
+    """
+    # Initialize outputs as in the individual calculations
+    Planet.sigma_Sm = np.zeros(Planet.Steps.nTotal) * np.nan
+    Planet.eta_Pas = np.zeros(Planet.Steps.nTotal) * np.nan
+    Planet.Seismic.VP_kms, Planet.Seismic.VS_kms, Planet.Seismic.QS, Planet.Seismic.KS_GPa, \
+        Planet.Seismic.GS_GPa = (np.zeros(Planet.Steps.nTotal) for _ in range(5))
+
+    CONDUCT = Params.CALC_CONDUCT and Planet.Do.VALID
+    SEISMIC = Params.CALC_SEISMIC and Planet.Do.VALID
+    VISC = Params.CALC_VISCOSITY and Planet.Do.VALID
+    Planet.Sil.sigmaPoreMean_Sm = np.nan
+    Planet.Sil.sigmaPorousLayerMean_Sm = np.nan
+
+    if Planet.Do.VALID:
+        # Identify which indices correspond to which phases
+        indsLiq, indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund, indsV, indsVund, indsVI, indsVIund, \
+            indsClath, indsClathWet, indsSil, indsSilLiq, indsSilI, indsSilII, indsSilIII, indsSilV, indsSilVI, \
+            indsFe = GetPlanetPhaseIndices(Planet)
+
+        if CONDUCT or SEISMIC or VISC:
+            Planet = LoadHydroEOS(Planet, Params, indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund, indsV,
+                                  indsVund, indsVI, indsVIund, indsClath, indsClathWet, ICE=SEISMIC or VISC)
+            Planet = CalcHydroProps(Planet, Params, indsLiq, indsI, indsIwet, indsII, indsIIund, indsIII,
+                                    indsIIIund, indsV, indsVund, indsVI, indsVIund, indsClath, indsClathWet,
+                                    CONDUCT=CONDUCT, SEISMIC=SEISMIC, VISC=VISC)
+
+        if SEISMIC:
+            Planet = CalcIceQS(Planet, np.concatenate((indsI, indsIwet)), np.concatenate((indsClath, indsClathWet)),
+                               np.concatenate((indsIIund, indsII)), np.concatenate((indsIIIund, indsIII)),
+                               np.concatenate((indsVund, indsV)), np.concatenate((indsVIund, indsVI)))
+
+        if not Params.SKIP_INNER:
+            if CONDUCT:
+                if Planet.Do.POROUS_ROCK:
+                    Planet = CalcElecPorRock(Planet, Params, indsSil, indsSilLiq, indsSilI, indsSilII, indsSilIII,
+                                             indsSilV, indsSilVI)
+                else:
+                    Planet.sigma_Sm[indsSil] = Planet.Sil.sigmaSil_Sm
+                Planet.sigma_Sm[indsFe] = Planet.Core.sigmaCore_Sm
+            if SEISMIC:
+                Planet = CalcSeisInner(Planet, Params, indsSil, indsSilLiq, indsSilI, indsSilII, indsSilIII, indsSilV,
+                                       indsSilVI, indsFe)
+            if VISC:
+                if Planet.Do.POROUS_ROCK:
+                    Planet = CalcViscPorRock(Planet, Params, indsSil, indsSilLiq, indsSilI,
+                                             indsSilII, indsSilIII, indsSilV, indsSilVI)
+                else:
+                    Planet = CalcViscSolidRock(Planet, Params, indsSil)
+                if Planet.Do.Fe_CORE:
+                    Planet = CalcViscCore(Planet, Params, indsFe)
+
+        if np.size(indsLiq) != 0:
+            Planet.Ocean.sigmaMean_Sm = np.mean(Planet.sigma_Sm[indsLiq])
+            Planet.Ocean.sigmaTop_Sm = Planet.sigma_Sm[indsLiq[0]]
+        else:
+            Planet.Ocean.sigmaMean_Sm = np.nan
+            Planet.Ocean.sigmaTop_Sm = np.nan
+    else:
+        Planet.Ocean.sigmaMean_Sm = np.nan
+        Planet.Ocean.sigmaTop_Sm = np.nan
+
+    if not SEISMIC:
+        Planet.Ocean.GSmeanIIIwet_GPa = np.nan
+        Planet.Ocean.GSmeanVwet_GPa = np.nan
+        Planet.Ocean.GSmeanVI_GPa = np.nan
+        Planet.Sil.GSmean_GPa = np.nan
+        Planet.Core.GSmeanFe_GPa = np.nan
+        Planet.Core.GSmeanFeS_GPa = np.nan
+
+    if np.any(Planet.Seismic.QS > Planet.Seismic.QSmax):
+        log.debug(f'Resetting unnecessarily high QS values to max value: {Planet.Seismic.QSmax}')
+        Planet.Seismic.QS[Planet.Seismic.QS > Planet.Seismic.QSmax] = Planet.Seismic.QSmax
+
+    return Planet
+
+
+def LoadHydroEOS(Planet, Params, indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund, indsV,
+                 indsVund, indsVI, indsVIund, indsClath, indsClathWet, ICE=True):
+    """ Make sure the ocean EOS and the EOS for each ice phase present have been loaded
+        (mainly only important in parallel ExploreOgram runs).
+
+        Args:
+            ICE (bool): Whether to also check the ice EOSs, which are not needed for conductivity.
+    """
+    if not Planet.Do.NO_H2O and Planet.Ocean.EOS.key not in EOSlist.loaded.keys():
+        POcean_MPa = np.arange(Planet.PfreezeLower_MPa, Planet.Ocean.PHydroMax_MPa, Planet.Ocean.deltaP)
+        TOcean_K = np.arange(Planet.Bulk.Tb_K, Planet.Ocean.THydroMax_K, Planet.Ocean.deltaT)
+        Planet.Ocean.EOS = GetOceanEOS(Planet.Ocean.comp, Planet.Ocean.wOcean_ppt, POcean_MPa, TOcean_K,
+                                       Planet.Ocean.MgSO4elecType, rhoType=Planet.Ocean.MgSO4rhoType,
+                                       scalingType=Planet.Ocean.MgSO4scalingType, FORCE_NEW=Params.FORCE_EOS_RECALC,
+                                       phaseType=Planet.Ocean.phaseType, EXTRAP=Params.EXTRAP_OCEAN,
+                                       sigmaFixed_Sm=Planet.Ocean.sigmaFixed_Sm)
+
+    if ICE:
+        # Ice Ih and clathrates use the surface ice EOS for wet and dry layers alike
+        iceLoads = [('Ih', Planet.Ocean.surfIceEOS, np.concatenate((indsI, indsIwet)),
+                        {'ICEIh_DIFFERENT': Planet.Do.ICEIh_DIFFERENT}),
+                    ('Clath', Planet.Ocean.surfIceEOS, np.concatenate((indsClath, indsClathWet)),
+                        {'ClathDissoc': Planet.Ocean.ClathDissoc}),
+                    ('II', Planet.Ocean.surfIceEOS, indsIIund, {}), ('II', Planet.Ocean.iceEOS, indsII, {}),
+                    ('III', Planet.Ocean.surfIceEOS, indsIIIund, {}), ('III', Planet.Ocean.iceEOS, indsIII, {}),
+                    ('V', Planet.Ocean.surfIceEOS, indsVund, {}), ('V', Planet.Ocean.iceEOS, indsV, {}),
+                    ('VI', Planet.Ocean.surfIceEOS, indsVIund, {}), ('VI', Planet.Ocean.iceEOS, indsVI, {})]
+        for icePhase, EOSdict, inds, kwargs in iceLoads:
+            if np.size(inds) != 0 and EOSdict[icePhase].key not in EOSlist.loaded.keys():
+                PIce_MPa = np.linspace(Planet.P_MPa[inds][0], Planet.P_MPa[inds][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(inds), 4))
+                TIce_K = np.linspace(Planet.T_K[inds][0], Planet.T_K[inds][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(inds), 4))
+                EOSdict[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
+                                              porosType=Planet.Ocean.porosType[icePhase],
+                                              phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
+                                              Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
+                                              phiMin_frac=Planet.Ocean.phiMin_frac,
+                                              EXTRAP=Params.EXTRAP_ICE[icePhase], **kwargs)
+
+    return Planet
+
+
+def CalcHydroProps(Planet, Params, indsLiq, indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund,
+                   indsV, indsVund, indsVI, indsVIund, indsClath, indsClathWet,
+                   CONDUCT=True, SEISMIC=True, VISC=True):
+    """ Evaluate conductivity, seismic properties, and viscosity of ocean and ice layers,
+        visiting each phase group once. For porous ice, all properties of a group are
+        corrected for porosity in a single call to fn_porosCorrect, with pores containing
+        vacuum for dry (surface) groups and ocean fluid at Ppore_MPa for wet groups.
+
+        Args:
+            CONDUCT, SEISMIC, VISC (bool): Which of sigma_Sm, Seismic, and eta_Pas to evaluate.
+        Assigns Planet attributes:
+            sigma_Sm, eta_Pas, Seismic.VP_kms, Seismic.VS_kms, Seismic.KS_GPa, Seismic.GS_GPa
+    """
+    # Ocean layers
+    if np.size(indsLiq) != 0:
+        P_MPa, T_K = Planet.P_MPa[indsLiq], Planet.T_K[indsLiq]
+        if CONDUCT:
+            Planet.sigma_Sm[indsLiq] = Planet.Ocean.EOS.fn_sigma_Sm(P_MPa, T_K)
+        if SEISMIC:
+            # VS_kms and GS_GPa are zero for liquids, as initialized
+            Planet.Seismic.VP_kms[indsLiq], Planet.Seismic.KS_GPa[indsLiq] = Planet.Ocean.EOS.fn_Seismic(P_MPa, T_K)
+        if VISC:
+            Planet.eta_Pas[indsLiq] = Planet.Ocean.EOS.fn_eta_Pas(P_MPa, T_K)
+
+    # Ice layers, as (phase, EOS dict, indices, whether pores contain ocean fluid).
+    # We use the negative underplate phase IDs for dry HP ices.
+    iceGroups = [('Ih', Planet.Ocean.surfIceEOS, indsI, False),
+                 ('Clath', Planet.Ocean.surfIceEOS, indsClath, False),
+                 ('II', Planet.Ocean.surfIceEOS, indsIIund, False),
+                 ('III', Planet.Ocean.surfIceEOS, indsIIIund, False),
+                 ('V', Planet.Ocean.surfIceEOS, indsVund, False),
+                 ('VI', Planet.Ocean.surfIceEOS, indsVIund, False),
+                 ('Ih', Planet.Ocean.surfIceEOS, indsIwet, True),
+                 ('Clath', Planet.Ocean.surfIceEOS, indsClathWet, True),
+                 ('II', Planet.Ocean.iceEOS, indsII, True),
+                 ('III', Planet.Ocean.iceEOS, indsIII, True),
+                 ('V', Planet.Ocean.iceEOS, indsV, True),
+                 ('VI', Planet.Ocean.iceEOS, indsVI, True)]
+    POROUS = Planet.Do.POROUS_ICE
+    for icePhase, EOSdict, inds, WET in iceGroups:
+        nGroup = np.size(inds)
+        if nGroup == 0:
+            continue
+        iceEOS = EOSdict[icePhase]
+        P_MPa, T_K = Planet.P_MPa[inds], Planet.T_K[inds]
+        # Wet Ih and clathrate layers only appear in porous ice; conductivity and viscosity
+        # are left unset for them otherwise
+        SOLID_WET = WET and not POROUS and icePhase in ['Ih', 'Clath']
+        DO_SIGMA = CONDUCT and not SOLID_WET
+        DO_ETA = VISC and not SOLID_WET
+        if POROUS and WET:
+            Ppore_MPa = Planet.Ppore_MPa[inds]
+
+        # Gather bulk and pore properties, and exponents for the porosity correction
+        outs, propBulk, propPore, J = [], [], [], []
+        if DO_SIGMA:
+            outs.append(Planet.sigma_Sm)
+            propBulk.append(np.full(nGroup, Planet.Ocean.sigmaIce_Sm[icePhase]))
+            if POROUS and WET:
+                propPore.append(PoreFluidSigma(Planet, Planet.Ocean.EOS, inds))
+            else:
+                propPore.append(np.zeros(nGroup))
+            J.append(Planet.Ocean.Jsigma)
+        if SEISMIC:
+            outs += [Planet.Seismic.VP_kms, Planet.Seismic.VS_kms, Planet.Seismic.KS_GPa, Planet.Seismic.GS_GPa]
+            propBulk += list(iceEOS.fn_Seismic(P_MPa, T_K))
+            if POROUS and WET:
+                VPpore_kms, KSpore_GPa = Planet.Ocean.EOS.fn_Seismic(Ppore_MPa, T_K)
+            else:
+                VPpore_kms, KSpore_GPa = np.zeros(nGroup), np.zeros(nGroup)
+            propPore += [VPpore_kms, np.zeros(nGroup), KSpore_GPa, np.zeros(nGroup)]
+            J += [Planet.Ocean.JVP, Planet.Ocean.JVS, Planet.Ocean.JKS, Planet.Ocean.JGS]
+        if DO_ETA:
+            outs.append(Planet.eta_Pas)
+            propBulk.append(iceEOS.fn_eta_Pas(P_MPa, T_K))
+            if POROUS and WET:
+                propPore.append(Planet.Ocean.EOS.fn_eta_Pas(Ppore_MPa, T_K))
+            else:
+                propPore.append(np.zeros(nGroup))
+            J.append(Planet.Ocean.Jvisc)
+
+        if POROUS:
+            props = iceEOS.fn_porosCorrect(np.array(propBulk), np.array(propPore), Planet.phi_frac[inds],
+                                           np.array(J)[:, np.newaxis])
+        else:
+            props = propBulk
+        for out, prop in zip(outs, props):
+            out[inds] = prop
+
+    return Planet
+
+
+def PoreFluidSigma(Planet, poreEOS, inds):
+    """ Get conductivity of fluid in pores at Ppore_MPa, interpolating over any NaNs from
+        errors in the pore fluid conductivity calcs.
+
+        Args:
+            poreEOS (OceanEOSStruct): EOS for the pore fluid.
+            inds (int, shape N): Indices of the porous layers.
+        Returns:
+            sigmaFluid_Sm (float, shape N): Pore fluid conductivity in each layer.
+    """
+    sigmaFluid_Sm = poreEOS.fn_sigma_Sm(Planet.Ppore_MPa[inds], Planet.T_K[inds])
+    validSigs = np.logical_not(np.isnan(sigmaFluid_Sm))
+    sigmaFluid_Sm = spi.griddata(Planet.r_m[inds][validSigs], sigmaFluid_Sm[validSigs], Planet.r_m[inds])
+
+    return sigmaFluid_Sm
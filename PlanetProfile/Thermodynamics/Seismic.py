@@ -1,274 +1,82 @@
 import numpy as np
 from scipy.interpolate import interp1d
-from PlanetProfile.Thermodynamics.HydroEOS import GetIceEOS
-from PlanetProfile.Utilities.Indexing import GetPhaseIndices
 from PlanetProfile.Thermodynamics.InnerEOS import TsolidusHirschmann2000
-from PlanetProfile.Utilities.defineStructs import Constants, EOSlist
+from PlanetProfile.Utilities.defineStructs import Constants
 from PlanetProfile.Utilities.PPversion import ppVerNum
 import logging
 
 # Assign logger
 log = logging.getLogger('PlanetProfile')
 
-def SeismicCalcs(Planet, Params):
-    """ Calculation of seismic properties, including wave speeds
+def CalcIceQS(Planet, indsAllI, indsAllClath, indsAllII, indsAllIII, indsAllV, indsAllVI):
+    """ Calculate seismic quality factors of ice layers, wet and dry layers of each ice phase together.
 
+        Args:
+            indsAllI, indsAllClath, ... indsAllVI (int, shape Ni): Indices of all layers of each ice phase.
         Assigns Planet attributes:
-            Seismic.VP_kms, Seismic.VS_kms, Seismic.QS, Seismic.KS_GPa, Seismic.GS_GPa
+            Seismic.QS
     """
-    # Initialize arrays
-    Planet.Seismic.VP_kms, Planet.Seismic.VS_kms, Planet.Seismic.QS, Planet.Seismic.KS_GPa, \
-        Planet.Seismic.GS_GPa = (np.zeros(Planet.Steps.nTotal) for _ in range(5))
-
-    if Params.CALC_SEISMIC and Planet.Do.VALID:
-
-        indsLiq, indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund, indsV, indsVund, indsVI, indsVIund, \
-            indsClath, indsClathWet, indsSil, indsSilLiq, indsSilI, indsSilII, indsSilIII, indsSilV, indsSilVI, \
-            indsFe = GetPhaseIndices(Planet.phase)
-
-        # Get seismic properties of all ice layers, starting with dry phases
-        indsAllI = np.concatenate((indsI, indsIwet))
-        if np.size(indsAllI) != 0:
-            # Get ice EOS if not currently loaded
-            icePhase = 'Ih'
-            if Planet.Ocean.surfIceEOS[icePhase].key not in EOSlist.loaded.keys():
-                PIce_MPa = np.linspace(Planet.P_MPa[indsAllI][0], Planet.P_MPa[indsAllI][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsAllI), 4))
-                TIce_K = np.linspace(Planet.T_K[indsAllI][0], Planet.T_K[indsAllI][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsAllI), 4))
-                Planet.Ocean.surfIceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                              porosType=Planet.Ocean.porosType[icePhase],
-                                                              phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                              Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                              phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                              EXTRAP=Params.EXTRAP_ICE[icePhase],
-                                                              ICEIh_DIFFERENT=Planet.Do.ICEIh_DIFFERENT)
-
-            Planet.Seismic.VP_kms[indsAllI], Planet.Seismic.VS_kms[indsAllI], Planet.Seismic.KS_GPa[indsAllI], \
-            Planet.Seismic.GS_GPa[indsAllI] = Planet.Ocean.surfIceEOS['Ih'].fn_Seismic(Planet.P_MPa[indsAllI], Planet.T_K[indsAllI])
-            HiceI = Planet.Seismic.gIceI * Planet.Bulk.Tb_K
-            Planet.Seismic.QS[indsAllI] = Planet.Seismic.BIceI * np.exp(
-                Planet.Seismic.gammaIceI * HiceI / Planet.T_K[indsAllI])
-
-        indsAllClath = np.concatenate((indsClath, indsClathWet))
-        if np.size(indsAllClath) != 0:
-            # Get ice EOS if not currently loaded
-            icePhase = 'Clath'
-            if Planet.Ocean.surfIceEOS[icePhase].key not in EOSlist.loaded.keys():
-                PIce_MPa = np.linspace(Planet.P_MPa[indsAllClath][0], Planet.P_MPa[indsAllClath][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsAllClath), 4))
-                TIce_K = np.linspace(Planet.T_K[indsAllClath][0], Planet.T_K[indsAllClath][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsAllClath), 4))
-                Planet.Ocean.surfIceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                              porosType=Planet.Ocean.porosType[icePhase],
-                                                              phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                              Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                              phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                              EXTRAP=Params.EXTRAP_ICE[icePhase],
-                                                              ClathDissoc=Planet.Ocean.ClathDissoc)
-
-            Planet.Seismic.VP_kms[indsAllClath], Planet.Seismic.VS_kms[indsAllClath], \
-            Planet.Seismic.KS_GPa[indsAllClath], Planet.Seismic.GS_GPa[indsAllClath] \
-                = Planet.Ocean.surfIceEOS['Clath'].fn_Seismic(Planet.P_MPa[indsAllClath], Planet.T_K[indsAllClath])
-            Hclath = Planet.Seismic.gClath * np.max(Planet.T_K[indsAllClath])
-            Planet.Seismic.QS[indsAllClath] = Planet.Seismic.BClath * np.exp(
-                Planet.Seismic.gammaClath * Hclath / Planet.T_K[indsAllClath])
-
-        indsAllII = np.concatenate((indsIIund, indsII))
-        if np.size(indsAllII) != 0:
-            icePhase = 'II'
-            if np.size(indsIIund) != 0:
-                # Get ice EOS if not currently loaded
-                if Planet.Ocean.surfIceEOS[icePhase].key not in EOSlist.loaded.keys():
-                    PIce_MPa = np.linspace(Planet.P_MPa[indsIIund][0], Planet.P_MPa[indsIIund][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsIIund), 4))
-                    TIce_K = np.linspace(Planet.T_K[indsIIund][0], Planet.T_K[indsIIund][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsIIund), 4))
-                    Planet.Ocean.surfIceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                                  porosType=Planet.Ocean.porosType[icePhase],
-                                                                  phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                                  Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                                  phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                                  EXTRAP=Params.EXTRAP_ICE[icePhase])
-
-                Planet.Seismic.VP_kms[indsIIund], Planet.Seismic.VS_kms[indsIIund], \
-                Planet.Seismic.KS_GPa[indsIIund], Planet.Seismic.GS_GPa[indsIIund] \
-                    = Planet.Ocean.surfIceEOS['II'].fn_Seismic(Planet.P_MPa[indsIIund], Planet.T_K[indsIIund])
-            if np.size(indsII) != 0:
-                # Get ice EOS if not currently loaded
-                if Planet.Ocean.iceEOS[icePhase].key not in EOSlist.loaded.keys():
-                    PIce_MPa = np.linspace(Planet.P_MPa[indsII][0], Planet.P_MPa[indsII][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsII), 4))
-                    TIce_K = np.linspace(Planet.T_K[indsII][0], Planet.T_K[indsII][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsII), 4))
-                    Planet.Ocean.iceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                              porosType=Planet.Ocean.porosType[icePhase],
-                                                              phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                              Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                              phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                              EXTRAP=Params.EXTRAP_ICE[icePhase])
-
-                Planet.Seismic.VP_kms[indsII], Planet.Seismic.VS_kms[indsII], \
-                Planet.Seismic.KS_GPa[indsII], Planet.Seismic.GS_GPa[indsII] \
-                    = Planet.Ocean.iceEOS['II'].fn_Seismic(Planet.P_MPa[indsII], Planet.T_K[indsII])
-            HiceII = Planet.Seismic.gIceII * np.max(Planet.T_K[indsAllII])
-            Planet.Seismic.QS[indsAllII] = Planet.Seismic.BIceII * np.exp(
-                Planet.Seismic.gammaIceII * HiceII / Planet.T_K[indsAllII])
-
-        indsAllIII = np.concatenate((indsIIIund, indsIII))
-        if np.size(indsAllIII) != 0:
-            icePhase = 'III'
-            if np.size(indsIIIund) != 0:
-                # Get ice EOS if not currently loaded
-                if Planet.Ocean.surfIceEOS[icePhase].key not in EOSlist.loaded.keys():
-                    PIce_MPa = np.linspace(Planet.P_MPa[indsIIIund][0], Planet.P_MPa[indsIIIund][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsIIIund), 4))
-                    TIce_K = np.linspace(Planet.T_K[indsIIIund][0], Planet.T_K[indsIIIund][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsIIIund), 4))
-                    Planet.Ocean.surfIceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                                  porosType=Planet.Ocean.porosType[icePhase],
-                                                                  phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                                  Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                                  phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                                  EXTRAP=Params.EXTRAP_ICE[icePhase])
-
-                Planet.Seismic.VP_kms[indsIIIund], Planet.Seismic.VS_kms[indsIIIund], \
-                Planet.Seismic.KS_GPa[indsIIIund], Planet.Seismic.GS_GPa[indsIIIund] \
-                    = Planet.Ocean.surfIceEOS['III'].fn_Seismic(Planet.P_MPa[indsIIIund], Planet.T_K[indsIIIund])
-            if np.size(indsIII) != 0:
-                # Get ice EOS if not currently loaded
-                if Planet.Ocean.iceEOS[icePhase].key not in EOSlist.loaded.keys():
-                    PIce_MPa = np.linspace(Planet.P_MPa[indsIII][0], Planet.P_MPa[indsIII][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsIII), 4))
-                    TIce_K = np.linspace(Planet.T_K[indsIII][0], Planet.T_K[indsIII][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsIII), 4))
-                    Planet.Ocean.iceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                              porosType=Planet.Ocean.porosType[icePhase],
-                                                              phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                              Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                              phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                              EXTRAP=Params.EXTRAP_ICE[icePhase])
-
-                Planet.Seismic.VP_kms[indsIII], Planet.Seismic.VS_kms[indsIII], \
-                Planet.Seismic.KS_GPa[indsIII], Planet.Seismic.GS_GPa[indsIII] \
-                    = Planet.Ocean.iceEOS['III'].fn_Seismic(Planet.P_MPa[indsIII], Planet.T_K[indsIII])
-            HiceIII = Planet.Seismic.gIceIII * np.max(Planet.T_K[indsAllIII])
-            Planet.Seismic.QS[indsAllIII] = Planet.Seismic.BIceIII * np.exp(
-                Planet.Seismic.gammaIceIII * HiceIII / Planet.T_K[indsAllIII])
-
-        indsAllV = np.concatenate((indsVund, indsV))
-        if np.size(indsAllV) != 0:
-            icePhase ='V'
-            if np.size(indsVund) != 0:
-                # Get ice EOS if not currently loaded
-                if Planet.Ocean.surfIceEOS[icePhase].key not in EOSlist.loaded.keys():
-                    PIce_MPa = np.linspace(Planet.P_MPa[indsVund][0], Planet.P_MPa[indsVund][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsVund), 4))
-                    TIce_K = np.linspace(Planet.T_K[indsVund][0], Planet.T_K[indsVund][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsVund), 4))
-                    Planet.Ocean.surfIceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                                  porosType=Planet.Ocean.porosType[icePhase],
-                                                                  phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                                  Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                                  phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                                  EXTRAP=Params.EXTRAP_ICE[icePhase])
-
-                Planet.Seismic.VP_kms[indsVund], Planet.Seismic.VS_kms[indsVund], \
-                Planet.Seismic.KS_GPa[indsVund], Planet.Seismic.GS_GPa[indsVund] \
-                    = Planet.Ocean.surfIceEOS['V'].fn_Seismic(Planet.P_MPa[indsVund], Planet.T_K[indsVund])
-            if np.size(indsV) != 0:
-                # Get ice EOS if not currently loaded
-                if Planet.Ocean.iceEOS[icePhase].key not in EOSlist.loaded.keys():
-                    PIce_MPa = np.linspace(Planet.P_MPa[indsV][0], Planet.P_MPa[indsV][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsV), 4))
-                    TIce_K = np.linspace(Planet.T_K[indsV][0], Planet.T_K[indsV][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsV), 4))
-                    Planet.Ocean.iceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                              porosType=Planet.Ocean.porosType[icePhase],
-                                                              phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                              Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                              phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                              EXTRAP=Params.EXTRAP_ICE[icePhase])
-
-                Planet.Seismic.VP_kms[indsV], Planet.Seismic.VS_kms[indsV], \
-                Planet.Seismic.KS_GPa[indsV], Planet.Seismic.GS_GPa[indsV] \
-                    = Planet.Ocean.iceEOS['V'].fn_Seismic(Planet.P_MPa[indsV], Planet.T_K[indsV])
-            HiceV = Planet.Seismic.gIceV * np.max(Planet.T_K[indsAllV])
-            Planet.Seismic.QS[indsAllV] = Planet.Seismic.BIceV * np.exp(
-                Planet.Seismic.gammaIceV * HiceV / Planet.T_K[indsAllV])
-
-        indsAllVI = np.concatenate((indsVIund, indsVI))
-        if np.size(indsAllVI) != 0:
-            icePhase = 'VI'
-            if np.size(indsVIund) != 0:
-                # Get ice EOS if not currently loaded
-                if Planet.Ocean.surfIceEOS[icePhase].key not in EOSlist.loaded.keys():
-                    PIce_MPa = np.linspace(Planet.P_MPa[indsVIund][0], Planet.P_MPa[indsVIund][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsVIund), 4))
-                    TIce_K = np.linspace(Planet.T_K[indsVIund][0], Planet.T_K[indsVIund][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsVIund), 4))
-                    Planet.Ocean.surfIceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                                  porosType=Planet.Ocean.porosType[icePhase],
-                                                                  phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                                  Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                                  phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                                  EXTRAP=Params.EXTRAP_ICE[icePhase])
-
-                Planet.Seismic.VP_kms[indsVIund], Planet.Seismic.VS_kms[indsVIund], \
-                Planet.Seismic.KS_GPa[indsVIund], Planet.Seismic.GS_GPa[indsVIund] \
-                    = Planet.Ocean.surfIceEOS['VI'].fn_Seismic(Planet.P_MPa[indsVIund], Planet.T_K[indsVIund])
-            if np.size(indsVI) != 0:
-                # Get ice EOS if not currently loaded
-                if Planet.Ocean.iceEOS[icePhase].key not in EOSlist.loaded.keys():
-                    PIce_MPa = np.linspace(Planet.P_MPa[indsVI][0], Planet.P_MPa[indsVI][-1] + Planet.Ocean.deltaP * 3, np.maximum(np.size(indsVI), 4))
-                    TIce_K = np.linspace(Planet.T_K[indsVI][0], Planet.T_K[indsVI][-1] + Planet.Ocean.deltaT * 3, np.maximum(np.size(indsVI), 4))
-                    Planet.Ocean.iceEOS[icePhase] = GetIceEOS(PIce_MPa, TIce_K, icePhase,
-                                                              porosType=Planet.Ocean.porosType[icePhase],
-                                                              phiTop_frac=Planet.Ocean.phiMax_frac[icePhase],
-                                                              Pclosure_MPa=Planet.Ocean.Pclosure_MPa[icePhase],
-                                                              phiMin_frac=Planet.Ocean.phiMin_frac,
-                                                              EXTRAP=Params.EXTRAP_ICE[icePhase])
-
-                Planet.Seismic.VP_kms[indsVI], Planet.Seismic.VS_kms[indsVI], \
-                Planet.Seismic.KS_GPa[indsVI], Planet.Seismic.GS_GPa[indsVI] \
-                    = Planet.Ocean.iceEOS['VI'].fn_Seismic(Planet.P_MPa[indsVI], Planet.T_K[indsVI])
-            HiceVI = Planet.Seismic.gIceVI * np.max(Planet.T_K[indsAllVI])
-            Planet.Seismic.QS[indsAllVI] = Planet.Seismic.BIceVI * np.exp(
-                Planet.Seismic.gammaIceVI * HiceVI / Planet.T_K[indsAllVI])
-
-        if Planet.Do.POROUS_ICE:
-            Planet = CalcSeisPorIce(Planet, Params, indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund, indsV,
-                                    indsVund, indsVI, indsVIund, indsClath, indsClathWet)
-
-        # Get seismic properties of ocean layers
-        if np.size(indsLiq) != 0:
-            Planet.Seismic.VP_kms[indsLiq], Planet.Seismic.KS_GPa[indsLiq] \
-                = Planet.Ocean.EOS.fn_Seismic(Planet.P_MPa[indsLiq], Planet.T_K[indsLiq])
-            # VS_kms, QS, and GS_GPa were all initialized as zero and are all zero for these
-            # layers, so we just leave them as-is.
-
-        if not Params.SKIP_INNER:
-            # Get Cp and alpha here, because we didn't calculate them earlier since we didn't need them
-            # in calculating a conductive profile in the silicates and it would contribute extra,
-            # unnecessary computational overhead there.
-            Planet.Cp_JkgK[indsSil] = Planet.Sil.EOS.fn_Cp_JkgK(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
-            Planet.alpha_pK[indsSil] = Planet.Sil.EOS.fn_alpha_pK(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
-            # Evaluate silicate EOS for seismic properties
-            Planet.Seismic.VP_kms[indsSil] = Planet.Sil.EOS.fn_VP_kms(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
-            Planet.Seismic.VS_kms[indsSil] = Planet.Sil.EOS.fn_VS_kms(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
-            Planet.Seismic.KS_GPa[indsSil] = Planet.Sil.EOS.fn_KS_GPa(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
-            Planet.Seismic.GS_GPa[indsSil] = Planet.Sil.EOS.fn_GS_GPa(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
-            Hsil = Planet.Seismic.gSil * TsolidusHirschmann2000(Planet.P_MPa[indsSil])
-            Planet.Seismic.QS[indsSil] = Planet.Seismic.BSil * np.exp(
-                Planet.Seismic.gammaSil * Hsil / Planet.T_K[indsSil])
-
-            if Planet.Do.POROUS_ROCK:
-                Planet = CalcSeisPorRock(Planet, Params, indsSil, indsSilLiq, indsSilI, indsSilII, indsSilIII, indsSilV, indsSilVI)
-
-            if Planet.Do.Fe_CORE:
-                # Evaluate core EOS for seismic properties
-                Planet.Seismic.VP_kms[indsFe] = Planet.Core.EOS.fn_VP_kms(Planet.P_MPa[indsFe], Planet.T_K[indsFe])
-                Planet.Seismic.VS_kms[indsFe] = Planet.Core.EOS.fn_VS_kms(Planet.P_MPa[indsFe], Planet.T_K[indsFe])
-                Planet.Seismic.KS_GPa[indsFe] = Planet.Core.EOS.fn_KS_GPa(Planet.P_MPa[indsFe], Planet.T_K[indsFe])
-                Planet.Seismic.GS_GPa[indsFe] = Planet.Core.EOS.fn_GS_GPa(Planet.P_MPa[indsFe], Planet.T_K[indsFe])
-                if Planet.Seismic.QScore is not None:
-                    Planet.Seismic.QS[indsFe] = Planet.Seismic.QScore
-                else:
-                    Planet.Seismic.QS[indsFe] = Constants.QScore
+    if np.size(indsAllI) != 0:
+        HiceI = Planet.Seismic.gIceI * Planet.Bulk.Tb_K
+        Planet.Seismic.QS[indsAllI] = Planet.Seismic.BIceI * np.exp(
+            Planet.Seismic.gammaIceI * HiceI / Planet.T_K[indsAllI])
+    if np.size(indsAllClath) != 0:
+        Hclath = Planet.Seismic.gClath * np.max(Planet.T_K[indsAllClath])
+        Planet.Seismic.QS[indsAllClath] = Planet.Seismic.BClath * np.exp(
+            Planet.Seismic.gammaClath * Hclath / Planet.T_K[indsAllClath])
+    if np.size(indsAllII) != 0:
+        HiceII = Planet.Seismic.gIceII * np.max(Planet.T_K[indsAllII])
+        Planet.Seismic.QS[indsAllII] = Planet.Seismic.BIceII * np.exp(
+            Planet.Seismic.gammaIceII * HiceII / Planet.T_K[indsAllII])
+    if np.size(indsAllIII) != 0:
+        HiceIII = Planet.Seismic.gIceIII * np.max(Planet.T_K[indsAllIII])
+        Planet.Seismic.QS[indsAllIII] = Planet.Seismic.BIceIII * np.exp(
+            Planet.Seismic.gammaIceIII * HiceIII / Planet.T_K[indsAllIII])
+    if np.size(indsAllV) != 0:
+        HiceV = Planet.Seismic.gIceV * np.max(Planet.T_K[indsAllV])
+        Planet.Seismic.QS[indsAllV] = Planet.Seismic.BIceV * np.exp(
+            Planet.Seismic.gammaIceV * HiceV / Planet.T_K[indsAllV])
+    if np.size(indsAllVI) != 0:
+        HiceVI = Planet.Seismic.gIceVI * np.max(Planet.T_K[indsAllVI])
+        Planet.Seismic.QS[indsAllVI] = Planet.Seismic.BIceVI * np.exp(
+            Planet.Seismic.gammaIceVI * HiceVI / Planet.T_K[indsAllVI])
+
+    return Planet
 
-    else:
-        Planet.Ocean.GSmeanIIIwet_GPa = np.nan
-        Planet.Ocean.GSmeanVwet_GPa = np.nan
-        Planet.Ocean.GSmeanVI_GPa = np.nan
-        Planet.Sil.GSmean_GPa = np.nan
-        Planet.Core.GSmeanFe_GPa = np.nan
-        Planet.Core.GSmeanFeS_GPa = np.nan
 
-    if np.any(Planet.Seismic.QS > Planet.Seismic.QSmax):
-        log.debug(f'Resetting unnecessarily high QS values to max value: {Planet.Seismic.QSmax}')
-        Planet.Seismic.QS[Planet.Seismic.QS > Planet.Seismic.QSmax] = Planet.Seismic.QSmax
+def CalcSeisInner(Planet, Params, indsSil, indsSilLiq, indsSilI, indsSilII, indsSilIII, indsSilV, indsSilVI, indsFe):
+    """ Calculate seismic properties of silicate and core layers.
+
+        Assigns Planet attributes:
+            Seismic.VP_kms, Seismic.VS_kms, Seismic.QS, Seismic.KS_GPa, Seismic.GS_GPa, Cp_JkgK, alpha_pK
+    """
+    # Get Cp and alpha here, because we didn't calculate them earlier since we didn't need them
+    # in calculating a conductive profile in the silicates and it would contribute extra,
+    # unnecessary computational overhead there.
+    Planet.Cp_JkgK[indsSil] = Planet.Sil.EOS.fn_Cp_JkgK(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
+    Planet.alpha_pK[indsSil] = Planet.Sil.EOS.fn_alpha_pK(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
+    # Evaluate silicate EOS for seismic properties
+    Planet.Seismic.VP_kms[indsSil] = Planet.Sil.EOS.fn_VP_kms(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
+    Planet.Seismic.VS_kms[indsSil] = Planet.Sil.EOS.fn_VS_kms(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
+    Planet.Seismic.KS_GPa[indsSil] = Planet.Sil.EOS.fn_KS_GPa(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
+    Planet.Seismic.GS_GPa[indsSil] = Planet.Sil.EOS.fn_GS_GPa(Planet.P_MPa[indsSil], Planet.T_K[indsSil])
+    Hsil = Planet.Seismic.gSil * TsolidusHirschmann2000(Planet.P_MPa[indsSil])
+    Planet.Seismic.QS[indsSil] = Planet.Seismic.BSil * np.exp(
+        Planet.Seismic.gammaSil * Hsil / Planet.T_K[indsSil])
+
+    if Planet.Do.POROUS_ROCK:
+        Planet = CalcSeisPorRock(Planet, Params, indsSil, indsSilLiq, indsSilI, indsSilII, indsSilIII, indsSilV, indsSilVI)
+
+    if Planet.Do.Fe_CORE:
+        # Evaluate core EOS for seismic properties
+        Planet.Seismic.VP_kms[indsFe] = Planet.Core.EOS.fn_VP_kms(Planet.P_MPa[indsFe], Planet.T_K[indsFe])
+        Planet.Seismic.VS_kms[indsFe] = Planet.Core.EOS.fn_VS_kms(Planet.P_MPa[indsFe], Planet.T_K[indsFe])
+        Planet.Seismic.KS_GPa[indsFe] = Planet.Core.EOS.fn_KS_GPa(Planet.P_MPa[indsFe], Planet.T_K[indsFe])
+        Planet.Seismic.GS_GPa[indsFe] = Planet.Core.EOS.fn_GS_GPa(Planet.P_MPa[indsFe], Planet.T_K[indsFe])
+        if Planet.Seismic.QScore is not None:
+            Planet.Seismic.QS[indsFe] = Planet.Seismic.QScore
+        else:
+            Planet.Seismic.QS[indsFe] = Constants.QScore
 
     return Planet
 
@@ -334,142 +142,6 @@ def CalcSeisPorRock(Planet, Params, indsSil, indsSilLiq, indsSilI, indsSilII, in
     return Planet
 
 
-def CalcSeisPorIce(Planet, Params, indsI, indsIwet, indsII, indsIIund, indsIII, indsIIIund, indsV,
-                                   indsVund, indsVI, indsVIund, indsClath, indsClathWet):
-
-    # Make corrections for dry phases first
-    if np.size(indsI) != 0:
-        Planet.Seismic.VP_kms[indsI] = Planet.Ocean.surfIceEOS['Ih'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsI], 0, Planet.phi_frac[indsI], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsI] = Planet.Ocean.surfIceEOS['Ih'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsI], 0, Planet.phi_frac[indsI], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsI] = Planet.Ocean.surfIceEOS['Ih'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsI], 0, Planet.phi_frac[indsI], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsI] = Planet.Ocean.surfIceEOS['Ih'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsI], 0, Planet.phi_frac[indsI], Planet.Ocean.JGS)
-
-    if np.size(indsClath) != 0:
-        Planet.Seismic.VP_kms[indsClath] = Planet.Ocean.surfIceEOS['Clath'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsClath], 0, Planet.phi_frac[indsClath], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsClath] = Planet.Ocean.surfIceEOS['Clath'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsClath], 0, Planet.phi_frac[indsClath], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsClath] = Planet.Ocean.surfIceEOS['Clath'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsClath], 0, Planet.phi_frac[indsClath], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsClath] = Planet.Ocean.surfIceEOS['Clath'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsClath], 0, Planet.phi_frac[indsClath], Planet.Ocean.JGS)
-
-    if np.size(indsIIund) != 0:
-        Planet.Seismic.VP_kms[indsIIund] = Planet.Ocean.surfIceEOS['II'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsIIund], 0, Planet.phi_frac[indsIIund], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsIIund] = Planet.Ocean.surfIceEOS['II'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsIIund], 0, Planet.phi_frac[indsIIund], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsIIund] = Planet.Ocean.surfIceEOS['II'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsIIund], 0, Planet.phi_frac[indsIIund], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsIIund] = Planet.Ocean.surfIceEOS['II'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsIIund], 0, Planet.phi_frac[indsIIund], Planet.Ocean.JGS)
-
-    if np.size(indsIIIund) != 0:
-        Planet.Seismic.VP_kms[indsIIIund] = Planet.Ocean.surfIceEOS['III'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsIIIund], 0, Planet.phi_frac[indsIIIund], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsIIIund] = Planet.Ocean.surfIceEOS['III'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsIIIund], 0, Planet.phi_frac[indsIIIund], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsIIIund] = Planet.Ocean.surfIceEOS['III'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsIIIund], 0, Planet.phi_frac[indsIIIund], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsIIIund] = Planet.Ocean.surfIceEOS['III'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsIIIund], 0, Planet.phi_frac[indsIIIund], Planet.Ocean.JGS)
-
-    if np.size(indsVund) != 0:
-        Planet.Seismic.VP_kms[indsVund] = Planet.Ocean.surfIceEOS['V'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsVund], 0, Planet.phi_frac[indsVund], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsVund] = Planet.Ocean.surfIceEOS['V'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsVund], 0, Planet.phi_frac[indsVund], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsVund] = Planet.Ocean.surfIceEOS['V'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsVund], 0, Planet.phi_frac[indsVund], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsVund] = Planet.Ocean.surfIceEOS['V'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsVund], 0, Planet.phi_frac[indsVund], Planet.Ocean.JGS)
-
-    if np.size(indsVIund) != 0:
-        Planet.Seismic.VP_kms[indsVIund] = Planet.Ocean.surfIceEOS['VI'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsVIund], 0, Planet.phi_frac[indsVIund], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsVIund] = Planet.Ocean.surfIceEOS['VI'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsVIund], 0, Planet.phi_frac[indsVIund], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsVIund] = Planet.Ocean.surfIceEOS['VI'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsVIund], 0, Planet.phi_frac[indsVIund], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsVIund] = Planet.Ocean.surfIceEOS['VI'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsVIund], 0, Planet.phi_frac[indsVIund], Planet.Ocean.JGS)
-
-    # Now wet phases. First, fluid properties need to be calculated for each, then these
-    # are used to correct for the phase mixture.
-    if np.size(indsIwet) != 0:
-        VPpore_kms, KSpore_GPa = Planet.Ocean.EOS.fn_Seismic(Planet.Ppore_MPa[indsIwet], Planet.T_K[indsIwet])
-        Planet.Seismic.VP_kms[indsIwet] = Planet.Ocean.surfIceEOS['Ih'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsIwet], VPpore_kms, Planet.phi_frac[indsIwet], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsIwet] = Planet.Ocean.surfIceEOS['Ih'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsIwet], 0, Planet.phi_frac[indsIwet], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsIwet] = Planet.Ocean.surfIceEOS['Ih'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsIwet], KSpore_GPa, Planet.phi_frac[indsIwet], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsIwet] = Planet.Ocean.surfIceEOS['Ih'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsIwet], 0, Planet.phi_frac[indsIwet], Planet.Ocean.JGS)
-
-    if np.size(indsClathWet) != 0:
-        VPpore_kms, KSpore_GPa = Planet.Ocean.EOS.fn_Seismic(Planet.Ppore_MPa[indsClathWet], Planet.T_K[indsClathWet])
-        Planet.Seismic.VP_kms[indsClathWet] = Planet.Ocean.surfIceEOS['Clath'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsClathWet], VPpore_kms, Planet.phi_frac[indsClathWet], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsClathWet] = Planet.Ocean.surfIceEOS['Clath'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsClathWet], 0, Planet.phi_frac[indsClathWet], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsClathWet] = Planet.Ocean.surfIceEOS['Clath'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsClathWet], KSpore_GPa, Planet.phi_frac[indsClathWet], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsClathWet] = Planet.Ocean.surfIceEOS['Clath'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsClathWet], 0, Planet.phi_frac[indsClathWet], Planet.Ocean.JGS)
-
-    if np.size(indsII) != 0:
-        VPpore_kms, KSpore_GPa = Planet.Ocean.EOS.fn_Seismic(Planet.Ppore_MPa[indsII], Planet.T_K[indsII])
-        Planet.Seismic.VP_kms[indsII] = Planet.Ocean.iceEOS['II'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsII], VPpore_kms, Planet.phi_frac[indsII], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsII] = Planet.Ocean.iceEOS['II'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsII], 0, Planet.phi_frac[indsII], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsII] = Planet.Ocean.iceEOS['II'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsII], KSpore_GPa, Planet.phi_frac[indsII], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsII] = Planet.Ocean.iceEOS['II'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsII], 0, Planet.phi_frac[indsII], Planet.Ocean.JGS)
-
-    if np.size(indsIII) != 0:
-        VPpore_kms, KSpore_GPa = Planet.Ocean.EOS.fn_Seismic(Planet.Ppore_MPa[indsIII], Planet.T_K[indsIII])
-        Planet.Seismic.VP_kms[indsIII] = Planet.Ocean.iceEOS['III'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsIII], VPpore_kms, Planet.phi_frac[indsIII], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsIII] = Planet.Ocean.iceEOS['III'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsIII], 0, Planet.phi_frac[indsIII], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsIII] = Planet.Ocean.iceEOS['III'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsIII], KSpore_GPa, Planet.phi_frac[indsIII], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsIII] = Planet.Ocean.iceEOS['III'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsIII], 0, Planet.phi_frac[indsIII], Planet.Ocean.JGS)
-
-    if np.size(indsV) != 0:
-        VPpore_kms, KSpore_GPa = Planet.Ocean.EOS.fn_Seismic(Planet.Ppore_MPa[indsV], Planet.T_K[indsV])
-        Planet.Seismic.VP_kms[indsV] = Planet.Ocean.iceEOS['V'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsV], VPpore_kms, Planet.phi_frac[indsV], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsV] = Planet.Ocean.iceEOS['V'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsV], 0, Planet.phi_frac[indsV], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsV] = Planet.Ocean.iceEOS['V'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsV], KSpore_GPa, Planet.phi_frac[indsV], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsV] = Planet.Ocean.iceEOS['V'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsV], 0, Planet.phi_frac[indsV], Planet.Ocean.JGS)
-
-    if np.size(indsVI) != 0:
-        VPpore_kms, KSpore_GPa = Planet.Ocean.EOS.fn_Seismic(Planet.Ppore_MPa[indsVI], Planet.T_K[indsVI])
-        Planet.Seismic.VP_kms[indsVI] = Planet.Ocean.iceEOS['VI'].fn_porosCorrect(
-            Planet.Seismic.VP_kms[indsVI], VPpore_kms, Planet.phi_frac[indsVI], Planet.Ocean.JVP)
-        Planet.Seismic.VS_kms[indsVI] = Planet.Ocean.iceEOS['VI'].fn_porosCorrect(
-            Planet.Seismic.VS_kms[indsVI], 0, Planet.phi_frac[indsVI], Planet.Ocean.JVS)
-        Planet.Seismic.KS_GPa[indsVI] = Planet.Ocean.iceEOS['VI'].fn_porosCorrect(
-            Planet.Seismic.KS_GPa[indsVI], KSpore_GPa, Planet.phi_frac[indsVI], Planet.Ocean.JKS)
-        Planet.Seismic.GS_GPa[indsVI] = Planet.Ocean.iceEOS['VI'].fn_porosCorrect(
-            Planet.Seismic.GS_GPa[indsVI], 0, Planet.phi_frac[indsVI], Planet.Ocean.JGS)
-
-
-    return Planet
-
-
 def WriteSeismic(Planet, Params):
     # Print outputs usable by seismic wave post-processing software
 
@@ -478,27 +150,25 @@ def WriteSeismic(Planet, Params):
         @@@@@@
     """
     # Extend final layer to center
-    rAxi_m = Planet.r_m + 0
+    nAxi = np.size(Planet.r_m)
     rhoAxi_kgm3 = np.append(Planet.rho_kgm3, Planet.rho_kgm3[-1])
-    VPAxi_ms = np.append(Planet.Seismic.VP_kms*1e3, Planet.Seismic.VP_kms[-1]*1e3)
-    VSAxi_ms = np.append(Planet.Seismic.VS_kms*1e3, Planet.Seismic.VS_kms[-1]*1e3)
+    VPAxi_ms = np.append(Planet.Seismic.VP_kms, Planet.Seismic.VP_kms[-1]) * 1e3
+    VSAxi_ms = np.append(Planet.Seismic.VS_kms, Planet.Seismic.VS_kms[-1]) * 1e3
     QSAxi = np.append(Planet.Seismic.QS, Planet.Seismic.QS[-1])
-    Qkappa = Planet.Seismic.Qkappa * np.ones_like(rAxi_m)  # Qkappa is currently simply set to a constant.
+    Qkappa = Planet.Seismic.Qkappa * np.ones(nAxi)  # Qkappa is currently simply set to a constant.
     # Add entries for discontinuities -- note that atmosphere layers must be added manually.
-    nDisc = 0
-    for i, phase in enumerate(Planet.phase[1:]):
-        if phase != Planet.phase[i]:
-            # Check that we aren't just changing from one pore fluid phase to another
-            if not ((phase >= Constants.phaseSil and phase < Constants.phaseSil + 10) and
-                (Planet.phase[i] >= Constants.phaseSil and Planet.phase[i] < Constants.phaseSil + 10)):
-                # Insert a duplicate entry at the bottom of each bulk layer
-                rAxi_m = np.insert(rAxi_m, i+nDisc+1, rAxi_m[i+nDisc+1])
-                rhoAxi_kgm3 = np.insert(rhoAxi_kgm3, i+nDisc+1, rhoAxi_kgm3[i+nDisc])
-                VPAxi_ms = np.insert(VPAxi_ms, i+nDisc+1, VPAxi_ms[i+nDisc])
-                VSAxi_ms = np.insert(VSAxi_ms, i+nDisc+1, VSAxi_ms[i+nDisc])
-                QSAxi = np.insert(QSAxi, i+nDisc+1, QSAxi[i+nDisc])
-                Qkappa = np.insert(Qkappa, i+nDisc+1, Qkappa[i+nDisc])
-                nDisc += 1
+    # Changing from one pore fluid phase to another does not count as a discontinuity.
+    phase = np.asarray(Planet.phase)
+    SIL = np.logical_and(phase >= Constants.phaseSil, phase < Constants.phaseSil + 10)
+    iDisc = np.flatnonzero(np.logical_and(phase[1:] != phase[:-1],
+                                          np.logical_not(np.logical_and(SIL[1:], SIL[:-1]))))
+    # Insert a duplicate entry at the bottom of each bulk layer: the radius is that of the
+    # next layer boundary, with the properties of the layer above it.
+    iAxi = np.arange(nAxi)
+    iRaxi = np.insert(iAxi, iDisc+1, iDisc+1)
+    iAxi = np.insert(iAxi, iDisc+1, iDisc)
+    axiData = np.vstack((Planet.r_m[iRaxi], rhoAxi_kgm3[iAxi], VPAxi_ms[iAxi], VSAxi_ms[iAxi],
+                         Qkappa[iAxi], QSAxi[iAxi])).T
 
     # Construct header
     leadWSAxi = 2
@@ -521,15 +191,8 @@ def WriteSeismic(Planet, Params):
     ]
     with open(Params.DataFiles.AxiSEMfile,'w') as f:
         f.write('\n'.join(headerLines) + '\n')
-        for i in range(np.size(rAxi_m)):
-            f.write(' '*leadWSAxi + ' '.join([
-                f'{rAxi_m[i]:.1f}',
-                f'{rhoAxi_kgm3[i]:.2f}',
-                f'{VPAxi_ms[i]:.2f}',
-                f'{VSAxi_ms[i]:.2f}',
-                f'{Qkappa[i]:.1f}',
-                f'{QSAxi[i]:.1f}'
-            ]) + '\n')
+        axiRowFmt = ' '*leadWSAxi + '%.1f %.2f %.2f %.2f %.1f %.1f\n'
+        f.write((axiRowFmt * np.size(axiData, 0)) % tuple(axiData.ravel().tolist()))
 
 
     """ @@@@@@@@@@@@@@@
@@ -621,18 +284,10 @@ def WriteSeismic(Planet, Params):
                 f'{nminEOS} {iOceanBot} {iOceanTop} 0\n')
 
         # Write data
-        for i in range(nminEOS):
-            f.write(' ' * leadWSminEOS + ' '.join([
-                f'{rminEOS_m[i]:7.0f}',
-                f'{rhominEOS_kgm3[i]:8.2f}',
-                f'{VPminEOS_ms[i]:8.2f}',
-                f'{VSminEOS_ms[i]:8.2f}',
-                f'{QkappaminEOS[i]:8.1f}',
-                f'{QmuminEOS[i]:8.1f}',
-                f'{VPminEOS_ms[i]:8.2f}',
-                f'{VSminEOS_ms[i]:8.2f}',
-                f' 1.0000'
-            ]) + '\n')
+        minEOSdata = np.vstack((rminEOS_m, rhominEOS_kgm3, VPminEOS_ms, VSminEOS_ms,
+                                QkappaminEOS, QmuminEOS, VPminEOS_ms, VSminEOS_ms)).T
+        minEOSrowFmt = ' '*leadWSminEOS + '%7.0f %8.2f %8.2f %8.2f %8.1f %8.1f %8.2f %8.2f  1.0000\n'
+        f.write((minEOSrowFmt * nminEOS) % tuple(minEOSdata.ravel().tolist()))
 
     """ @@@@@@@@@@@@@@@@@@
         minEOS Yannos file
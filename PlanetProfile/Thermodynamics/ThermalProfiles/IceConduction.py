@@ -6,7 +6,7 @@ from PlanetProfile.Thermodynamics.Geophysical import PropagateConduction, EvalLa
 from PlanetProfile.Thermodynamics.HydroEOS import GetIceEOS
 from PlanetProfile.Utilities.Indexing import PhaseConv
 from PlanetProfile.Thermodynamics.ThermalProfiles.ThermalProfiles import GetPbConduct
-from PlanetProfile.Utilities.defineStructs import Constants
+from PlanetProfile.Utilities.defineStructs import Constants, EOSlist
 
 # Assign logger
 log = logging.getLogger('PlanetProfile')
@@ -20,6 +20,12 @@ def IceIWholeConductSolid(Planet, Params):
         Assigns Planet attributes:
             All physical layer arrays
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceIWholeConductSolid', 0, Planet.Steps.nIbottom,
+                               Planet.PbI_MPa, Planet.Bulk.Tb_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
+
     icePhase = PhaseConv(Planet.phase[0])
 
     # Set linear P and adiabatic T in ice I layers. Include 1 extra for P and T to assign next phase to the values
@@ -43,6 +49,8 @@ def IceIWholeConductSolid(Planet, Params):
     # Calculate remaining physical properties of upper ice I
     Planet = PropagateConduction(Planet, Params, 0, Planet.Steps.nIbottom)
 
+    SaveIceShell(Planet, Params, shellLabel, 0, Planet.Steps.nIbottom, [icePhase])
+
     return Planet
 
 
@@ -55,6 +63,12 @@ def IceIWholeConductPorous(Planet, Params):
         Assigns Planet attributes:
             All physical layer arrays
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceIWholeConductPorous', 0, Planet.Steps.nIbottom,
+                               Planet.PbI_MPa, Planet.Bulk.Tb_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
+
     icePhase = PhaseConv(Planet.phase[0])
 
     # Set linear P and conductive T in ice I layers. Include 1 extra for P and T to assign next phase to the values
@@ -84,6 +98,8 @@ def IceIWholeConductPorous(Planet, Params):
     # Calculate remaining physical properties of upper ice I
     Planet = PropagateConduction(Planet, Params, 0, Planet.Steps.nIbottom)
 
+    SaveIceShell(Planet, Params, shellLabel, 0, Planet.Steps.nIbottom, [icePhase])
+
     return Planet
 
 
@@ -95,6 +111,12 @@ def IceIConductClathLidSolid(Planet, Params):
         Assigns Planet attributes:
             All physical layer arrays
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceIConductClathLidSolid', 0, Planet.Steps.nIbottom,
+                               Planet.PbI_MPa, Planet.Bulk.Tb_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
+
     # Assign phases for clathrates, as number of layers is fixed in this case
     Planet.phase[:Planet.Steps.nClath] = Constants.phaseClath
     # Set linear P and T in ice I layers to use in surfIce.EOS functions
@@ -167,6 +189,9 @@ def IceIConductClathLidSolid(Planet, Params):
 
     Planet.zClath_m = Planet.z_m[Planet.Steps.nClath]
 
+    SaveIceShell(Planet, Params, shellLabel, 0, Planet.Steps.nIbottom, ['Ih', 'Clath'],
+                 attrs=('TclathTrans_K', 'PbClathMax_MPa', 'zClath_m'), SAVE_Q=True)
+
     return Planet
 
 
@@ -178,6 +203,12 @@ def IceIConductClathLidPorous(Planet, Params):
         Assigns Planet attributes:
             All physical layer arrays
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceIConductClathLidPorous', 0, Planet.Steps.nIbottom,
+                               Planet.PbI_MPa, Planet.Bulk.Tb_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
+
     # Assign phases for clathrates, as number of layers is fixed in this case
     Planet.phase[:Planet.Steps.nClath] = Constants.phaseClath
     # Set linear P and T in ice I layers to use in surfIce.EOS functions
@@ -267,6 +298,9 @@ def IceIConductClathLidPorous(Planet, Params):
 
     Planet.zClath_m = Planet.z_m[Planet.Steps.nClath]
 
+    SaveIceShell(Planet, Params, shellLabel, 0, Planet.Steps.nIbottom, ['Ih', 'Clath'],
+                 attrs=('TclathTrans_K', 'PbClathMax_MPa', 'zClath_m'), SAVE_Q=True)
+
     return Planet
 
 
@@ -278,6 +312,12 @@ def IceIConductClathUnderplateSolid(Planet, Params):
         Assigns Planet attributes:
             All physical layer arrays
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceIConductClathUnderplateSolid', 0, Planet.Steps.nIbottom,
+                               Planet.PbI_MPa, Planet.Bulk.Tb_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
+
     # Get clathrate EOS
     PIceFull_MPa = np.linspace(Planet.P_MPa[0], Planet.PbI_MPa, Planet.Steps.nIbottom+1)
     TIceFull_K = np.linspace(Planet.T_K[0], Planet.Bulk.Tb_K, Planet.Steps.nIbottom)
@@ -369,6 +409,9 @@ def IceIConductClathUnderplateSolid(Planet, Params):
         # Set actual thickness of clathrate underplate layer
         Planet.zClath_m = Planet.z_m[Planet.Steps.nIbottom] - Planet.z_m[Planet.Steps.nIceI]
 
+    SaveIceShell(Planet, Params, shellLabel, 0, Planet.Steps.nIbottom, ['Ih', 'Clath'],
+                 attrs=('zClath_m',))
+
     return Planet
 
 
@@ -380,6 +423,12 @@ def IceIConductClathUnderplatePorous(Planet, Params):
         Assigns Planet attributes:
             All physical layer arrays
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceIConductClathUnderplatePorous', 0, Planet.Steps.nIbottom,
+                               Planet.PbI_MPa, Planet.Bulk.Tb_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
+
     # Get clathrate EOS
     PIceFull_MPa = np.linspace(Planet.P_MPa[0], Planet.PbI_MPa, Planet.Steps.nIbottom+1)
     TIceFull_K = np.linspace(Planet.T_K[0], Planet.Bulk.Tb_K, Planet.Steps.nIbottom)
@@ -477,12 +526,20 @@ def IceIConductClathUnderplatePorous(Planet, Params):
     # Set actual thickness of clathrate underplate layer
     Planet.zClath_m = Planet.z_m[Planet.Steps.nIbottom] - Planet.z_m[Planet.Steps.nIceI]
 
+    SaveIceShell(Planet, Params, shellLabel, 0, Planet.Steps.nIbottom, ['Ih', 'Clath'],
+                 attrs=('zClath_m',))
+
     return Planet
 
 
 def IceIIIConductSolid(Planet, Params):
     """ Calculate conductive profile for ice III layers
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceIIIConductSolid', Planet.Steps.nIbottom, Planet.Steps.nIIIbottom,
+                               Planet.PbIII_MPa, Planet.Bulk.TbIII_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
 
     # Set linear P and conductive T in ice III layers
     PIceIII_MPa = np.linspace(Planet.P_MPa[Planet.Steps.nIbottom], Planet.PbIII_MPa, Planet.Steps.nIceIIILitho+1)
@@ -503,12 +560,19 @@ def IceIIIConductSolid(Planet, Params):
     # Calculate remaining physical properties of upper ice III
     Planet = PropagateConduction(Planet, Params, Planet.Steps.nIbottom, Planet.Steps.nIIIbottom)
 
+    SaveIceShell(Planet, Params, shellLabel, Planet.Steps.nIbottom, Planet.Steps.nIIIbottom, ['III'])
+
     return Planet
 
 
 def IceIIIConductPorous(Planet, Params):
     """ Calculate conductive profile for ice III layers
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceIIIConductPorous', Planet.Steps.nIbottom, Planet.Steps.nIIIbottom,
+                               Planet.PbIII_MPa, Planet.Bulk.TbIII_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
 
     # Set linear P and conductive T in ice III layers
     PIceIII_MPa = np.linspace(Planet.P_MPa[Planet.Steps.nIbottom], Planet.PbIII_MPa, Planet.Steps.nIceIIILitho+1)
@@ -536,12 +600,19 @@ def IceIIIConductPorous(Planet, Params):
     # Calculate remaining physical properties of upper ice III
     Planet = PropagateConduction(Planet, Params, Planet.Steps.nIbottom, Planet.Steps.nIIIbottom)
 
+    SaveIceShell(Planet, Params, shellLabel, Planet.Steps.nIbottom, Planet.Steps.nIIIbottom, ['III'])
+
     return Planet
 
 
 def IceVConductSolid(Planet, Params):
     """ Calculate conductive profile for ice V layers
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceVConductSolid', Planet.Steps.nIIIbottom, Planet.Steps.nSurfIce,
+                               Planet.PbV_MPa, Planet.Bulk.TbV_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
 
     # Set linear P and conductive T in ice V layers
     PIceV_MPa = np.linspace(Planet.P_MPa[Planet.Steps.nIIIbottom], Planet.PbV_MPa, Planet.Steps.nIceVLitho+1)
@@ -562,12 +633,19 @@ def IceVConductSolid(Planet, Params):
     # Calculate remaining physical properties of upper ice V
     Planet = PropagateConduction(Planet, Params, Planet.Steps.nIIIbottom, Planet.Steps.nSurfIce)
 
+    SaveIceShell(Planet, Params, shellLabel, Planet.Steps.nIIIbottom, Planet.Steps.nSurfIce, ['V'])
+
     return Planet
 
 
 def IceVConductPorous(Planet, Params):
     """ Calculate conductive profile for ice V layers
     """
+    # Reuse the shell calculated for a previous model with the same inputs, if there is one
+    shellLabel = IceShellLabel(Planet, Params, 'IceVConductPorous', Planet.Steps.nIIIbottom, Planet.Steps.nSurfIce,
+                               Planet.PbV_MPa, Planet.Bulk.TbV_K)
+    if ReloadIceShell(Planet, Params, shellLabel):
+        return Planet
 
     # Set linear P and conductive T in ice V layers
     PIceV_MPa = np.linspace(Planet.P_MPa[Planet.Steps.nIIIbottom], Planet.PbV_MPa, Planet.Steps.nIceVLitho+1)
@@ -595,4 +673,120 @@ def IceVConductPorous(Planet, Params):
     # Calculate remaining physical properties of upper ice V
     Planet = PropagateConduction(Planet, Params, Planet.Steps.nIIIbottom, Planet.Steps.nSurfIce)
 
+    SaveIceShell(Planet, Params, shellLabel, Planet.Steps.nIIIbottom, Planet.Steps.nSurfIce, ['V'])
+
     return Planet
+
+
+def IceShellLabel(Planet, Params, shellType, iStart, iEnd, Pb_MPa, Tb_K):
+    """ Get a label identifying a conductive ice shell by all of the inputs that determine
+        its layers, so that models sharing the shell (e.g. exploreogram cells that vary only
+        interior properties) can reuse it from EOSlist instead of recalculating it.
+
+        Args:
+            shellType (str): Name of the conductive profile function that calculates the shell
+            iStart, iEnd (int): Layer array indices of the top and bottom of the shell
+            Pb_MPa, Tb_K (float): Pressure and temperature at the bottom of the shell
+        Returns:
+            shellLabel (str): Key for the shell in EOSlist.loaded
+    """
+    shellInputs = [iStart, iEnd, Planet.Steps.nClath, Planet.Steps.nIceI, Planet.phase[iStart], Pb_MPa, Tb_K,
+                   Planet.P_MPa[iStart], Planet.T_K[iStart], Planet.r_m[iStart], Planet.z_m[iStart],
+                   Planet.g_ms2[iStart], np.sum(Planet.MLayer_kg[:iStart]), Planet.Bulk.R_m, Planet.Bulk.M_kg,
+                   Planet.Bulk.Psurf_MPa, Planet.Bulk.Tsurf_K, Planet.Bulk.qSurf_Wm2, Planet.Bulk.clathType,
+                   Planet.Bulk.clathMaxThick_m, Planet.Do.CLATHRATE, Planet.Do.NAGASHIMA_CLATH_DISSOC,
+                   Planet.Do.ICEIh_DIFFERENT, Planet.Do.CONSTANT_GRAVITY, Planet.Do.POROUS_ICE,
+                   Params.EXTRAP_ICE, Params.minPres_MPa, Params.minTres_K]
+    if Planet.Do.POROUS_ICE:
+        shellInputs += [Planet.Ocean.porosType, Planet.Ocean.phiMax_frac, Planet.Ocean.Pclosure_MPa,
+                        Planet.Ocean.phiMin_frac, Planet.Ocean.Jrho, Planet.Ocean.JCp, Planet.Ocean.Jalpha,
+                        Planet.Ocean.JkTherm]
+    shellLabel = f'IceShell_{shellType}_' + '_'.join(repr(val) for val in shellInputs)
+
+    return shellLabel
+
+
+def ReloadIceShell(Planet, Params, shellLabel):
+    """ Assign the layers of a conductive ice shell saved by SaveIceShell for an
+        earlier model with the same shell inputs.
+
+        Args:
+            shellLabel (str): Key for the shell from IceShellLabel
+        Returns:
+            FOUND (bool): Whether the shell was found and assigned to Planet
+    """
+    if not Params.REUSE_ICE_SHELLS or Params.FORCE_EOS_RECALC or shellLabel not in EOSlist.loaded.keys():
+        return False
+
+    shell = EOSlist.loaded[shellLabel]
+    iStart, iEnd = shell.iStart, shell.iEnd
+    for name, vals in shell.bounds.items():
+        getattr(Planet, name)[iStart:iEnd+1] = vals
+    for name, vals in shell.layers.items():
+        getattr(Planet, name)[iStart:iEnd] = vals
+    Planet.g_ms2[iEnd+1:] = shell.gBelow_ms2
+    Planet.Ocean.surfIceEOS.update(shell.surfIceEOS)
+    for name, val in shell.attrs.items():
+        setattr(Planet, name, val)
+    if shell.QfromMantle_W is not None:
+        Planet.Ocean.QfromMantle_W = shell.QfromMantle_W
+    log.debug(f'Reusing conductive ice shell from layer {iStart:d} to {iEnd:d} calculated for a previous model.')
+
+    return True
+
+
+def SaveIceShell(Planet, Params, shellLabel, iStart, iEnd, icePhases, attrs=(), SAVE_Q=False):
+    """ Save the layers of a newly calculated conductive ice shell in EOSlist for reuse
+        by later models with the same shell inputs. Shells of invalid models are not saved.
+
+        Args:
+            shellLabel (str): Key for the shell from IceShellLabel
+            iStart, iEnd (int): Layer array indices of the top and bottom of the shell
+            icePhases (list of str): Ice phases with EOSs in Ocean.surfIceEOS used for the shell
+            attrs (tuple of str): Names of scalar Planet attributes set by the shell calculation
+            SAVE_Q (bool): Whether Ocean.QfromMantle_W was set by the shell calculation
+    """
+    if Params.REUSE_ICE_SHELLS and Planet.Do.VALID:
+        EOSlist.loaded[shellLabel] = IceShellStruct(Planet, iStart, iEnd, icePhases, attrs, SAVE_Q)
+        EOSlist.ranges[shellLabel] = f'{iStart:d}-{iEnd:d}'
+
+    return
+
+
+def UnloadIceShells():
+    """ Remove all conductive ice shells saved by SaveIceShell from EOSlist, so that
+        they are not kept in memory after the models that share them have been run.
+    """
+    shellLabels = [label for label in EOSlist.loaded.keys() if label.startswith('IceShell_')]
+    for shellLabel in shellLabels:
+        del EOSlist.loaded[shellLabel]
+        EOSlist.ranges.pop(shellLabel, None)
+    if len(shellLabels) > 0:
+        log.debug(f'Removed {len(shellLabels):d} saved conductive ice shells.')
+
+    return
+
+
+class IceShellStruct:
+    """ Copies of the layer arrays and scalar attributes assigned to Planet by
+        a conductive ice shell calculation.
+    """
+    # Layer arrays set at each layer boundary from iStart to iEnd, inclusive
+    boundArrays = ['P_MPa', 'T_K', 'r_m', 'z_m', 'g_ms2']
+    # Layer arrays set for each layer from iStart to iEnd, exclusive
+    layerArrays = ['phase', 'MLayer_kg', 'rhoMatrix_kgm3', 'rho_kgm3', 'Cp_JkgK', 'alpha_pK', 'kTherm_WmK']
+
+    def __init__(self, Planet, iStart, iEnd, icePhases, attrs, SAVE_Q):
+        self.iStart = iStart
+        self.iEnd = iEnd
+        self.bounds = {name: getattr(Planet, name)[iStart:iEnd+1] + 0 for name in self.boundArrays}
+        layerArrays = self.layerArrays + ['phi_frac'] if Planet.Do.POROUS_ICE else self.layerArrays
+        self.layers = {name: getattr(Planet, name)[iStart:iEnd] + 0 for name in layerArrays}
+        # PropagateConduction also sets a uniform gravity for all layers below the shell
+        self.gBelow_ms2 = Planet.g_ms2[iEnd+1:iEnd+2] + 0.0
+        self.surfIceEOS = {phase: Planet.Ocean.surfIceEOS[phase] for phase in icePhases}
+        self.attrs = {name: getattr(Planet, name) for name in attrs}
+        if SAVE_Q:
+            self.QfromMantle_W = Planet.Ocean.QfromMantle_W
+        else:
+            self.QfromMantle_W = None
@@ -1,13 +1,17 @@
 import numpy as np
 import logging
-from PlanetProfile.Utilities.defineStructs import Constants
-from PlanetProfile.Thermodynamics.HydroEOS import GetTfreeze, GetPfreeze, kThermMelinder2007, \
+from scipy.integrate import solve_ivp as ODEsolve
+from PlanetProfile.Utilities.defineStructs import Constants, EOSlist
+from PlanetProfile.Thermodynamics.HydroEOS import GetTfreezeBatched, GetPfreeze, kThermMelinder2007, \
     kThermHobbs1974, GetOceanEOS
 from PlanetProfile.Utilities.Indexing import PhaseConv
 
 # Assign logger
 log = logging.getLogger('PlanetProfile')
 
+# Key in EOSlist.loaded for the pure water melting temperature table made by LoadTmeltTable
+TmeltTableLabel = 'TmeltTable_PureH2O'
+
 def ConvectionDeschampsSotin2001(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2, Pmid_MPa,
                                  oceanEOS, iceEOS, phaseBot, EQUIL_Q):
     """ Thermodynamics calculations for convection in an ice layer
@@ -21,7 +25,7 @@ def ConvectionDeschampsSotin2001(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2,
         are poorly described, contain errors (e.g. unit problem in Eq. 2), or use
         physically inconsistent values, as in defining the "core" Rayleigh number Ra.
         A more robust model for convection in the ice shell should be found and
-        used to replace this.
+        used to replace this. Calculations are done by ConvectionDeschampsSotin2001Batch.
 
         Args:
             Ttop_K (float): Temperature at top of whole layer in K
@@ -46,7 +50,33 @@ def ConvectionDeschampsSotin2001(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2,
                 and convective region in m
             qbot_Wm2 (float): Heat flux at the bottom of the ice in W/m^2
     """
-    if Tb_K < Ttop_K:
+    Tconv_K, etaConv_Pas, eLid_m, Dconv_m, deltaTBL_m, Qbot_W, Ra, RaCrit \
+        = ConvectionDeschampsSotin2001Batch(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2, Pmid_MPa,
+                                            oceanEOS, iceEOS, phaseBot, EQUIL_Q)
+
+    return Tconv_K[0], etaConv_Pas[0], eLid_m[0], Dconv_m[0], deltaTBL_m[0], Qbot_W[0], Ra[0], RaCrit[0]
+
+
+def ConvectionDeschampsSotin2001Batch(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2, Pmid_MPa,
+                                      oceanEOS, iceEOS, phaseBot, EQUIL_Q):
+    """ Evaluate the Deschamps and Sotin (2001) convection parameterization for many sets of
+        layer inputs at once, e.g. for every model in an explore-o-gram. All sets share the ice
+        phase and EOS. Melting temperatures of pure water ice are interpolated from the table
+        made by LoadTmeltTable where one has been loaded, and are otherwise found for all
+        inputs together with a single melting curve EOS.
+
+        Args:
+            Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2, Pmid_MPa (float, shape N): Layer inputs as in
+                ConvectionDeschampsSotin2001. Scalars are applied to all N sets.
+            oceanEOS, iceEOS, phaseBot, EQUIL_Q: As in ConvectionDeschampsSotin2001, common to all sets.
+        Returns:
+            Tconv_K, etaConv_Pas, eLid_m, Dconv_m, deltaTBL_m, Qbot_W, Ra, RaCrit (float, shape N): Outputs as in
+                ConvectionDeschampsSotin2001 for each set of inputs.
+    """
+    Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2, Pmid_MPa \
+        = (np.array(var, dtype=np.float_) for var in np.broadcast_arrays(
+            *np.atleast_1d(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2, Pmid_MPa)))
+    if np.any(Tb_K < Ttop_K):
         raise ValueError('Tb_K is less than Ttop_K, which will result in a negative Rayleigh' +
                          'number. Try adjusting Tb_K, TbIII_K, TbV_K, etc.')
 
@@ -60,14 +90,16 @@ def ConvectionDeschampsSotin2001(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2,
     A = Constants.Eact_kJmol[phaseMid] * 1e3 / Constants.R / Tb_K
     B = Constants.Eact_kJmol[phaseMid] * 1e3 / 2 / Constants.R / c1
     C = c2 * (Tb_K - Ttop_K)
-    # Temperature and viscosity of the "well-mixed" convective region
+    # Temperature and viscosity of the "well-mixed", convective region
     Tconv_K = B * (np.sqrt(1 + 2/B*(Tb_K - C)) - 1)
-    if(Tconv_K < Ttop_K):
-        Tconv_K = Ttop_K
+    COLD = Tconv_K < Ttop_K
+    if np.any(COLD):
+        Tconv_K[COLD] = Ttop_K[COLD]
         log.debug(f'Convecting temperature for ice {PhaseConv(phaseBot)} is less than the ' +
                    'temperature at the top of the layer. Tconv has been set equal to Ttop and ' +
                    'no conductive lid will be modeled.')
-    if phaseMid != oceanEOS.fn_phase(Pmid_MPa, Tconv_K) and Tconv_K > oceanEOS.Tmin:
+    iWrongPhase = np.where((oceanEOS.fn_phase(Pmid_MPa, Tconv_K) != phaseMid) & (Tconv_K > oceanEOS.Tmin))[0]
+    if np.size(iWrongPhase) > 0:
         if abs(phaseMid) != Constants.phaseClath:
             iceType = f'ice {PhaseConv(phaseMid)}'
             suggestion = 'Try adjusting Tb_K values to achieve a possible configuration.'
@@ -80,21 +112,31 @@ def ConvectionDeschampsSotin2001(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2,
                          'boundary layer as needed for the temperature to be below the instability threshold ' + \
                          'throughout the ice shell.'
         log.warning(f'Convecting temperature of {iceType} exceeds a phase transition. ' + suggestion)
-        oldPmid_MPa = Pmid_MPa + 0.0
-        Pmid_MPa = GetPfreeze(oceanEOS, phaseMid, Tconv_K, UNDERPLATE=False)
-        log.warning(f'Pmid_MPa has been adjusted upward from {oldPmid_MPa} to {Pmid_MPa} to compensate.')
+        for i in iWrongPhase:
+            oldPmid_MPa = Pmid_MPa[i] + 0.0
+            Pmid_MPa[i] = GetPfreeze(oceanEOS, phaseMid, Tconv_K[i], UNDERPLATE=False)
+            log.warning(f'Pmid_MPa has been adjusted upward from {oldPmid_MPa} to {Pmid_MPa[i]} to compensate.')
 
     # Get melting temperature for calculating viscosity relative to this temp
-    Pmelt_MPa = np.linspace(Pmid_MPa, Pmid_MPa+0.01, 6)
     if phaseMid == Constants.phaseClath:
-        meltEOS = oceanEOS
-        Tupper_K = Tb_K
+        Tmelt_K = GetTfreezeBatched(oceanEOS, Pmid_MPa, Tconv_K, TfreezeRange_K=Tb_K-Tconv_K)
     else:
-        Tupper_K = 274
-        meltEOS = GetOceanEOS('PureH2O', 0.0, Pmelt_MPa,
-                               np.arange(Tconv_K, 274.0, 0.05), None,
-                               phaseType='calc', MELT=True)
-    Tmelt_K = GetTfreeze(meltEOS, Pmid_MPa, Tconv_K, TfreezeRange_K=Tupper_K-Tconv_K)
+        Tmelt_K = np.empty_like(Tconv_K)
+        if TmeltTableLabel in EOSlist.loaded.keys():
+            Ptable_MPa, TmeltTable_K = EOSlist.loaded[TmeltTableLabel]
+            INTABLE = np.logical_and(Pmid_MPa >= Ptable_MPa[0], Pmid_MPa <= Ptable_MPa[-1])
+            Tmelt_K[INTABLE] = np.interp(Pmid_MPa[INTABLE], Ptable_MPa, TmeltTable_K)
+        else:
+            INTABLE = np.zeros_like(Tconv_K, dtype=np.bool_)
+        if not np.all(INTABLE):
+            Pcalc_MPa = Pmid_MPa[~INTABLE]
+            Tcalc_K = Tconv_K[~INTABLE]
+            Tupper_K = 274
+            Pmelt_MPa = np.linspace(np.min(Pcalc_MPa), np.max(Pcalc_MPa)+0.01, 6)
+            meltEOS = GetOceanEOS('PureH2O', 0.0, Pmelt_MPa,
+                                   np.arange(np.min(Tcalc_K), Tupper_K, 0.05), None,
+                                   phaseType='calc', MELT=True)
+            Tmelt_K[~INTABLE] = GetTfreezeBatched(meltEOS, Pcalc_MPa, Tcalc_K, TfreezeRange_K=Tupper_K-Tcalc_K)
     etaConv_Pas = Constants.etaMelt_Pas[phaseMid] * np.exp(A * (Tmelt_K/Tconv_K - 1))
     # Get physical properties of ice at the "middle" of the convective region
     rhoMid_kgm3 = iceEOS.fn_rho_kgm3(Pmid_MPa, Tconv_K)
@@ -123,14 +165,15 @@ def ConvectionDeschampsSotin2001(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2,
 
     # If the Rayleigh number is less than some critical value, convection does not occur.
     RaCrit = GetRaCrit(Constants.Eact_kJmol[phaseBot], Tb_K, Ttop_K, Tconv_K)
-    if(Ra < RaCrit):
-        log.debug(f'Rayleigh number of {Ra:.3e} in the surface ice {PhaseConv(phaseBot)} ' +
-                  f'layer is less than the critical value of {RaCrit:.3e}. ' +
+    CONDUCT = Ra < RaCrit
+    for i in np.where(CONDUCT)[0]:
+        log.debug(f'Rayleigh number of {Ra[i]:.3e} in the surface ice {PhaseConv(phaseBot)} ' +
+                  f'layer is less than the critical value of {RaCrit[i]:.3e}. ' +
                    'Only conduction will be modeled in this layer.')
-        # Set conductive layer thicknesses to whole shell thickness to force a whole-layer conductive profile
-        eLid_m = zb_m
-        deltaTBL_m = 0.0
-        Tconv_K = Ttop_K
+    # Set conductive layer thicknesses to whole shell thickness to force a whole-layer conductive profile
+    eLid_m[CONDUCT] = zb_m[CONDUCT]
+    deltaTBL_m[CONDUCT] = 0.0
+    Tconv_K[CONDUCT] = Ttop_K[CONDUCT]
 
     if not EQUIL_Q:
         # Set heat flux to be equal to that passing the conductive lid
@@ -151,6 +194,43 @@ def ConvectionDeschampsSotin2001(Ttop_K, rTop_m, kTop_WmK, Tb_K, zb_m, gtop_ms2,
     return Tconv_K, etaConv_Pas, eLid_m, Dconv_m, deltaTBL_m, Qbot_W, Ra, RaCrit
 
 
+def LoadTmeltTable(Pmin_MPa=0.1, Pmax_MPa=620, PRes_MPa=1.0, Tmin_K=200):
+    """ Tabulate the melting temperature of pure water ice against pressure and store the
+        table in EOSlist, so that later convection calculations interpolate in it instead of
+        searching for the melting temperature of each model. Load before starting parallel
+        runs (e.g. explore-o-grams) so that forked workers inherit the table, and remove it
+        with UnloadTmeltTable when they finish.
+
+        Args:
+            Pmin_MPa, Pmax_MPa (float): Pressure range of table in MPa. The default upper limit is
+                just below the ice V-VI-liquid triple point, above which no ice phase convects.
+            PRes_MPa (float): Pressure step of table in MPa. Linear interpolation with the default
+                step is accurate to better than 1e-4 K away from triple points.
+            Tmin_K (float): Temperature in K from which to search for melting temperatures. Must be
+                below the melting temperature at every pressure in the table.
+    """
+    log.info('Tabulating pure water melting temperatures for ice convection calculations.')
+    Ptable_MPa = np.arange(Pmin_MPa, Pmax_MPa + PRes_MPa/2, PRes_MPa)
+    Tupper_K = 274
+    meltEOS = GetOceanEOS('PureH2O', 0.0, Ptable_MPa, np.arange(Tmin_K, Tupper_K, 0.05), None,
+                          phaseType='calc', MELT=True)
+    TmeltTable_K = GetTfreezeBatched(meltEOS, Ptable_MPa, Tmin_K, TfreezeRange_K=Tupper_K-Tmin_K)
+    EOSlist.loaded[TmeltTableLabel] = (Ptable_MPa, TmeltTable_K)
+    log.debug(f'Loaded pure water melting temperature table from {Pmin_MPa} to {Pmax_MPa} MPa.')
+
+    return
+
+
+def UnloadTmeltTable():
+    """ Remove the table stored by LoadTmeltTable from EOSlist, so that models run later in the
+        same process go back to finding melting temperatures directly.
+    """
+    if EOSlist.loaded.pop(TmeltTableLabel, None) is not None:
+        log.debug('Removed pure water melting temperature table.')
+
+    return
+
+
 def ConductiveTemperature(Ttop_K, rTop_m, rBot_m, kTherm_WmK, rhoRad_kgm3, Qrad_Wkg, Htidal_Wm3, qTop_Wm2):
     """ Thermal profile for purely thermally conductive layers, based on Turcotte and Schubert (2002),
         equation 4.40: T = -rho*H/6/k * r^2 + c1/r + c2, where c1 and c2 are integration constants
@@ -243,9 +323,12 @@ def GetRaCrit(Eact_kJmol, Tb_K, Ttop_K, Tconv_K):
     return RaCrit
 
 
-def GetPbConduct(Ttop_K, Tb_K, rTop_m, Ptop_MPa, gTop_ms2, qTop_Wm2, EOS, rRes_m=1e2, Qrad_Wkg=0, Htidal_Wm3=0):
+def GetPbConduct(Ttop_K, Tb_K, rTop_m, Ptop_MPa, gTop_ms2, qTop_Wm2, EOS, rRes_m=1e2, Qrad_Wkg=0, Htidal_Wm3=0,
+                 rtol=1e-6, maxEvals=10000):
     """ Find the pressure associated with the bottom temperature of a conductive layer,
-        given the top temperature, outer radius, heat flux, and EOS.
+        given the top temperature, outer radius, heat flux, and EOS. The conductive
+        temperature, heat flux, gravity, and hydrostatic pressure profiles are integrated
+        downward together with an adaptive-step ODE solver, stopping where T = Tb_K.
 
         Args:
             Ttop_K (float): Temperature at the top of the conductive layer in K
@@ -257,24 +340,69 @@ def GetPbConduct(Ttop_K, Tb_K, rTop_m, Ptop_MPa, gTop_ms2, qTop_Wm2, EOS, rRes_m
             EOS (EOSStruct): Ice, Ocean, or Perple_X EOS struct that can be queried for
                 density (fn_rho_kgm3) and thermal conductivity (fn_kTherm_WmK) as
                 functions of P_MPa and T_K
-            rRes_m = 1e2 (float): Radial resolution in m for calculating depth profile
+            rRes_m = 1e2 (float): Initial radial step size in m for the solver
             Htidal_Wm3 = 0 (float): Volumetric (tidal) heating rate in W/m^3
             Qrad_Wkg = 0 (float): Radiogenic heating rate in W/kg
+            rtol = 1e-6 (float): Relative tolerance for the solver error control
+            maxEvals = 10000 (int): Maximum number of derivative evaluations before giving up
+        Returns:
+            Pb_MPa (float): Pressure at the depth where T = Tb_K in MPa
     """
-    Tbot_K = Ttop_K
-    Pb_MPa = Ptop_MPa
-    thisqTop_Wm2 = qTop_Wm2 + 0
-    i = 0
-    while Tbot_K < Tb_K:
-        thisrTop_m = rTop_m - i*rRes_m
-        rBot_m = thisrTop_m - rRes_m
-        rho_kgm3 = EOS.fn_rho_kgm3(Pb_MPa, Tbot_K)
-        kTherm_WmK = EOS.fn_kTherm_WmK(Pb_MPa, Tbot_K)
-        Tbot_K, thisqTop_Wm2 = ConductiveTemperatureActual(Tbot_K, thisrTop_m, rBot_m,
-                            kTherm_WmK, rho_kgm3, Qrad_Wkg, Htidal_Wm3, thisqTop_Wm2)
-        MLayer_kg = 4/3 * np.pi * (thisrTop_m**3 - rBot_m**3) * rho_kgm3
-        gTop_ms2 = (gTop_ms2 * thisrTop_m**2 - Constants.G * MLayer_kg) / rBot_m**2
-        Pb_MPa += MLayer_kg * gTop_ms2 / (4*np.pi*rBot_m**2) / 1e6
-        i += 1
+    if not np.all(np.isfinite([Tb_K, rRes_m, qTop_Wm2, gTop_ms2])):
+        raise ValueError(f'Invalid inputs for conductive profile: Tb_K = {Tb_K}, rRes_m = {rRes_m}, ' +
+                         f'qTop_Wm2 = {qTop_Wm2}, gTop_ms2 = {gTop_ms2}.')
+    if Tb_K <= Ttop_K:
+        return Ptop_MPa
+
+    dydr = fn_dConductdr(EOS, Qrad_Wkg, Htidal_Wm3, maxEvals)
+    solution = ODEsolve(dydr, (rTop_m, rTop_m * 1e-3), [Ttop_K, qTop_Wm2, gTop_ms2, Ptop_MPa],
+                        events=fn_TbReached(Tb_K), first_step=rRes_m, rtol=rtol,
+                        atol=[rtol * Tb_K, rtol * abs(qTop_Wm2), rtol * gTop_ms2, rtol])
+    if np.size(solution.t_events[0]) == 0:
+        raise ValueError(f'Conductive profile did not reach Tb_K = {Tb_K:.3f} K between r = ' +
+                         f'{rTop_m/1e3:.3f} km and the center. Final T = {solution.y[0,-1]:.3f} K.')
+    Pb_MPa = solution.y_events[0][0,3]
 
     return Pb_MPa
+
+
+class fn_dConductdr:
+    """ Derivatives with respect to radius of temperature, heat flux, gravity, and pressure
+        in a conductive layer, for use in GetPbConduct. Temperature and heat flux follow
+        the same profile as ConductiveTemperatureActual applied over thin shells.
+    """
+    def __init__(self, EOS, Qrad_Wkg, Htidal_Wm3, maxEvals):
+        self.EOS = EOS
+        self.Qrad_Wkg = Qrad_Wkg
+        self.Htidal_Wm3 = Htidal_Wm3
+        self.maxEvals = maxEvals
+        self.nEvals = 0
+
+    def __call__(self, r_m, y):
+        self.nEvals += 1
+        if self.nEvals > self.maxEvals:
+            raise ValueError(f'Conductive profile did not converge within {self.maxEvals:d} evaluations. ' +
+                             f'Stopped at r = {r_m/1e3:.3f} km with T = {y[0]:.3f} K.')
+        T_K, q_Wm2, g_ms2, P_MPa = y
+        rho_kgm3 = float(self.EOS.fn_rho_kgm3(P_MPa, T_K))
+        kTherm_WmK = float(self.EOS.fn_kTherm_WmK(P_MPa, T_K))
+        if not (np.isfinite(rho_kgm3) and np.isfinite(kTherm_WmK)):
+            raise ValueError(f'Conductive profile reached invalid EOS values at P = {P_MPa:.3f} MPa, ' +
+                             f'T = {T_K:.3f} K (rho = {rho_kgm3}, kTherm = {kTherm_WmK}).')
+        Htot_Wm3 = self.Qrad_Wkg * rho_kgm3 + self.Htidal_Wm3
+        return [-(q_Wm2 + Htot_Wm3 * r_m / 3) / 2/kTherm_WmK,
+                Htot_Wm3 - 2 * q_Wm2 / r_m,
+                4*np.pi * Constants.G * rho_kgm3 - 2 * g_ms2 / r_m,
+                -rho_kgm3 * g_ms2 / 1e6]
+
+
+class fn_TbReached:
+    """ Terminal solver event for when the temperature reaches Tb_K in GetPbConduct. """
+    terminal = True
+    direction = 1
+
+    def __init__(self, Tb_K):
+        self.Tb_K = Tb_K
+
+    def __call__(self, r_m, y):
+        return y[0] - self.Tb_K
@@ -1,38 +1,22 @@
 import logging
 import numpy as np
-from PlanetProfile.TrajecAnalysis.SpiceFuncs import RotateFrame, RotateFrameManual, spiceS3coords
+import spiceypy as spice
+from PlanetProfile.TrajecAnalysis.SpiceFuncs import GetRotMatsManual, spiceS3coords
 from PlanetProfile.TrajecAnalysis.FlybyEvents import GetFlybyCA
 from PlanetProfile.Utilities.defineStructs import Constants
 from PlanetProfile.GetConfig import FigMisc
 
-# Parallel processing
-import multiprocessing as mtp
-import platform
-plat = platform.system()
-if plat == 'Windows':
-    mtpType = 'spawn'
-else:
-    mtpType = 'fork'
-mtpContext = mtp.get_context(mtpType)
 # Assign logger
 log = logging.getLogger('PlanetProfile')
 
 def AlfvenWingField(Planet, Params, magData, modelData):
     # Calculate shape, current distribution, and magnetic field from Alfven wings
     # after Khurana et al. (1997): https://doi.org/10.1029/97GL02507
-    RionosTop_km = (Planet.Bulk.R_m + Planet.Magnetic.ionosBounds_m[
-        -1]) / 1e3  # Radius of the top of the ionosphere, where Alfven wings intersect it
-    rhoRings_km = RionosTop_km * np.cos(np.radians(Planet.Magnetic.latAlfvenIntersect_deg))
-    zRings_km = RionosTop_km * np.sin(np.radians(Planet.Magnetic.latAlfvenIntersect_deg))
-    phiStarts, DeltaPhi = np.linspace(0, 2 * np.pi, Params.Trajec.nWiresAlfven, endpoint=False,
-                                      retstep=True)
-    phiEnds = phiStarts + DeltaPhi
-    phiMids = phiStarts + DeltaPhi/2
-
-    S3frame = spiceS3coords[Planet.parent]
-    IAUframe = f'IAU_{Planet.bodyname.upper()}'
-    phiOframe = f'{Planet.bodyname.upper()}_PHI_OMEGA'
+    # All flybys are evaluated together as one concatenated set of points by EvalAlfvenWings.
+    RionosTop_km, rhoRings_km, zRings_km, phiStarts, _, _, _ = GetAlfvenRings(Planet, Params)
+    R_km = Planet.Bulk.R_m / 1e3
 
+    fbList, xyzPhiO_km, BxyzMoonPhiO_nT, zSignCA, rotPhiO2IAU, nPlasmaAmbient_pcc, IoverImax = ([] for _ in range(7))
     for scName in modelData.ets.keys():
         modelData.wireAlfven_RP[scName], modelData.BxIAUpls_nT[scName], modelData.ByIAUpls_nT[scName], modelData.BzIAUpls_nT[scName], \
             modelData.IwireRings_A[scName], modelData.IwireWings_A[scName] = ({} for _ in range(6))
@@ -47,286 +31,318 @@ def AlfvenWingField(Planet, Params, magData, modelData):
                 Planet.Magnetic.nPlasmaAmbient_pcc[scName][fbID] = Planet.Magnetic.nPlasmaAmbientDefault_pcc
 
             npts = np.size(modelData.ets[scName][fbID])
-            # Get index of et nearest CA
-            FlybyCA = GetFlybyCA()
-            iCA = np.argmin(modelData.ets[scName][fbID] - FlybyCA[scName].etCA[Planet.bodyname][fbID])
+            # Get trajectory geometry in PhiO frame, which is the same for every interior model
+            geom = GetGeomPhiO(Planet, magData, modelData, scName, fbID)
+            iCA = geom['iCA']
+            BxyzMoonCA_nT = geom['BxyzMoonPhiO_nT'][iCA, :]
 
+            fbList.append((scName, fbID, npts))
+            xyzPhiO_km.append(geom['xyzPhiO_km'])
+            rotPhiO2IAU.append(geom['rotPhiO2IAU'])
             if Params.Trajec.FIXED_ALFVEN:
-                # Get background field needed to find the direction of Alfven wing (often called "Alfven characteristic") at CA
-                BxyzMoonPhiO_nT = np.squeeze(RotateFrame(np.vstack([
-                    magData[scName].BxS3moon_nT[fbID][iCA],
-                    magData[scName].ByS3moon_nT[fbID][iCA],
-                    magData[scName].BzS3moon_nT[fbID][iCA]
-                ]).T, modelData.ets[scName][fbID][iCA], S3frame, phiOframe))
-                BmoonBGmag_nT = np.sqrt(BxyzMoonPhiO_nT[0]**2 + BxyzMoonPhiO_nT[1]**2 + BxyzMoonPhiO_nT[2]**2)
-                uBxMoonPhiO = BxyzMoonPhiO_nT[0] / BmoonBGmag_nT
-                uByMoonPhiO = BxyzMoonPhiO_nT[1] / BmoonBGmag_nT
-                uBzMoonPhiO = BxyzMoonPhiO_nT[2] / BmoonBGmag_nT
-                wireStartUpperPhiO_km, wireStartLowerPhiO_km, ringMidsUpperPhiO_km, ringMidsLowerPhiO_km, \
-                    ringMidsEqPhiO_km \
-                    = GetWingIntersectsFixed(Params.Trajec.nWiresAlfven, RionosTop_km, rhoRings_km,
-                    zRings_km, phiStarts, phiMids, uBzMoonPhiO)
-
-
+                # Use background field at CA to find the direction of Alfven wing (often called "Alfven characteristic")
+                BxyzMoonPhiO_nT.append(np.tile(BxyzMoonCA_nT, (npts, 1)))
             else:
-                # Get background field needed to find the direction of Alfven wing (often called "Alfven characteristic")
-                BxyzMoonPhiO_nT = RotateFrame(np.ascontiguousarray(np.vstack((
-                    magData[scName].BxS3moon_nT[fbID],
-                    magData[scName].ByS3moon_nT[fbID],
-                    magData[scName].BzS3moon_nT[fbID]
-                )).T), modelData.ets[scName][fbID], S3frame, phiOframe)
-                BmoonBGmag_nT = np.sqrt(BxyzMoonPhiO_nT[:,0]**2 + BxyzMoonPhiO_nT[:,1]**2 + BxyzMoonPhiO_nT[:,2]**2)
-                uBxMoonPhiO = BxyzMoonPhiO_nT[:, 0] / BmoonBGmag_nT
-                uByMoonPhiO = BxyzMoonPhiO_nT[:, 1] / BmoonBGmag_nT
-                uBzMoonPhiO = BxyzMoonPhiO_nT[:, 2] / BmoonBGmag_nT
-                wireStartUpperPhiO_km, wireStartLowerPhiO_km, ringMidsUpperPhiO_km, ringMidsLowerPhiO_km, \
-                    ringMidsEqPhiO_km \
-                    = GetWingIntersectsVariable(Params.Trajec.nWiresAlfven, RionosTop_km, rhoRings_km,
-                    zRings_km, phiStarts, phiMids, uBzMoonPhiO[iCA])
-
-            # Transform SC trajectory to PhiO frame
-            xyzPhiO_km = RotateFrame(np.ascontiguousarray(np.vstack((
-                magData[scName].x_km[fbID],
-                magData[scName].y_km[fbID],
-                magData[scName].z_km[fbID]
-            )).T), modelData.ets[scName][fbID], IAUframe, phiOframe)
-            rhoPhiO_km = np.sqrt(xyzPhiO_km[:, 0]**2 + xyzPhiO_km[:, 1]**2)
-
-            # Get direction of each characteristic in PhiO frame
-            rhoPlasmaAmbient_kgm3 = Planet.Magnetic.nPlasmaAmbient_pcc[scName][fbID] * 1e3 \
-                                    * Planet.Magnetic.mPlasmaAmbientAvg_gmol / Constants.NAvo
-            vAlfven_kms = BmoonBGmag_nT * 1e-12 / np.sqrt(Constants.mu0 * rhoPlasmaAmbient_kgm3)
-            dirAlfvenxUpper = Planet.Magnetic.vPlasmaAmbient_kms - uBxMoonPhiO * vAlfven_kms
-            dirAlfvenyUpper = -uByMoonPhiO * vAlfven_kms
-            dirAlfvenzUpper = -uBzMoonPhiO * vAlfven_kms
-            AlfvenUpperNorm = np.sqrt(dirAlfvenxUpper**2 + dirAlfvenyUpper**2 + dirAlfvenzUpper**2)
-            dirAlfvenxLower = Planet.Magnetic.vPlasmaAmbient_kms + uBxMoonPhiO * vAlfven_kms
-            dirAlfvenyLower = uByMoonPhiO * vAlfven_kms
-            dirAlfvenzLower = uBzMoonPhiO * vAlfven_kms
-            AlfvenLowerNorm = np.sqrt(dirAlfvenxLower**2 + dirAlfvenyLower**2 + dirAlfvenzLower**2)
-            uAlfvenUpperPhiO = np.ascontiguousarray(np.vstack((
-                dirAlfvenxUpper / AlfvenUpperNorm,
-                dirAlfvenyUpper / AlfvenUpperNorm,
-                dirAlfvenzUpper / AlfvenUpperNorm
-            )).T)
-            uAlfvenLowerPhiO = np.ascontiguousarray(np.vstack((
-                dirAlfvenxLower / AlfvenLowerNorm,
-                dirAlfvenyLower / AlfvenLowerNorm,
-                dirAlfvenzLower / AlfvenLowerNorm
-            )).T)
-
-            # Transform coordinates to wire frames
-            angUpper_rad = np.arccos(uAlfvenUpperPhiO[:, 2])
-            angLower_rad = np.arccos(uAlfvenLowerPhiO[:, 2])
-            rotAxisUpper = np.squeeze(np.cross([0, 0, 1], uAlfvenUpperPhiO))
-            rotAxisLower = np.squeeze(np.cross([0, 0, 1], uAlfvenLowerPhiO))
-            xyzWireUpper_km = np.array(
-                [RotateFrameManual(xyzPhiO_km, rotAxisUpper, angUpper_rad, O=wireStart) for
-                 wireStart in wireStartUpperPhiO_km])
-            xyzWireLower_km = np.array(
-                [RotateFrameManual(xyzPhiO_km, rotAxisLower, angLower_rad, O=wireStart) for
-                 wireStart in wireStartLowerPhiO_km])
-
-            # Calculate current in each wire
-            Imax_A = 4 * Planet.Magnetic.vPlasmaAmbient_kms * RionosTop_km * 1e6 * np.sqrt(
-                rhoPlasmaAmbient_kgm3 / Constants.mu0)
-            Itotal_A = Imax_A * Planet.Magnetic.IoverImax[scName][fbID]
-            Iwire_A = 1/2 * Itotal_A * np.sin(phiStarts)
-            IwireRing_A = 1/2 * Itotal_A/3 * np.cos(phiStarts)
+                # Use background field at each point to find the direction of Alfven wing
+                BxyzMoonPhiO_nT.append(geom['BxyzMoonPhiO_nT'])
+            # Alfven wing footprints are always placed according to the background field at CA
+            zSignCA.append(np.full(npts, -np.sign(BxyzMoonCA_nT[2])))
+            nPlasmaAmbient_pcc.append(np.full(npts, Planet.Magnetic.nPlasmaAmbient_pcc[scName][fbID]))
+            IoverImax.append(np.full(npts, Planet.Magnetic.IoverImax[scName][fbID]))
+
+            # Record current in each wire
+            rhoPlasmaAmbient_kgm3 = GetRhoPlasma(Planet.Magnetic, Planet.Magnetic.nPlasmaAmbient_pcc[scName][fbID])
+            Iwire_A, IwireRing_A = GetWireCurrents(Planet.Magnetic, RionosTop_km, rhoPlasmaAmbient_kgm3,
+                                                   Planet.Magnetic.IoverImax[scName][fbID], phiStarts)
             modelData.IwireRings_A[scName][fbID] = IwireRing_A
             modelData.IwireWings_A[scName][fbID] = Iwire_A
 
             if Params.Trajec.FIXED_ALFVEN:
                 # Calculate wire positions in PhiO frame for plotting purposes, but only when there's only
                 # one Alfven wing to calculate per encounter
-                ringStartEqPhiO_km = np.ascontiguousarray(np.vstack((
+                uAlfvenUpperPhiO, uAlfvenLowerPhiO = GetAlfvenDirs(Planet.Magnetic, BxyzMoonCA_nT,
+                                                                   np.sqrt(np.sum(BxyzMoonCA_nT**2)), rhoPlasmaAmbient_kgm3)
+                wireStartUpperPhiO_km, wireStartLowerPhiO_km, _, _, _ \
+                    = GetWingIntersects(RionosTop_km, rhoRings_km, zRings_km, phiStarts, phiStarts,
+                                        np.array([-np.sign(BxyzMoonCA_nT[2])]))
+                wireStartUpperPhiO_km, wireStartLowerPhiO_km = (wireStartUpperPhiO_km[:, 0, :], wireStartLowerPhiO_km[:, 0, :])
+                ringStartEqPhiO_km = np.vstack((
                     RionosTop_km * np.cos(phiStarts),
                     RionosTop_km * np.sin(phiStarts),
                     np.zeros(Params.Trajec.nWiresAlfven)
-                )).T)
-                wireEndUpperPhiO_km = np.squeeze(np.array(
-                    [wireStart + uAlfvenUpperPhiO * Planet.Bulk.R_m / 1e3 * FigMisc.LAlfven_RP for
-                     wireStart in wireStartUpperPhiO_km]))
-                wireEndLowerPhiO_km = np.squeeze(np.array(
-                    [wireStart + uAlfvenLowerPhiO * Planet.Bulk.R_m / 1e3 * FigMisc.LAlfven_RP for
-                     wireStart in wireStartLowerPhiO_km]))
-                R_km = Planet.Bulk.R_m / 1e3
+                )).T
+                wireEndUpperPhiO_km = wireStartUpperPhiO_km + uAlfvenUpperPhiO * R_km * FigMisc.LAlfven_RP
+                wireEndLowerPhiO_km = wireStartLowerPhiO_km + uAlfvenLowerPhiO * R_km * FigMisc.LAlfven_RP
                 # Transform wire locations to IAU coordinates and store in modelData
-                modelData.wireAlfven_RP[scName][fbID]['upperRing'] = np.squeeze(np.array(
-                    [RotateFrame(wireStart[np.newaxis, :], modelData.ets[scName][fbID][iCA], phiOframe, IAUframe) for
-                     wireStart in wireStartUpperPhiO_km])) / R_km
-                modelData.wireAlfven_RP[scName][fbID]['lowerRing'] = np.squeeze(np.array(
-                    [RotateFrame(wireStart[np.newaxis, :], modelData.ets[scName][fbID][iCA], phiOframe, IAUframe) for
-                     wireStart in wireStartLowerPhiO_km])) / R_km
-                modelData.wireAlfven_RP[scName][fbID]['eqRing'] = np.squeeze(np.array(
-                    [RotateFrame(wireStart[np.newaxis, :], modelData.ets[scName][fbID][iCA], phiOframe, IAUframe) for
-                     wireStart in ringStartEqPhiO_km])) / R_km
-                modelData.wireAlfven_RP[scName][fbID]['upperEnd'] = np.squeeze(np.array(
-                    [RotateFrame(wireStart[np.newaxis, :], modelData.ets[scName][fbID][iCA], phiOframe, IAUframe) for
-                     wireStart in wireEndUpperPhiO_km])) / R_km
-                modelData.wireAlfven_RP[scName][fbID]['lowerEnd'] = np.squeeze(np.array(
-                    [RotateFrame(wireStart[np.newaxis, :], modelData.ets[scName][fbID][iCA], phiOframe, IAUframe) for
-                     wireStart in wireEndLowerPhiO_km])) / R_km
-
-            # Use Biot-Savart to determine Bxy at SC position in wing frames from wing currents
-            # Start with catch for if we are very close to any wire
-            rhoWireUpper_km = np.sqrt(xyzWireUpper_km[..., 0]**2 + xyzWireUpper_km[..., 1]**2)
-            thetaWireUpper_rad = np.arctan(rhoWireUpper_km / xyzWireUpper_km[..., 2])
-            rhoWireLower_km = np.sqrt(xyzWireLower_km[..., 0]**2 + xyzWireLower_km[..., 1]**2)
-            thetaWireLower_rad = np.arctan2(rhoWireLower_km, xyzWireLower_km[..., 2])
-            phiWireUpper_rad = np.arctan2(xyzWireUpper_km[..., 1], xyzWireUpper_km[..., 0])
-            phiWireLower_rad = np.arctan2(xyzWireLower_km[..., 1], xyzWireLower_km[..., 0])
-
-            # Get prefactors common to all wires
-            # 1e6 factor in the below is for 1e-3 from m -> km in denominator and 1e-9 for T -> nT
-            BwirePre_nTkm = Constants.mu0 * Iwire_A / 4/np.pi * 1e6
-            # Initialize Bphi
-            BphiWingUpper_nT = np.zeros_like(rhoWireUpper_km)
-            BphiWingLower_nT = np.zeros_like(rhoWireLower_km)
-            for i, Bpre in enumerate(BwirePre_nTkm):
-                # Evaluate near-wire points
-                jCloseToWireUpper = rhoWireUpper_km[i, :] < Planet.Magnetic.dWireAlfven_RP / 2
-                jCloseToWireLower = rhoWireLower_km[i, :] < Planet.Magnetic.dWireAlfven_RP / 2
-                BphiWingUpper_nT[i, jCloseToWireUpper] = Bpre \
-                    * (1 + np.cos(thetaWireUpper_rad[i, jCloseToWireUpper])) * 8 \
-                    * rhoWireUpper_km[i, jCloseToWireUpper] / Planet.Magnetic.dWireAlfven_RP ** 2
-                BphiWingLower_nT[i, jCloseToWireLower] = Bpre \
-                    * (1 + np.cos(thetaWireLower_rad[i, jCloseToWireLower])) * 8 \
-                    * rhoWireLower_km[i, jCloseToWireLower] / Planet.Magnetic.dWireAlfven_RP ** 2
-                # Evaluate remaining points
-                jNotCloseUpper = np.logical_not(jCloseToWireUpper)
-                jNotCloseLower = np.logical_not(jCloseToWireLower)
-                BphiWingUpper_nT[i, jNotCloseUpper] = Bpre \
-                    * (1 + np.cos(thetaWireUpper_rad[i, jNotCloseUpper])) / rhoWireUpper_km[i, jNotCloseUpper]
-                BphiWingLower_nT[i, jNotCloseLower] = Bpre \
-                    * (1 + np.cos(thetaWireLower_rad[i, jNotCloseLower])) / rhoWireLower_km[i, jNotCloseLower]
-
-            # Get Bx, By in PhiO frame from wire frames
-            BxWingUpper_nT = np.sum(BphiWingUpper_nT * np.cos(phiWireUpper_rad), axis=0)
-            ByWingUpper_nT = np.sum(BphiWingUpper_nT * np.sin(phiWireUpper_rad), axis=0)
-            BxWingLower_nT = np.sum(BphiWingLower_nT * np.cos(phiWireLower_rad), axis=0)
-            ByWingLower_nT = np.sum(BphiWingLower_nT * np.sin(phiWireLower_rad), axis=0)
-
-            # Use rotation-only condition to find Bz component in wing frames
-            BzWingUpper_nT = -np.sqrt(BmoonBGmag_nT**2 - BxWingUpper_nT**2 - ByWingUpper_nT**2)
-            BzWingLower_nT = -np.sqrt(BmoonBGmag_nT**2 - BxWingLower_nT**2 - ByWingLower_nT**2)
-
-            # Transform back to PhiO frame
-            BxyzWingUpper_nT = np.ascontiguousarray(np.vstack((
-                BxWingUpper_nT,
-                ByWingUpper_nT,
-                BzWingUpper_nT
-            )).T)
-            BxyzWingLower_nT = np.ascontiguousarray(np.vstack((
-                BxWingLower_nT,
-                ByWingLower_nT,
-                BzWingLower_nT
-            )).T)
-            BwingUpperPhiO_nT = RotateFrameManual(BxyzWingUpper_nT, rotAxisUpper, -angUpper_rad)
-            BwingLowerPhiO_nT = RotateFrameManual(BxyzWingLower_nT, rotAxisLower, -angLower_rad)
-
-            # Add contribution from ring currents using Biot-Savart in PhiO frame
-            rEvalUpper_km = np.array([xyzPhiO_km - ringMidsUpper for ringMidsUpper in ringMidsUpperPhiO_km])
-            rEvalLower_km = np.array([xyzPhiO_km - ringMidsLower for ringMidsLower in ringMidsLowerPhiO_km])
-            rEvalMid_km   = np.array([xyzPhiO_km - ringMidsEq    for ringMidsEq    in ringMidsEqPhiO_km])
-            rFactorUpper_km2 = np.sqrt(rEvalUpper_km[..., 0]**2 + rEvalUpper_km[..., 1]**2 \
-                                       + rEvalUpper_km[..., 2]**2)**3 / rhoRings_km
-            rFactorLower_km2 = np.sqrt(rEvalLower_km[..., 0]**2 + rEvalLower_km[..., 1]**2 \
-                                       + rEvalLower_km[..., 2]**2)**3 / rhoRings_km
-            rFactorMid_km2 = np.sqrt(rEvalMid_km[..., 0]**2 + rEvalMid_km[..., 1]**2 \
-                                     + rEvalMid_km[..., 2]**2)**3 / RionosTop_km
-            # 1e6 factor in the below is for 1e-3 from m -> km in denominator and 1e-9 for T -> nT
-            B0rings_nTkm = Constants.mu0 / 4/np.pi * 1e6 * IwireRing_A
-            xPhis = (DeltaPhi/2 + (np.sin(2*phiEnds) - np.sin(2*phiStarts)) / 4)
-            yPhis = (np.cos(2*phiStarts) - np.cos(2*phiEnds)) / 4
-            BxRings_nT = np.sum(np.array([
-                B0rings_nTkm * (rEvalUpper_km[:, i, 2] - zRings_km) * xPhis / rFactorUpper_km2[:, i]
-              + B0rings_nTkm * rEvalMid_km[:, i, 2] * xPhis / rFactorMid_km2[:, i]
-              + B0rings_nTkm * (rEvalLower_km[:, i, 2] + zRings_km) * xPhis / rFactorLower_km2[:, i]
-                for i in range(npts)]), axis=1)
-            ByRings_nT = np.sum(B0rings_nTkm * np.array([
-                (rEvalUpper_km[:, i, 2] - zRings_km) * yPhis / rFactorUpper_km2[:, i]
-              + rEvalMid_km[:, i, 2] * yPhis / rFactorMid_km2[:, i]
-              + (rEvalLower_km[:, i, 2] + zRings_km) * yPhis / rFactorLower_km2[:, i]
-                for i in range(npts)]), axis=1)
-            BzRings_nT = 2*np.pi * np.sum(B0rings_nTkm * np.array([
-                (rhoRings_km - rho)    / rFactorUpper_km2[:, i]
-              + (RionosTop_km - rho) / rFactorMid_km2[:, i]
-              + (rhoRings_km - rho)    / rFactorLower_km2[:, i]
-                for i, rho in enumerate(rhoPhiO_km)]), axis=1)
-
-            # Sum wire current contributions and ring current contributions
-            BxPhiO_nT = BwingUpperPhiO_nT[:, 0] + BxRings_nT + BwingLowerPhiO_nT[:, 0]
-            ByPhiO_nT = BwingUpperPhiO_nT[:, 1] + ByRings_nT + BwingLowerPhiO_nT[:, 1]
-            BzPhiO_nT = BwingUpperPhiO_nT[:, 2] + BzRings_nT + BwingLowerPhiO_nT[:, 2]
-
-            # Transform back to IAU frame
-            BxyzIAU_nT = RotateFrame(np.ascontiguousarray(np.vstack((
-                BxPhiO_nT,
-                ByPhiO_nT,
-                BzPhiO_nT
-            )).T), modelData.ets[scName][fbID], phiOframe, IAUframe)
-
-            # Record in modelData
+                rotCA = geom['rotPhiO2IAU'][iCA]
+                modelData.wireAlfven_RP[scName][fbID]['upperRing'] = wireStartUpperPhiO_km @ rotCA.T / R_km
+                modelData.wireAlfven_RP[scName][fbID]['lowerRing'] = wireStartLowerPhiO_km @ rotCA.T / R_km
+                modelData.wireAlfven_RP[scName][fbID]['eqRing'] = ringStartEqPhiO_km @ rotCA.T / R_km
+                modelData.wireAlfven_RP[scName][fbID]['upperEnd'] = wireEndUpperPhiO_km @ rotCA.T / R_km
+                modelData.wireAlfven_RP[scName][fbID]['lowerEnd'] = wireEndLowerPhiO_km @ rotCA.T / R_km
+
+    if len(fbList) > 0:
+        BxyzIAU_nT = EvalAlfvenWings(Planet, Params, np.concatenate(xyzPhiO_km), np.concatenate(BxyzMoonPhiO_nT),
+                                     np.concatenate(zSignCA), np.concatenate(rotPhiO2IAU),
+                                     np.concatenate(nPlasmaAmbient_pcc), np.concatenate(IoverImax))[0, ...]
+
+        # Split back out into individual flybys and record in modelData
+        iStart = 0
+        for scName, fbID, npts in fbList:
+            iEnd = iStart + npts
             modelData.BxIAUpls_nT[scName][fbID], modelData.ByIAUpls_nT[scName][fbID], modelData.BzIAUpls_nT[scName][fbID] = (
-                BxyzIAU_nT[:, 0], BxyzIAU_nT[:, 1], BxyzIAU_nT[:, 2])
+                BxyzIAU_nT[iStart:iEnd, 0], BxyzIAU_nT[iStart:iEnd, 1], BxyzIAU_nT[iStart:iEnd, 2])
+            iStart = iEnd
 
     return modelData
 
 
-def GetWingIntersectsFixed(nWires, RionosTop_km, rhoRings_km, zRings_km, phiStarts, phiMids, uBzMoonPhiO):
-    
-    onePhis = np.ones(nWires)
-    # Get the points of ionosphere--current wire intersect points in PhiO coordinates
-    wireStartUpperPhiO_km = np.ascontiguousarray(np.vstack((
-        rhoRings_km * np.cos(phiStarts),
-        rhoRings_km * np.sin(phiStarts),
-        zRings_km * -np.sign(uBzMoonPhiO) * onePhis
-    )).T)
-    wireStartLowerPhiO_km = wireStartUpperPhiO_km + np.zeros_like(wireStartUpperPhiO_km)
-    wireStartLowerPhiO_km[:, 2] *= -1
-    # Get eval locations for points in ring currents that close Alfven wing currents
-    ringMidsUpperPhiO_km = np.ascontiguousarray(np.vstack((
-        rhoRings_km * np.cos(phiMids),
-        rhoRings_km * np.sin(phiMids),
-        zRings_km * -np.sign(uBzMoonPhiO) * onePhis
-    )).T)
-    ringMidsLowerPhiO_km = ringMidsUpperPhiO_km + np.zeros_like(ringMidsUpperPhiO_km)
-    ringMidsLowerPhiO_km[:, 2] *= -1
-    ringMidsEqPhiO_km = np.ascontiguousarray(np.vstack((
-        RionosTop_km * np.cos(phiMids),
-        RionosTop_km * np.sin(phiMids),
-        onePhis * 0
-    )).T)
+def EvalAlfvenWings(Planet, Params, xyzPhiO_km, BxyzMoonPhiO_nT, zSignCA, rotPhiO2IAU, nPlasmaAmbient_pcc, IoverImax):
+    """ Evaluate the magnetic field from Alfven wing and ring currents at a concatenated set
+        of points, which may span any number of flybys. Plasma parameters are broadcast against
+        a leading axis of parameter sets, so that a whole grid of plasma parameters is evaluated
+        in one batch.
 
-    return wireStartUpperPhiO_km, wireStartLowerPhiO_km, ringMidsUpperPhiO_km, ringMidsLowerPhiO_km, \
-        ringMidsEqPhiO_km
+        Args:
+            xyzPhiO_km (float, shape Nx3): Spacecraft positions in PhiO frame
+            BxyzMoonPhiO_nT (float, shape Nx3): Background field at the moon used to find
+                Alfven wing directions at each point, in PhiO frame
+            zSignCA (float, shape N): Sign of z for the northern ring, opposite to the background
+                field z component at closest approach for the flyby each point belongs to
+            rotPhiO2IAU (float, shape Nx3x3): Rotation matrices from PhiO to IAU frame at each point
+            nPlasmaAmbient_pcc (float, shape N or nSets x N): Ambient plasma number density
+            IoverImax (float, shape N or nSets x N): Fraction of the maximum Alfven current
+        Returns:
+            BxyzIAU_nT (float, shape nSets x N x 3): Alfven wing magnetic field in IAU frame
+    """
+    RionosTop_km, rhoRings_km, zRings_km, phiStarts, phiEnds, phiMids, DeltaPhi = GetAlfvenRings(Planet, Params)
+    nPlasmaAmbient_pcc = np.atleast_2d(nPlasmaAmbient_pcc)
+    IoverImax = np.atleast_2d(IoverImax)
+
+    # Get direction of each characteristic in PhiO frame, with shape nSets x N x 3
+    BmoonBGmag_nT = np.sqrt(np.sum(BxyzMoonPhiO_nT**2, axis=-1))
+    rhoPlasmaAmbient_kgm3 = GetRhoPlasma(Planet.Magnetic, nPlasmaAmbient_pcc)
+    uAlfvenUpperPhiO, uAlfvenLowerPhiO = GetAlfvenDirs(Planet.Magnetic, BxyzMoonPhiO_nT[np.newaxis, ...],
+                                                       BmoonBGmag_nT[np.newaxis, :], rhoPlasmaAmbient_kgm3)
+
+    # Get wire and ring geometry, with shape nWires x N x 3
+    wireStartUpperPhiO_km, wireStartLowerPhiO_km, ringMidsUpperPhiO_km, ringMidsLowerPhiO_km, ringMidsEqPhiO_km \
+        = GetWingIntersects(RionosTop_km, rhoRings_km, zRings_km, phiStarts, phiMids, zSignCA)
+
+    # Transform coordinates to wire frames, with shape nSets x nWires x N x 3
+    angUpper_rad = np.arccos(uAlfvenUpperPhiO[..., 2])
+    angLower_rad = np.arccos(uAlfvenLowerPhiO[..., 2])
+    rotAxisUpper = np.cross([0, 0, 1], uAlfvenUpperPhiO)
+    rotAxisLower = np.cross([0, 0, 1], uAlfvenLowerPhiO)
+    xyzWireUpper_km = np.einsum('snij,wnj->swni', GetRotMatsManual(rotAxisUpper, angUpper_rad),
+                                xyzPhiO_km[np.newaxis, ...] - wireStartUpperPhiO_km)
+    xyzWireLower_km = np.einsum('snij,wnj->swni', GetRotMatsManual(rotAxisLower, angLower_rad),
+                                xyzPhiO_km[np.newaxis, ...] - wireStartLowerPhiO_km)
+
+    # Calculate current in each wire, with shape nSets x nWires x N
+    Iwire_A, IwireRing_A = GetWireCurrents(Planet.Magnetic, RionosTop_km, rhoPlasmaAmbient_kgm3[:, np.newaxis, :],
+                                           IoverImax[:, np.newaxis, :], phiStarts[np.newaxis, :, np.newaxis])
+
+    # Use Biot-Savart to determine Bxy at SC position in wing frames from wing currents
+    rhoWireUpper_km = np.sqrt(xyzWireUpper_km[..., 0]**2 + xyzWireUpper_km[..., 1]**2)
+    thetaWireUpper_rad = np.arctan(rhoWireUpper_km / xyzWireUpper_km[..., 2])
+    rhoWireLower_km = np.sqrt(xyzWireLower_km[..., 0]**2 + xyzWireLower_km[..., 1]**2)
+    thetaWireLower_rad = np.arctan2(rhoWireLower_km, xyzWireLower_km[..., 2])
+    phiWireUpper_rad = np.arctan2(xyzWireUpper_km[..., 1], xyzWireUpper_km[..., 0])
+    phiWireLower_rad = np.arctan2(xyzWireLower_km[..., 1], xyzWireLower_km[..., 0])
+
+    # 1e6 factor in the below is for 1e-3 from m -> km in denominator and 1e-9 for T -> nT
+    BwirePre_nTkm = Constants.mu0 * Iwire_A / 4/np.pi * 1e6
+    BphiWingUpper_nT = WireBphi(BwirePre_nTkm, rhoWireUpper_km, thetaWireUpper_rad, Planet.Magnetic.dWireAlfven_RP)
+    BphiWingLower_nT = WireBphi(BwirePre_nTkm, rhoWireLower_km, thetaWireLower_rad, Planet.Magnetic.dWireAlfven_RP)
 
+    # Get Bx, By in PhiO frame from wire frames, summing over wires
+    BxWingUpper_nT = np.sum(BphiWingUpper_nT * np.cos(phiWireUpper_rad), axis=1)
+    ByWingUpper_nT = np.sum(BphiWingUpper_nT * np.sin(phiWireUpper_rad), axis=1)
+    BxWingLower_nT = np.sum(BphiWingLower_nT * np.cos(phiWireLower_rad), axis=1)
+    ByWingLower_nT = np.sum(BphiWingLower_nT * np.sin(phiWireLower_rad), axis=1)
 
-def GetWingIntersectsVariable(nWires, RionosTop_km, rhoRings_km, zRings_km, phiStarts, phiMids, uBzMoonPhiO):
-    
-    onePhis = np.ones(nWires)
+    # Use rotation-only condition to find Bz component in wing frames
+    BzWingUpper_nT = -np.sqrt(BmoonBGmag_nT**2 - BxWingUpper_nT**2 - ByWingUpper_nT**2)
+    BzWingLower_nT = -np.sqrt(BmoonBGmag_nT**2 - BxWingLower_nT**2 - ByWingLower_nT**2)
+
+    # Transform back to PhiO frame
+    BwingUpperPhiO_nT = np.einsum('snij,snj->sni', GetRotMatsManual(rotAxisUpper, -angUpper_rad),
+                                  np.stack((BxWingUpper_nT, ByWingUpper_nT, BzWingUpper_nT), axis=-1))
+    BwingLowerPhiO_nT = np.einsum('snij,snj->sni', GetRotMatsManual(rotAxisLower, -angLower_rad),
+                                  np.stack((BxWingLower_nT, ByWingLower_nT, BzWingLower_nT), axis=-1))
+
+    # Add contribution from ring currents using Biot-Savart in PhiO frame. Ring geometry is
+    # independent of plasma parameters, so only the currents carry the parameter set axis.
+    rhoPhiO_km = np.sqrt(xyzPhiO_km[:, 0]**2 + xyzPhiO_km[:, 1]**2)
+    rEvalUpper_km = xyzPhiO_km[np.newaxis, ...] - ringMidsUpperPhiO_km
+    rEvalLower_km = xyzPhiO_km[np.newaxis, ...] - ringMidsLowerPhiO_km
+    rEvalMid_km   = xyzPhiO_km[np.newaxis, ...] - ringMidsEqPhiO_km
+    rFactorUpper_km2 = np.sqrt(np.sum(rEvalUpper_km**2, axis=-1))**3 / rhoRings_km
+    rFactorLower_km2 = np.sqrt(np.sum(rEvalLower_km**2, axis=-1))**3 / rhoRings_km
+    rFactorMid_km2 = np.sqrt(np.sum(rEvalMid_km**2, axis=-1))**3 / RionosTop_km
+    # 1e6 factor in the below is for 1e-3 from m -> km in denominator and 1e-9 for T -> nT
+    B0rings_nTkm = Constants.mu0 / 4/np.pi * 1e6 * IwireRing_A
+    xPhis = (DeltaPhi/2 + (np.sin(2*phiEnds) - np.sin(2*phiStarts)) / 4)[:, np.newaxis]
+    yPhis = ((np.cos(2*phiStarts) - np.cos(2*phiEnds)) / 4)[:, np.newaxis]
+    zRingsFactor = (rEvalUpper_km[..., 2] - zRings_km) / rFactorUpper_km2 \
+                 + rEvalMid_km[..., 2] / rFactorMid_km2 \
+                 + (rEvalLower_km[..., 2] + zRings_km) / rFactorLower_km2
+    rhoRingsFactor = (rhoRings_km - rhoPhiO_km) / rFactorUpper_km2 \
+                   + (RionosTop_km - rhoPhiO_km) / rFactorMid_km2 \
+                   + (rhoRings_km - rhoPhiO_km) / rFactorLower_km2
+    BxRings_nT = np.sum(B0rings_nTkm * xPhis * zRingsFactor, axis=1)
+    ByRings_nT = np.sum(B0rings_nTkm * yPhis * zRingsFactor, axis=1)
+    BzRings_nT = 2*np.pi * np.sum(B0rings_nTkm * rhoRingsFactor, axis=1)
+
+    # Sum wire current contributions and ring current contributions
+    BxyzPhiO_nT = BwingUpperPhiO_nT + np.stack((BxRings_nT, ByRings_nT, BzRings_nT), axis=-1) + BwingLowerPhiO_nT
+
+    # Transform back to IAU frame
+    BxyzIAU_nT = np.einsum('nij,snj->sni', rotPhiO2IAU, BxyzPhiO_nT)
+
+    return BxyzIAU_nT
+
+
+def GetAlfvenRings(Planet, Params):
+    """ Get the radius, ring positions, and azimuthal wire divisions for Alfven wing footprints. """
+    RionosTop_km = (Planet.Bulk.R_m + Planet.Magnetic.ionosBounds_m[
+        -1]) / 1e3  # Radius of the top of the ionosphere, where Alfven wings intersect it
+    rhoRings_km = RionosTop_km * np.cos(np.radians(Planet.Magnetic.latAlfvenIntersect_deg))
+    zRings_km = RionosTop_km * np.sin(np.radians(Planet.Magnetic.latAlfvenIntersect_deg))
+    phiStarts, DeltaPhi = np.linspace(0, 2 * np.pi, Params.Trajec.nWiresAlfven, endpoint=False,
+                                      retstep=True)
+    phiEnds = phiStarts + DeltaPhi
+    phiMids = phiStarts + DeltaPhi/2
+
+    return RionosTop_km, rhoRings_km, zRings_km, phiStarts, phiEnds, phiMids, DeltaPhi
+
+
+def GetRhoPlasma(Magnetic, nPlasmaAmbient_pcc):
+    """ Get ambient plasma mass density in kg/m^3 from number density in particles/cc. """
+    return nPlasmaAmbient_pcc * 1e3 * Magnetic.mPlasmaAmbientAvg_gmol / Constants.NAvo
+
+
+def GetAlfvenDirs(Magnetic, BxyzMoonPhiO_nT, BmoonBGmag_nT, rhoPlasmaAmbient_kgm3):
+    """ Get unit vectors along the upper and lower Alfven characteristics in PhiO frame.
+        Inputs are broadcast against each other.
+
+        Returns:
+            uAlfvenUpperPhiO, uAlfvenLowerPhiO (float, shape ...x3): Alfven wing directions
+    """
+    uBxyzMoonPhiO = BxyzMoonPhiO_nT / BmoonBGmag_nT[..., np.newaxis]
+    vAlfven_kms = BmoonBGmag_nT * 1e-12 / np.sqrt(Constants.mu0 * rhoPlasmaAmbient_kgm3)
+    dirAlfvenUpper = -uBxyzMoonPhiO * vAlfven_kms[..., np.newaxis]
+    dirAlfvenUpper[..., 0] += Magnetic.vPlasmaAmbient_kms
+    dirAlfvenLower = uBxyzMoonPhiO * vAlfven_kms[..., np.newaxis]
+    dirAlfvenLower[..., 0] += Magnetic.vPlasmaAmbient_kms
+    uAlfvenUpperPhiO = dirAlfvenUpper / np.sqrt(np.sum(dirAlfvenUpper**2, axis=-1))[..., np.newaxis]
+    uAlfvenLowerPhiO = dirAlfvenLower / np.sqrt(np.sum(dirAlfvenLower**2, axis=-1))[..., np.newaxis]
+
+    return uAlfvenUpperPhiO, uAlfvenLowerPhiO
+
+
+def GetWireCurrents(Magnetic, RionosTop_km, rhoPlasmaAmbient_kgm3, IoverImax, phiStarts):
+    """ Get current in each Alfven wing wire and each ring segment. Inputs are broadcast
+        against each other.
+    """
+    Imax_A = 4 * Magnetic.vPlasmaAmbient_kms * RionosTop_km * 1e6 * np.sqrt(
+        rhoPlasmaAmbient_kgm3 / Constants.mu0)
+    Itotal_A = Imax_A * IoverImax
+    Iwire_A = 1/2 * Itotal_A * np.sin(phiStarts)
+    IwireRing_A = 1/2 * Itotal_A/3 * np.cos(phiStarts)
+
+    return Iwire_A, IwireRing_A
+
+
+def WireBphi(BwirePre_nTkm, rhoWire_km, thetaWire_rad, dWire):
+    """ Get the azimuthal field around each semi-infinite wire, with a linear taper for points
+        within the wire thickness dWire.
+    """
+    CLOSE = rhoWire_km < dWire / 2
+    # Avoid division by zero for points exactly on the wire, which use the near-wire form
+    rhoFactor = np.where(CLOSE, 8 * rhoWire_km / dWire**2, 1 / np.where(CLOSE, 1, rhoWire_km))
+
+    return BwirePre_nTkm * (1 + np.cos(thetaWire_rad)) * rhoFactor
+
+
+def GetGeomPhiO(Planet, magData, modelData, scName, fbID):
+    """ Get trajectory geometry needed for Alfven wing calculations for the given flyby:
+        the index of the point nearest closest approach, spacecraft positions and moon
+        background field in the PHI_OMEGA frame, and rotation matrices from PHI_OMEGA
+        back to the IAU frame at each time. These depend only on the flyby, so they are
+        evaluated with SPICE once and saved in modelData.geomPhiO.
+
+        Returns:
+            geom (dict): Keys iCA, xyzPhiO_km (nPts x 3), BxyzMoonPhiO_nT (nPts x 3),
+                and rotPhiO2IAU (nPts x 3 x 3).
+    """
+    if scName not in modelData.geomPhiO.keys():
+        modelData.geomPhiO[scName] = {}
+    if fbID not in modelData.geomPhiO[scName].keys():
+        S3frame = spiceS3coords[Planet.parent]
+        IAUframe = f'IAU_{Planet.bodyname.upper()}'
+        phiOframe = f'{Planet.bodyname.upper()}_PHI_OMEGA'
+        ets = modelData.ets[scName][fbID]
+
+        # Get index of et nearest CA
+        FlybyCA = GetFlybyCA()
+        iCA = np.argmin(ets - FlybyCA[scName].etCA[Planet.bodyname][fbID])
+
+        rotS32PhiO = np.array([spice.pxform(S3frame, phiOframe, et) for et in ets])
+        rotPhiO2IAU = np.array([spice.pxform(phiOframe, IAUframe, et) for et in ets])
+        BxyzMoonS3_nT = np.vstack((
+            magData[scName].BxS3moon_nT[fbID],
+            magData[scName].ByS3moon_nT[fbID],
+            magData[scName].BzS3moon_nT[fbID]
+        )).T
+        xyzIAU_km = np.vstack((
+            magData[scName].x_km[fbID],
+            magData[scName].y_km[fbID],
+            magData[scName].z_km[fbID]
+        )).T
+
+        modelData.geomPhiO[scName][fbID] = {
+            'iCA': iCA,
+            'BxyzMoonPhiO_nT': np.einsum('tij,tj->ti', rotS32PhiO, BxyzMoonS3_nT),
+            # Transpose of PhiO -> IAU rotation gives IAU -> PhiO
+            'xyzPhiO_km': np.einsum('tji,tj->ti', rotPhiO2IAU, xyzIAU_km),
+            'rotPhiO2IAU': rotPhiO2IAU
+        }
+
+    return modelData.geomPhiO[scName][fbID]
+
+
+def GetWingIntersects(RionosTop_km, rhoRings_km, zRings_km, phiStarts, phiMids, zSignCA):
+    """ Get the points where Alfven wing current wires intersect the ionosphere, and midpoints
+        of ring current segments, in PhiO coordinates, for each of a set of points with the
+        sign of the z coordinate for the northern ring given by zSignCA.
+
+        Returns:
+            wireStartUpperPhiO_km, wireStartLowerPhiO_km, ringMidsUpperPhiO_km, ringMidsLowerPhiO_km,
+                ringMidsEqPhiO_km (float, shape nWires x N x 3): Wire and ring segment locations
+    """
+    zSigns = np.asarray(zSignCA)[np.newaxis, :]
+    zeros = np.zeros((np.size(phiStarts), np.size(zSignCA)))
     # Get the points of ionosphere--current wire intersect points in PhiO coordinates
-    wireStartUpperPhiO_km = np.ascontiguousarray(np.vstack((
-        rhoRings_km * np.cos(phiStarts),
-        rhoRings_km * np.sin(phiStarts),
-        zRings_km * -np.sign(uBzMoonPhiO) * onePhis
-    )).T)
-    wireStartLowerPhiO_km = wireStartUpperPhiO_km + np.zeros_like(wireStartUpperPhiO_km)
-    wireStartLowerPhiO_km[:, 2] *= -1
+    wireStartUpperPhiO_km = np.stack((
+        zeros + rhoRings_km * np.cos(phiStarts)[:, np.newaxis],
+        zeros + rhoRings_km * np.sin(phiStarts)[:, np.newaxis],
+        zeros + zRings_km * zSigns
+    ), axis=-1)
+    wireStartLowerPhiO_km = wireStartUpperPhiO_km * [1, 1, -1]
     # Get eval locations for points in ring currents that close Alfven wing currents
-    ringMidsUpperPhiO_km = np.ascontiguousarray(np.vstack((
-        rhoRings_km * np.cos(phiMids),
-        rhoRings_km * np.sin(phiMids),
-        zRings_km * -np.sign(uBzMoonPhiO) * onePhis
-    )).T)
-    ringMidsLowerPhiO_km = ringMidsUpperPhiO_km + np.zeros_like(ringMidsUpperPhiO_km)
-    ringMidsLowerPhiO_km[:, 2] *= -1
-    ringMidsEqPhiO_km = np.ascontiguousarray(np.vstack((
-        RionosTop_km * np.cos(phiMids),
-        RionosTop_km * np.sin(phiMids),
-        onePhis * 0
-    )).T)
-    
+    ringMidsUpperPhiO_km = np.stack((
+        zeros + rhoRings_km * np.cos(phiMids)[:, np.newaxis],
+        zeros + rhoRings_km * np.sin(phiMids)[:, np.newaxis],
+        zeros + zRings_km * zSigns
+    ), axis=-1)
+    ringMidsLowerPhiO_km = ringMidsUpperPhiO_km * [1, 1, -1]
+    ringMidsEqPhiO_km = np.stack((
+        zeros + RionosTop_km * np.cos(phiMids)[:, np.newaxis],
+        zeros + RionosTop_km * np.sin(phiMids)[:, np.newaxis],
+        zeros
+    ), axis=-1)
+
     return wireStartUpperPhiO_km, wireStartLowerPhiO_km, ringMidsUpperPhiO_km, ringMidsLowerPhiO_km, \
         ringMidsEqPhiO_km
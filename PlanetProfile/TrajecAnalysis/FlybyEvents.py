@@ -5,7 +5,9 @@
 import logging
 import numpy as np
 import spiceypy as spice
+from scipy.optimize import minimize_scalar
 from PlanetProfile.GetConfig import Params
+from PlanetProfile.Utilities.defineStructs import EOSlist
 from PlanetProfile.TrajecAnalysis.SpiceFuncs import LoadKernels, BodyDist_km, BodyVel_kms, \
     spiceSCname
 
@@ -215,23 +217,35 @@ class FlybyCAStruct:
             print(f'{flybyID}: {tCA}')
                     
 
-def GetActualCA(spiceSCname, t_UTC, bodyname, range_min=5, res_s=0.001):
+def GetActualCA(spiceSCname, t_UTC, bodyname, range_min=5, res_s=0.001, coarseRes_s=1.0):
     # Look within +/- range_min of t_UTC to within res_s precision
     # to get the UTC time string of the closest approach.
+    # Distances are first sampled at coarseRes_s, then the minimum is
+    # refined by a bounded golden-section search around the nearest sample.
 
     spiceBody = bodyname.upper()
+    frame = f'IAU_{spiceBody}'
     etApprox = spice.str2et(t_UTC)
-    ets = np.arange(etApprox - range_min * 60, etApprox + range_min * 60, res_s)
-    pos, _ = spice.spkpos(spiceSCname, ets, f'IAU_{spiceBody}', 'NONE', spiceBody)
+    ets = np.arange(etApprox - range_min * 60, etApprox + range_min * 60, coarseRes_s)
+    pos, _ = spice.spkpos(spiceSCname, ets, frame, 'NONE', spiceBody)
     r_km = np.sqrt(pos[:,0]**2 + pos[:,1]**2 + pos[:,2]**2)
-    etCA = ets[np.argmin(r_km)]
+    iMin = np.argmin(r_km)
+
+    rFunc_km = lambda et: np.sqrt(np.sum(spice.spkpos(spiceSCname, et, frame, 'NONE', spiceBody)[0]**2))
+    bounds = (ets[max(iMin - 1, 0)], ets[min(iMin + 1, np.size(ets) - 1)])
+    etCA = minimize_scalar(rFunc_km, bounds=bounds, method='bounded', options={'xatol': res_s/2}).x
     tCA_UTC = spice.et2utc(etCA, 'ISOC', 3)
 
     return tCA_UTC
 
 
 def GetFlybyCA():
-    return {scName: FlybyCAStruct(scName) for scName in scNames}
+    # Closest approach info depends only on the loaded kernels, so construct it once
+    # per session and reuse it.
+    if 'FlybyCA' not in EOSlist.loaded.keys():
+        EOSlist.loaded['FlybyCA'] = {scName: FlybyCAStruct(scName) for scName in scNames}
+
+    return EOSlist.loaded['FlybyCA']
 
 if __name__ == '__main__':
     FlybyCA = GetFlybyCA()
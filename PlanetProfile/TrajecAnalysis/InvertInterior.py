@@ -12,23 +12,14 @@ from hdf5storage import savemat, loadmat
 from PlanetProfile.Main import WriteProfile, ReloadProfile, ExploreOgram, WriteExploreOgram, ReloadExploreOgram
 from PlanetProfile.GetConfig import Params
 from PlanetProfile.Utilities.SetupInit import SetupInversion
+from PlanetProfile.Utilities.PoolManager import PoolSession, GetPool, ReleasePool
 from PlanetProfile.Utilities.defineStructs import FitData, ModelDataStruct
 from PlanetProfile.TrajecAnalysis.MagneticFields import InitModelData, SetupMagnetic, \
-    CalcModelAndSumAll, CalcModelAmbient, CalcModelInduced, CalcModelPlasma
+    CalcModelAndSumAll, CalcModelAmbient, CalcModelInduced, CalcModelPlasma, PrecomputeTrajecGeometry
 from PlanetProfile.MagneticInduction.MagneticInduction import GetBexc
 from PlanetProfile.Utilities.SummaryTables import PrintTrajecFit, PrintTrajecTableLatex
 from PlanetProfile.Plotting.TrajecPlots import PlotFlybys
 
-# Parallel processing
-import multiprocessing as mtp
-import platform
-plat = platform.system()
-if plat == 'Windows':
-    mtpType = 'spawn'
-else:
-    mtpType = 'fork'
-mtpContext = mtp.get_context(mtpType)
-
 # Assign logger
 log = logging.getLogger('PlanetProfile')
 
@@ -63,8 +54,9 @@ def Invert(Params):
         # Initialize modelData object to be copied to each calc
         modelData = InitModelData(InitPlanet, Params, magData)
 
-        # Run grid of models and compare against data
-        PlanetGrid, InversionExploration = InvertOgram(InitPlanet, Params, magData, modelData)
+        # Run grid of models and compare against data, reusing the same workers throughout
+        with PoolSession(Params):
+            PlanetGrid, InversionExploration = InvertOgram(InitPlanet, Params, magData, modelData)
 
         # Find best fit from among inversion exploration
         iFitPlanet = np.unravel_index(np.nanargmin(InversionExploration.RMSe), np.shape(InversionExploration.RMSe))
@@ -114,6 +106,10 @@ def InvertOgram(InitPlanet, Params, magData, modelData):
     InversionExploration.Amp = np.array([[Planeti.Magnetic.Amp if Planeti.Magnetic.Amp is not None else invalidA for Planeti in line] for line in PlanetGrid])
     InversionExploration.phase = np.array([[Planeti.Magnetic.phase if Planeti.Magnetic.phase is not None else invalidA for Planeti in line] for line in PlanetGrid])
 
+    # Evaluate trajectory geometry once, so that it is carried to each grid cell with modelData
+    PlanetRef = next((Planeti for Planeti in PlanetGrid.flat if Planeti.Magnetic.nLin is not None), PlanetGrid[0,0])
+    modelData = PrecomputeTrajecGeometry(PlanetRef, Params, magData, modelData)
+
     # Get model data to copy over for when values are the same for each model
     modelData = CalcModelAmbient(PlanetGrid[0,0], Params, magData, modelData)
     modelData = CalcModelPlasma(PlanetGrid[0,0], Params, magData, modelData)
@@ -137,21 +133,23 @@ def GridFitCalcs(PlanetGrid, InversionExploration, Params, magData, modelDataIn)
 
     if Params.DO_PARALLEL:
         # Prevent slowdowns from competing process spawning when #cores > #jobs
-        nCores = np.min([Params.maxCores, np.prod(np.shape(PlanetList1D)), Params.threadLimit])
-        pool = mtpContext.Pool(nCores)
-        parResult = [pool.apply_async(FitFunc, (deepcopy(Planet), deepcopy(Params), deepcopy(magData), deepcopy(modelDataIn))) for Planet in
-                     PlanetList1D]
-        pool.close()
-        pool.join()
-
-        for i, result in enumerate(parResult):
-            FitDataList[i] = result.get()
+        nCells = np.size(PlanetList1D)
+        nCores = np.min([Params.maxCores, nCells, Params.threadLimit])
+        # Hand out grid cells in small chunks, so that workers that draw cheap cells (e.g. invalid
+        # models) pick up more work instead of waiting on a slow block of the grid. Each chunk of
+        # jobs is pickled together, so Params, magData, and modelData are sent once per chunk
+        # rather than once per grid cell.
+        chunksize = int(np.ceil(nCells / nCores / 4))
+        pool, SESSION = GetPool(nCores)
+        jobs = ((FitFunc, Planet, Params, magData, modelDataIn) for Planet in PlanetList1D)
+        for i, fit in enumerate(pool.imap(FitGridCell, jobs, chunksize=chunksize)):
+            FitDataList[i] = fit
+        ReleasePool(pool, SESSION)
 
     else:
         log.profile('Running grid without parallel processing. This may take some time.')
-        FitDataList = np.array(
-            [FitFunc(deepcopy(Planet), deepcopy(Params), deepcopy(magData), deepcopy(modelDataIn))
-             for Planet in PlanetList1D])
+        FitDataList = FitGridChunk(FitFunc, [deepcopy(Planet) for Planet in PlanetList1D], Params, magData,
+                                   deepcopy(modelDataIn))
 
     FitDataGrid = np.reshape(FitDataList, np.shape(PlanetGrid))
     InversionExploration.RMSe = np.array([[FitDatai.RMSe['total'] for FitDatai in line] for line in FitDataGrid])
@@ -162,6 +160,31 @@ def GridFitCalcs(PlanetGrid, InversionExploration, Params, magData, modelDataIn)
     return InversionExploration
 
 
+def FitGridCell(job):
+    """ Evaluate goodness of fit for a single grid cell in a parallel run. The job is a tuple
+        of (FitFunc, Planet, Params, magData, modelData). Cells within a chunk share the same
+        unpickled modelData, which is reused because each fit overwrites all the fields it
+        evaluates.
+    """
+    FitFunc, Planet, Params, magData, modelData = job
+    return FitFunc(Planet, Params, magData, modelData)
+
+
+def FitGridChunk(FitFunc, PlanetChunk, Params, magData, modelData):
+    """ Evaluate goodness of fit for each interior model in a chunk of grid cells. The same
+        modelData is reused for each model, because each fit overwrites all the fields it
+        evaluates.
+
+        Returns:
+            fits (FitData, shape N): Fit results for each Planet in PlanetChunk.
+    """
+    fits = np.empty(np.size(PlanetChunk), dtype=object)
+    for i, Planet in enumerate(PlanetChunk):
+        fits[i] = FitFunc(Planet, Params, magData, modelData)
+
+    return fits
+
+
 def FitModelInduced(Planet, Params, magData, modelData):
     # Ambient field and plasma field must be set in modelData or errors will result
 
@@ -1,21 +1,13 @@
 import logging
 import numpy as np
 from PlanetProfile.TrajecAnalysis.SpiceFuncs import BodyDist_km, RotateFrame, RotateFrameManual, spiceS3coords
-from PlanetProfile.TrajecAnalysis.Alfven import AlfvenWingField
+from PlanetProfile.TrajecAnalysis.Alfven import AlfvenWingField, GetGeomPhiO
 from PlanetProfile.Utilities.defineStructs import ModelDataStruct, Constants
 from PlanetProfile.GetConfig import FigMisc
+from PlanetProfile.Utilities.PoolManager import GetPool, ReleasePool
 from PlanetProfile.MagneticInduction.MagneticInduction import GetBexc
 from MoonMag.field_xyz import eval_Bi as EvalBi
 
-# Parallel processing
-import multiprocessing as mtp
-import platform
-plat = platform.system()
-if plat == 'Windows':
-    mtpType = 'spawn'
-else:
-    mtpType = 'fork'
-mtpContext = mtp.get_context(mtpType)
 # Assign logger
 log = logging.getLogger('PlanetProfile')
 
@@ -66,30 +58,14 @@ def CalcModelInduced(Planet, Params, magData, modelData):
     # TODO: Add option for evaluating the instantaneous induced field based on the complex amplitude
     #  from the instantaneous external field instead of excitation moments
 
-    Nnm = np.size(Planet.Magnetic.nLin)
-
     if isinstance(Planet.Magnetic.Benm_nT, dict):
         for scName, Binm_nT in Planet.Magnetic.Binm_nT.items():
             for fbID, ets in modelData.ets[scName].items():
-                Bix_nT, Biy_nT, Biz_nT = (np.zeros(np.size(ets), dtype=np.complex_)
-                                          for _ in range(3))
-
-                # Sum over all excitations and moments
-                for iExc in range(Planet.Magnetic.nExc[scName]):
-                    for iN in range(Nnm):
-                        this_Bx, this_By, this_Bz = EvalBi(Planet.Magnetic.nLin[iN],
-                            Planet.Magnetic.mLin[iN], Planet.Magnetic.BinmLin_nT[scName][iExc,iN],
-                            modelData.x_Rp[scName][fbID], modelData.y_Rp[scName][fbID],
-                            modelData.z_Rp[scName][fbID], modelData.r_Rp[scName][fbID],
-                            omega=Planet.Magnetic.omegaExc_radps[scName][iExc], t=ets)
-
-                        Bix_nT = Bix_nT + this_Bx
-                        Biy_nT = Biy_nT + this_By
-                        Biz_nT = Biz_nT + this_Bz
-
-                modelData.BxIAUind_nT[scName][fbID] = np.real(Bix_nT)
-                modelData.ByIAUind_nT[scName][fbID] = np.real(Biy_nT)
-                modelData.BzIAUind_nT[scName][fbID] = np.real(Biz_nT)
+                BiBasis = GetBiBasis(Planet.Magnetic.nLin, Planet.Magnetic.mLin, modelData, scName, fbID)
+                phases = GetExcPhases(Planet.Magnetic.omegaExc_radps[scName], modelData, scName, fbID)
+                modelData.BxIAUind_nT[scName][fbID], modelData.ByIAUind_nT[scName][fbID], \
+                    modelData.BzIAUind_nT[scName][fbID] \
+                    = EvalBiBatched(Planet.Magnetic.BinmLin_nT[scName], phases, BiBasis)
 
     else:
         if Params.Trajec.SCera is None:
@@ -98,27 +74,72 @@ def CalcModelInduced(Planet, Params, magData, modelData):
         else:
             scName = Params.Trajec.SCera
         for fbID, ets in modelData.ets[scName].items():
-            Bix_nT, Biy_nT, Biz_nT = (np.zeros(np.size(ets), dtype=np.complex_)
-                                      for _ in range(3))
+            BiBasis = GetBiBasis(Planet.Magnetic.nLin, Planet.Magnetic.mLin, modelData, scName, fbID)
+            phases = GetExcPhases(Planet.Magnetic.omegaExc_radps, modelData, scName, fbID)
+            modelData.BxIAUind_nT[scName][fbID], modelData.ByIAUind_nT[scName][fbID], \
+                modelData.BzIAUind_nT[scName][fbID] \
+                = EvalBiBatched(Planet.Magnetic.BinmLin_nT, phases, BiBasis)
 
-            # Sum over all excitations and moments
-            for iExc in range(Planet.Magnetic.nExc):
-                for iN in range(Nnm):
-                    this_Bx, this_By, this_Bz = EvalBi(Planet.Magnetic.nLin[iN],
-                        Planet.Magnetic.mLin[iN], Planet.Magnetic.BinmLin_nT[iExc,iN],
-                        modelData.x_Rp[scName][fbID], modelData.y_Rp[scName][fbID],
-                        modelData.z_Rp[scName][fbID], modelData.r_Rp[scName][fbID],
-                        omega=Planet.Magnetic.omegaExc_radps[iExc], t=ets)
+    return modelData
 
-                    Bix_nT = Bix_nT + this_Bx
-                    Biy_nT = Biy_nT + this_By
-                    Biz_nT = Biz_nT + this_Bz
 
-            modelData.BxIAUind_nT[scName][fbID] = np.real(Bix_nT)
-            modelData.ByIAUind_nT[scName][fbID] = np.real(Biy_nT)
-            modelData.BzIAUind_nT[scName][fbID] = np.real(Biz_nT)
+def GetBiBasis(nLin, mLin, modelData, scName, fbID):
+    """ Get the magnetic field from a unit induced moment for each (n, m) in nLin, mLin,
+        evaluated along the trajectory for the given flyby. The induced field is linear
+        in Binm, so this basis depends only on the trajectory and can be reused for every
+        interior model and every excitation. Results are saved in modelData.BiBasis, keyed
+        by the (n, m) values.
 
-    return modelData
+        Returns:
+            BiBasis (complex, shape Nnm x 3 x nPts): Bx, By, Bz in IAU frame for a
+                unit moment of each (n, m).
+    """
+    nmKey = (tuple(nLin), tuple(mLin))
+    if scName not in modelData.BiBasis.keys():
+        modelData.BiBasis[scName] = {}
+    if fbID not in modelData.BiBasis[scName].keys():
+        modelData.BiBasis[scName][fbID] = {}
+    if nmKey not in modelData.BiBasis[scName][fbID].keys():
+        x_Rp, y_Rp, z_Rp, r_Rp = (modelData.x_Rp[scName][fbID], modelData.y_Rp[scName][fbID],
+                                  modelData.z_Rp[scName][fbID], modelData.r_Rp[scName][fbID])
+        modelData.BiBasis[scName][fbID][nmKey] = np.array([EvalBi(n, m, 1, x_Rp, y_Rp, z_Rp, r_Rp)
+                                                           for n, m in zip(nLin, mLin)], dtype=np.complex_)
+
+    return modelData.BiBasis[scName][fbID][nmKey]
+
+
+def GetExcPhases(omegaExc_radps, modelData, scName, fbID):
+    """ Get the complex phases exp(-i*omega*t) of each excitation at each time along the
+        trajectory for the given flyby. These depend only on the flyby and excitation
+        periods, so they are saved in modelData.phasesExc, keyed by the excitation frequencies,
+        and reused for every interior model.
+
+        Returns:
+            phases (complex, shape nExc x nPts): Excitation phases along the trajectory.
+    """
+    omegaKey = tuple(np.atleast_1d(omegaExc_radps))
+    if scName not in modelData.phasesExc.keys():
+        modelData.phasesExc[scName] = {}
+    if fbID not in modelData.phasesExc[scName].keys():
+        modelData.phasesExc[scName][fbID] = {}
+    if omegaKey not in modelData.phasesExc[scName][fbID].keys():
+        modelData.phasesExc[scName][fbID][omegaKey] = np.exp(-1j * np.outer(omegaExc_radps,
+                                                                            modelData.ets[scName][fbID]))
+
+    return modelData.phasesExc[scName][fbID][omegaKey]
+
+
+def EvalBiBatched(BinmLin_nT, phases, BiBasis):
+    """ Evaluate the net induced field from all excitations and all moments along a
+        trajectory with a single tensor contraction, summing over excitations i and
+        moments j as Re{ sum_i sum_j Binm_ij * BiBasis_j * exp(-i*omega_i*t) }.
+
+        Returns:
+            Bix_nT, Biy_nT, Biz_nT (float, shape nPts): Induced field components.
+    """
+    Bi_nT = np.real(np.einsum('ij,jct,it->ct', BinmLin_nT, BiBasis, phases, optimize=True))
+
+    return Bi_nT[0, :], Bi_nT[1, :], Bi_nT[2, :]
 
 
 def CalcModelPlasma(Planet, Params, magData, modelData):
@@ -176,6 +197,29 @@ def InitModelData(Planet, Params, magData):
     return modelData
 
 
+def PrecomputeTrajecGeometry(Planet, Params, magData, modelData):
+    """ Evaluate all trajectory-dependent quantities used in fitting model fields to
+        the data: excitation phases, induced-field bases, and (for Alfven wing plasma
+        models) spacecraft positions, background field and frame rotations in the
+        PHI_OMEGA frame. None of these depend on the interior structure, so computing
+        them once here before modelData is copied to each grid cell avoids redoing the
+        same work for every candidate model.
+    """
+    for scName, etsList in modelData.ets.items():
+        if isinstance(Planet.Magnetic.omegaExc_radps, dict):
+            omegaExc_radps = Planet.Magnetic.omegaExc_radps[scName]
+        else:
+            omegaExc_radps = Planet.Magnetic.omegaExc_radps
+        for fbID in etsList.keys():
+            GetExcPhases(omegaExc_radps, modelData, scName, fbID)
+            if Planet.Magnetic.nLin is not None:
+                GetBiBasis(Planet.Magnetic.nLin, Planet.Magnetic.mLin, modelData, scName, fbID)
+            if Params.Trajec.plasmaType == 'Alfven':
+                GetGeomPhiO(Planet, magData, modelData, scName, fbID)
+
+    return modelData
+
+
 def CalcAmbientFromExcitation(Magnetic, modelData):
 
     if isinstance(Magnetic.Benm_nT, dict):
@@ -183,8 +227,8 @@ def CalcAmbientFromExcitation(Magnetic, modelData):
             Bex_nT, Bey_nT, Bez_nT = Magnetic.Bexyz_nT[scName]
             # Add extra axis for multiplying into phases
             Bex_nT, Bey_nT, Bez_nT = (Bex_nT[:,None], Bey_nT[:,None], Bez_nT[:,None])
-            for fbID, ets in etsList.items():
-                phases = np.exp(-1j * np.outer(Magnetic.omegaExc_radps[scName], ets))
+            for fbID in etsList.keys():
+                phases = GetExcPhases(Magnetic.omegaExc_radps[scName], modelData, scName, fbID)
                 modelData.BxIAUexc_nT[scName][fbID] = np.real(np.sum(Bex_nT * phases, axis=0)) \
                                                       + Magnetic.B0_nT[scName][0]
                 modelData.ByIAUexc_nT[scName][fbID] = np.real(np.sum(Bey_nT * phases, axis=0)) \
@@ -196,8 +240,8 @@ def CalcAmbientFromExcitation(Magnetic, modelData):
         for scName, etsList in modelData.ets.items():
             Bex_nT, Bey_nT, Bez_nT = Magnetic.Bexyz_nT
             Bex_nT, Bey_nT, Bez_nT = (Bex_nT[:,None], Bey_nT[:,None], Bez_nT[:,None])
-            for fbID, ets in etsList.items():
-                phases = np.exp(-1j * np.outer(Magnetic.omegaExc_radps, ets))
+            for fbID in etsList.keys():
+                phases = GetExcPhases(Magnetic.omegaExc_radps, modelData, scName, fbID)
                 modelData.BxIAUexc_nT[scName][fbID] = np.real(np.sum(Bex_nT * phases, axis=0)) \
                                                       + Magnetic.B0_nT[0]
                 modelData.ByIAUexc_nT[scName][fbID] = np.real(np.sum(Bey_nT * phases, axis=0)) \
@@ -267,23 +311,25 @@ def BiTrajecSingle(Planet, Params, spiceSC, ets):
                                   for xyz_km in BodyDist_km(spiceSC, Planet.bodyname, ets))
         nCores = np.min([Params.maxCores, Nnm, Params.threadLimit])
 
-        for iExc, omega_radps in enumerate(Planet.Magnetic.omegaExc_radps):
-            if Params.DO_PARALLEL:
-                pool = mtpContext.Pool(nCores)
-                par_result = [pool.apply_async(
-                    EvalBi, args=(Planet.Magnetic.nLin[iN], Planet.Magnetic.mLin[iN],
-                                   Planet.Magnetic.BinmLin_nT[iExc,iN], x_Rp, y_Rp, z_Rp, r_Rp),
-                             kwds={'omega': omega_radps, 't': ets})
-                              for iN in range(Nnm)]
-                pool.close()
-                pool.join()
-                # Unpack results from parallel processing and sum them
-                for res in par_result:
+        if Params.DO_PARALLEL:
+            # Submit all excitations to the same pool at once
+            pool, SESSION = GetPool(nCores)
+            par_result = [[pool.apply_async(
+                EvalBi, args=(Planet.Magnetic.nLin[iN], Planet.Magnetic.mLin[iN],
+                               Planet.Magnetic.BinmLin_nT[iExc,iN], x_Rp, y_Rp, z_Rp, r_Rp),
+                         kwds={'omega': omega_radps, 't': ets})
+                           for iN in range(Nnm)]
+                          for iExc, omega_radps in enumerate(Planet.Magnetic.omegaExc_radps)]
+            # Unpack results from parallel processing and sum them
+            for iExc, excResult in enumerate(par_result):
+                for res in excResult:
                     this_Bx, this_By, this_Bz = res.get()
                     Bix_nT[iExc,:] = Bix_nT[iExc,:] + this_Bx
                     Biy_nT[iExc,:] = Biy_nT[iExc,:] + this_By
                     Biz_nT[iExc,:] = Biz_nT[iExc,:] + this_Bz
-            else:
+            ReleasePool(pool, SESSION)
+        else:
+            for iExc, omega_radps in enumerate(Planet.Magnetic.omegaExc_radps):
                 for iN in range(Nnm):
                     this_Bx, this_By, this_Bz = EvalBi(Planet.Magnetic.nLin[iN],
                         Planet.Magnetic.mLin[iN], Planet.Magnetic.BinmLin_nT[iExc,iN],
@@ -1,23 +1,35 @@
 """
-Loads a selected spacecraft dataset from ASCII or CDF files and saves as a standardized HDF5 .mat
-file format.
+Loads a selected spacecraft dataset from ASCII or CDF files and saves as a standardized, chunked
+HDF5 file indexed by flyby ID and time.
 """
 
 import logging
 import os
+import json
+import h5py
+from functools import reduce
 import numpy as np
 import spiceypy as spice
-from hdf5storage import savemat, loadmat
-from PlanetProfile.Utilities.defineStructs import MAGdataStruct, Constants, ParentName
+from hdf5storage import loadmat
+from PlanetProfile.Utilities.defineStructs import MAGdataStruct, ParentName
 from PlanetProfile.TrajecAnalysis import _MAGdir, _scList, _MAGdataList
 from PlanetProfile.TrajecAnalysis.SpiceFuncs import spiceCode, spiceSCname, spiceS3coords, \
-    BodyDist_km, RotateFrame, LoadKernels
+    BodyDistCached_km, RotateFrame, LoadKernels
 from PlanetProfile.TrajecAnalysis.FlybyEvents import GetFlybyCA
 from PlanetProfile.TrajecAnalysis.MagneticFields import Bsph2Bxyz
+from PlanetProfile.Utilities.PoolManager import GetPool, ReleasePool
 
 # Assign logger
 log = logging.getLogger('PlanetProfile')
 
+# Version number for the layout of reformatted MAG data files. Increment when the layout changes.
+magStoreVer = 1
+# Maximum number of time samples per HDF5 chunk, i.e. 1 day at 1 s cadence
+magChunkSize = 86400
+# Per-flyby time series saved in reformatted MAG data files
+magSeries = ['BxS3_nT', 'ByS3_nT', 'BzS3_nT', 'BxIAU_nT', 'ByIAU_nT', 'BzIAU_nT']
+magAmbSeries = ['BxIAUamb_nT', 'ByIAUamb_nT', 'BzIAUamb_nT', 'BxS3moon_nT', 'ByS3moon_nT', 'BzS3moon_nT']
+
 
 def RefileName(targetBody, scName, MAGdir=None):
     """
@@ -42,7 +54,7 @@ def RefileName(targetBody, scName, MAGdir=None):
     if MAGdir is None:
         MAGdir = _MAGdir
 
-    fName = f'{scName}MAG{targetBody}.mat'
+    fName = f'{scName}MAG{targetBody}.h5'
     fPath = os.path.join(MAGdir, scName, fName)
 
     return fPath
@@ -51,7 +63,8 @@ def RefileName(targetBody, scName, MAGdir=None):
 def MAGtoHDF5(Params, scName, MAGdir=None):
     """
     Converts ASCII text files of spacecraft magnetometer measurements for the given target body to
-    the IAU frame and saves as HDF5.
+    the IAU frame and saves as chunked HDF5. PDS files are parsed in parallel if
+    Params.DO_PARALLEL is True.
 
     Parameters
     ----------
@@ -82,46 +95,51 @@ def MAGtoHDF5(Params, scName, MAGdir=None):
                     # Replace files to load with those for full orbit
                     pdsFiles = {fbID: _MAGdataList[scName]['Jupiter'][fbID]
                                 for fbID in pdsFiles.keys()}
-                for fbID, file in pdsFiles.items():
-                    fpath = os.path.join(MAGdir, scName, 'Jupiter', file)
-                    t_UTC[fbID], _, BrS3_nT[fbID], BthS3_nT[fbID], BphiS3_nT[fbID], _, _, _, _, _ \
-                        = np.loadtxt(fpath, unpack=True, dtype='U23,U23,f,f,f,f,f,f,f,f')
-                    log.debug(f'Loaded file {file}.')
+                jobs = [(fbID, (os.path.join(MAGdir, scName, 'Jupiter', file),
+                                'U23,U23,f,f,f,f,f,f,f,f')) for fbID, file in pdsFiles.items()]
+                iCols = [0, 2, 3, 4]
             else:
-                for fbID, file in pdsFiles.items():
-                    fpath = os.path.join(MAGdir, scName, Params.Trajec.targetBody, file)
-                    t_UTC[fbID], BrS3_nT[fbID], BthS3_nT[fbID], BphiS3_nT[fbID], _, _, _, _, _ \
-                        = np.loadtxt(fpath, unpack=True, dtype='U23,f,f,f,f,f,f,f,f')
-                    log.debug(f'Loaded file {file}.')
+                jobs = [(fbID, (os.path.join(MAGdir, scName, Params.Trajec.targetBody, file),
+                                'U23,f,f,f,f,f,f,f,f')) for fbID, file in pdsFiles.items()]
+                iCols = [0, 1, 2, 3]
+            for (fbID, _), cols in zip(jobs, ReadPDSfiles(Params, jobs)):
+                t_UTC[fbID], BrS3_nT[fbID], BthS3_nT[fbID], BphiS3_nT[fbID] = (cols[i] for i in iCols)
 
         elif scName == 'Cassini':
-            for revID, file in pdsFiles.items():
-                fpath = os.path.join(MAGdir, scName, Params.Trajec.targetBody, file)
-                t_UTC[revID], BrS3_nT[revID], BthS3_nT[revID], BphiS3_nT[revID], _, _ \
-                    = np.loadtxt(fpath, unpack=True, dtype='U21,f,f,f,f,d')
-                log.debug(f'Loaded file {file}.')
+            jobs = [(revID, (os.path.join(MAGdir, scName, Params.Trajec.targetBody, file),
+                             'U21,f,f,f,f,d')) for revID, file in pdsFiles.items()]
+            for (revID, _), cols in zip(jobs, ReadPDSfiles(Params, jobs)):
+                t_UTC[revID], BrS3_nT[revID], BthS3_nT[revID], BphiS3_nT[revID] = cols[:4]
 
         elif scName == 'Juno':
+            # Juno data are split into one file per day. Only days overlapping the window around
+            # CA for each perijove are read, decimated to Trajec.magCadence_s if set.
+            if Params.Trajec.PLANETMAG_MODEL and (Params.Trajec.junoWindow_s is not None
+                                                  or Params.Trajec.magCadence_s is not None):
+                # PlanetMag model files hold one value per sample for the full perijove, with no
+                # time stamps to apply the same window and decimation to
+                raise ValueError('Trajec.junoWindow_s and Trajec.magCadence_s cannot be used with ' +
+                                 'Trajec.PLANETMAG_MODEL, because the ambient field model would no ' +
+                                 'longer line up with the MAG data. Set both to None.')
+            cacheDir = os.path.join(MAGdir, scName, 'DayCache')
+            jobs = []
             for pjID, fileDict in pdsFiles.items():
-                t_UTC[pjID] = []
+                etRange = JunoWindow(Params, FlybyCA[scName], pjID)
                 for file in fileDict.values():
-                    fpath = os.path.join(MAGdir, scName, Params.Trajec.targetBody, file)
-                    nHeadLines = 0
-                    with open(fpath) as f:
-                        headLine = f.readline()
-                        while f'{headLine[2:6]}{headLine[7:10]}' != file[11:18]:
-                            headLine = f.readline()
-                            nHeadLines += 1
-
-                    yyyy, doy, h, m, s, ms, _, BxS3_nT[pjID], ByS3_nT[pjID], BzS3_nT[pjID], _, _, \
-                        _, _ = np.loadtxt(fpath, unpack=True, skiprows=nHeadLines,
-                                     dtype='d,d,d,d,d,d,f,f,f,f,f,f,f,f')
-                    t_UTC[pjID] += [f'{yyyy1:.0f}-{doy1:03.0f}//{h1:02.0f}:{m1:02.0f}:{s1:02.0f}.' +
-                                    f'{ms1:03.0f}'
-                                    for yyyy1, doy1, h1, m1, s1, ms1 in zip(yyyy, doy, h, m, s, ms)]
-                    log.debug(f'Loaded file {file}.')
-
-                t_UTC[pjID] = np.array(t_UTC[pjID])
+                    sodRange = DaySodRange(file, etRange)
+                    if sodRange is not None:
+                        jobs.append((pjID, (os.path.join(MAGdir, scName, Params.Trajec.targetBody, file),
+                                            sodRange, Params.Trajec.magCadence_s, cacheDir)))
+            dayData = {pjID: [] for pjID in pdsFiles.keys()}
+            for (pjID, _), table in zip(jobs, ReadPDSfiles(Params, jobs, ReadFunc=ReadJunoDay)):
+                dayData[pjID].append(table)
+            for pjID, days in dayData.items():
+                if np.size(days) == 0:
+                    raise ValueError('No Juno MAG data found within junoWindow_s = ' +
+                                     f'{Params.Trajec.junoWindow_s} of CA for PJ{pjID}.')
+                _, yyyy, doy, h, m, s, ms, BxS3_nT[pjID], ByS3_nT[pjID], BzS3_nT[pjID] \
+                    = np.concatenate(days, axis=1)
+                t_UTC[pjID] = JunoUTC(yyyy, doy, h, m, s, ms)
 
         elif scName in _scList:
             raise ValueError(f'PDS data read-in has not yet been implemented for "{scName}".')
@@ -169,8 +187,8 @@ def MAGtoHDF5(Params, scName, MAGdir=None):
             BzS3moon_nT[fbID] = np.squeeze(ambModelData['BzS3moon_nT'])
 
     else:
-        ambModel, BxIAUamb_nT, ByIAUamb_nT, BzIAUamb_nT = (Constants.NA for _ in range(4))
-        BxS3amb_nT, ByS3amb_nT, BzS3amb_nT, BxS3moon_nT, ByS3moon_nT, BzS3moon_nT = (None for _ in range(6))
+        ambModel, BxIAUamb_nT, ByIAUamb_nT, BzIAUamb_nT, BxS3amb_nT, ByS3amb_nT, BzS3amb_nT, \
+            BxS3moon_nT, ByS3moon_nT, BzS3moon_nT = (None for _ in range(10))
 
     if Params.Trajec.EXPANDED_RANGE:
         span_s = Params.Trajec.etExpandRange_s / 2
@@ -202,8 +220,8 @@ def MAGtoHDF5(Params, scName, MAGdir=None):
     if scName in ['Galileo', 'Cassini']:
         # Convert from spherical coordinates to Cartesian for frame transformation
         for fbID, fbets in ets.items():
-            x_km, y_km, z_km, r_km = BodyDist_km(spiceSCname[scName], parent,
-                                                 fbets, coord=spiceS3coords[parent])
+            x_km, y_km, z_km, r_km = BodyDistCached_km(Params, spiceSCname[scName], parent,
+                                                       fbets, coord=spiceS3coords[parent])
             thS3_rad = np.arccos(z_km/r_km)
             phiS3_rad = np.arctan2(y_km, x_km)
             BxS3_nT[fbID], ByS3_nT[fbID], BzS3_nT[fbID] \
@@ -214,7 +232,7 @@ def MAGtoHDF5(Params, scName, MAGdir=None):
         # Pare down data to flyby encounter itself
         Rp_km = spice.bodvcd(pCode, 'RADII', 3)[1][0]
         for pjID, pjets in ets.items():
-            _, _, _, r_km = BodyDist_km(spiceSCname[scName], Params.Trajec.targetBody, pjets)
+            _, _, _, r_km = BodyDistCached_km(Params, spiceSCname[scName], Params.Trajec.targetBody, pjets)
             keep = r_km <= (Rp_km * Params.Trajec.fbRange_Rp)
             t_UTC[pjID] = t_UTC[pjID][keep]
             ets[pjID] = ets[pjID][keep]
@@ -261,17 +279,301 @@ def MAGtoHDF5(Params, scName, MAGdir=None):
     }
 
     magFname = RefileName(Params.Trajec.targetBody, scName)
-    if os.path.exists(magFname):
-        os.remove(magFname)
-    savemat(magFname, data)
+    WriteMAGstore(magFname, data)
     log.debug(f'Reformatted MAG data saved to file: {magFname}')
 
     return
 
 
+def ReadPDSfile(fpath, dtypes, startTag=None):
+    """
+    Read a whitespace-delimited PDS table into columns with np.loadtxt.
+
+    Parameters
+    ----------
+    fpath : str
+        Path to the PDS table file.
+    dtypes : str
+        Comma-separated numpy dtype strings, one for each column in the table.
+    startTag : str, default=None
+        If set, skip header lines until the first line for which characters 2-5 and 7-9 (the
+        year and DOY of Juno .sts files) match startTag.
+
+    Returns
+    -------
+    cols : list of array_like
+        One array for each column in the table, with the corresponding dtype.
+    """
+    nHeadLines = 0
+    if startTag is not None:
+        with open(fpath) as f:
+            headLine = f.readline()
+            while f'{headLine[2:6]}{headLine[7:10]}' != startTag:
+                if headLine == '':
+                    raise ValueError(f'No data lines starting with {startTag} found in {fpath}.')
+                headLine = f.readline()
+                nHeadLines += 1
+
+    cols = np.loadtxt(fpath, unpack=True, skiprows=nHeadLines, dtype=dtypes)
+    log.debug(f'Loaded file {os.path.basename(fpath)}.')
+
+    return cols
+
+
+def ReadPDSfiles(Params, jobs, ReadFunc=ReadPDSfile):
+    """
+    Read a list of PDS table files, in parallel if Params.DO_PARALLEL is True.
+
+    Parameters
+    ----------
+    Params : ParamsStruct
+        A ParamsStruct class object containing parallel processing settings.
+    jobs : list of tuple
+        List of (ID, args) for each file to read, where args is a tuple of arguments to pass
+        to ReadFunc. ID is not used here, but is kept for matching results to flybys.
+    ReadFunc : function, default=ReadPDSfile
+        Function that reads a single file.
+
+    Returns
+    -------
+    results : list
+        Output of ReadFunc for each file, in the same order as jobs.
+    """
+    nFiles = len(jobs)
+    if Params.DO_PARALLEL and nFiles > 1:
+        nCores = np.min([Params.maxCores, nFiles, Params.threadLimit])
+        pool, SESSION = GetPool(nCores)
+        parResult = [pool.apply_async(ReadFunc, args) for _, args in jobs]
+        results = [result.get() for result in parResult]
+        ReleasePool(pool, SESSION)
+    else:
+        results = [ReadFunc(*args) for _, args in jobs]
+
+    return results
+
+
+def JunoWindow(Params, FlybyCA, pjID):
+    """
+    Get the range of ephemeris times to load around closest approach for a Juno perijove.
+
+    Returns
+    -------
+    etRange : (float, float) or None
+        Start and end ephemeris times, or None to load all days in the perijove, which is the
+        case when Trajec.junoWindow_s is None or there is no CA listed for the target body.
+    """
+    if Params.Trajec.junoWindow_s is None:
+        return None
+    if Params.Trajec.targetBody not in FlybyCA.etCA.keys() \
+            or pjID not in FlybyCA.etCA[Params.Trajec.targetBody].keys():
+        log.debug(f'No Juno CA listed for {Params.Trajec.targetBody} PJ{pjID}. All days in the ' +
+                  'perijove will be loaded.')
+        return None
+    etCA = FlybyCA.etCA[Params.Trajec.targetBody][pjID]
+    return etCA - Params.Trajec.junoWindow_s/2, etCA + Params.Trajec.junoWindow_s/2
+
+
+def DaySodRange(file, etRange):
+    """
+    Convert a range of ephemeris times to seconds of day for the day covered by a Juno file.
+
+    Returns
+    -------
+    sodRange : (float, float) or None
+        Start and end seconds of day to load, or None if the file does not overlap etRange.
+    """
+    if etRange is None:
+        return 0, np.inf
+    etDayStart = spice.str2et(f'{file[11:15]}-{file[15:18]}T00:00:00')
+    sodRange = (etRange[0] - etDayStart, etRange[1] - etDayStart)
+    if sodRange[1] < 0 or sodRange[0] > 86400:
+        return None
+    return sodRange
+
+
+def ReadJunoDay(fpath, sodRange, cadence_s, cacheDir):
+    """
+    Read one day of Juno MAG data, decimated to the requested cadence, and return only the
+    samples within sodRange. The decimated day is cached to disk as .npy and memory-mapped on
+    later reads, so repeated loads neither re-parse the text file nor read the whole day.
+
+    Parameters
+    ----------
+    fpath : str
+        Path to the Juno .sts file for this day.
+    sodRange : (float, float)
+        Range of seconds of day to return.
+    cadence_s : float
+        Cadence in seconds to decimate to, by averaging field measurements in each time bin.
+        If None, data are kept at full resolution.
+    cacheDir : str
+        Directory in which to save decimated day files.
+
+    Returns
+    -------
+    table : float, shape 10xN
+        Rows of seconds of day, year, DOY, hour, minute, second, millisecond, and Bx, By, Bz in
+        System III.
+    """
+    file = os.path.basename(fpath)
+    cadenceTag = 'full' if cadence_s is None else f'{cadence_s:g}s'
+    cacheFile = os.path.join(cacheDir, f'{file[:-4]}_{cadenceTag}.npy')
+    if os.path.isfile(cacheFile) and os.path.getmtime(cacheFile) >= os.path.getmtime(fpath):
+        dayTable = np.load(cacheFile, mmap_mode='r')
+        log.debug(f'Loaded cached day file {os.path.basename(cacheFile)}.')
+    else:
+        yyyy, doy, h, m, s, ms, _, Bx, By, Bz, _, _, _, _ \
+            = ReadPDSfile(fpath, 'd,d,d,d,d,d,f,f,f,f,f,f,f,f', startTag=file[11:18])
+        sod = h*3600 + m*60 + s + ms/1e3
+        dayTable = np.vstack((sod, yyyy, doy, h, m, s, ms, Bx, By, Bz))
+        if cadence_s is not None:
+            dayTable = DecimateMAG(dayTable, cadence_s)
+        if not os.path.isdir(cacheDir):
+            os.makedirs(cacheDir, exist_ok=True)
+        tmpFile = f'{cacheFile}.{os.getpid()}.tmp'
+        with open(tmpFile, 'wb') as f:
+            np.save(f, dayTable)
+        os.replace(tmpFile, cacheFile)
+
+    iStart, iEnd = np.searchsorted(dayTable[0, :], sodRange, side='left')
+    return np.array(dayTable[:, iStart:iEnd])
+
+
+def DecimateMAG(dayTable, cadence_s):
+    """
+    Decimate a table of MAG data to the given cadence, averaging field components within each
+    time bin and taking time stamps from the middle sample of each bin.
+
+    Parameters
+    ----------
+    dayTable : float, shape 10xN
+        Table as described in ReadJunoDay, sorted by seconds of day.
+    cadence_s : float
+        Width of time bins in seconds.
+
+    Returns
+    -------
+    decTable : float, shape 10xM
+        Decimated table.
+    """
+    if np.size(dayTable, axis=1) == 0:
+        return dayTable
+    bins = np.floor(dayTable[0, :] / cadence_s)
+    iStarts = np.concatenate(([0], np.flatnonzero(np.diff(bins)) + 1))
+    nPerBin = np.diff(np.append(iStarts, np.size(bins)))
+    decTable = dayTable[:, iStarts + (nPerBin - 1)//2]
+    decTable[7:, :] = np.add.reduceat(dayTable[7:, :], iStarts, axis=1) / nPerBin
+
+    return decTable
+
+
+def JunoUTC(yyyy, doy, h, m, s, ms):
+    """ Construct UTC time strings in the format yyyy-doy//hh:mm:ss.fff from Juno .sts time columns. """
+    def Pad(x, n):
+        return np.char.zfill(np.round(x).astype(int).astype(str), n)
+
+    return reduce(np.char.add, [Pad(yyyy, 4), '-', Pad(doy, 3), '//', Pad(h, 2), ':', Pad(m, 2), ':',
+                                Pad(s, 2), '.', Pad(ms, 3)])
+
+
+def WriteMAGstore(magFname, data):
+    """
+    Save reformatted MAG data as HDF5, with one group per flyby holding chunked, compressed time
+    series, so that individual flybys and time ranges can be read without loading the whole file.
+
+    Parameters
+    ----------
+    magFname : str
+        File name to save to. Any existing file is overwritten.
+    data : dict
+        Reformatted MAG data, as constructed in MAGtoHDF5.
+    """
+    AMB = data['ambModel'] is not None
+    tmpFname = f'{magFname}.tmp'
+    with h5py.File(tmpFname, 'w') as f:
+        f.attrs['magStoreVer'] = magStoreVer
+        f.attrs['scName'] = list(data['fbInclude'].keys())[0]
+        f.attrs['fbInclude'] = json.dumps(data['fbInclude'])
+        f.attrs['pdsFiles'] = json.dumps(data['pdsFiles'])
+        f.attrs['fbIDs'] = json.dumps(list(data['ets'].keys()))
+        f.attrs['PLANETMAG_MODEL'] = AMB
+        if AMB:
+            f.attrs['ambModel'] = data['ambModel']
+        for fbID, fbets in data['ets'].items():
+            fbGroup = f.create_group(fbID)
+            series = {'ets': np.asarray(fbets, dtype=np.float64),
+                      't_UTC': np.char.encode(np.asarray(data['t_UTC'][fbID], dtype=str), 'ascii')}
+            series.update({name: data[name][fbID] for name in magSeries})
+            if AMB:
+                series.update({name: data[name][fbID] for name in magAmbSeries})
+            nPts = np.size(fbets)
+            for name, values in series.items():
+                if nPts > 0:
+                    fbGroup.create_dataset(name, data=values, chunks=(min(nPts, magChunkSize),),
+                                           compression='lzf', shuffle=True)
+                else:
+                    fbGroup.create_dataset(name, data=values)
+    os.replace(tmpFname, magFname)
+
+    return
+
+
+def ReadMAGstore(magFname, fbIDs=None):
+    """
+    Read reformatted MAG data saved by WriteMAGstore, optionally for only a subset of flybys.
+    Only the datasets for the requested flybys are read from disk.
+
+    Parameters
+    ----------
+    magFname : str
+        File name to read from.
+    fbIDs : list of str, default=None
+        Flyby IDs to read. If None, all flybys in the file are read.
+
+    Returns
+    -------
+    data : dict
+        Reformatted MAG data in the same format as constructed in MAGtoHDF5, for use in
+        MAGdataStruct.
+    """
+    with h5py.File(magFname, 'r') as f:
+        if f.attrs.get('magStoreVer', 0) != magStoreVer:
+            raise ValueError(f'MAG data file {magFname} was saved in an outdated format. Set ' +
+                             'Trajec.FORCE_MAG_RECALC = True to regenerate it.')
+        allIDs = json.loads(f.attrs['fbIDs'])
+        if fbIDs is None:
+            fbIDs = allIDs
+        else:
+            missing = [fbID for fbID in fbIDs if fbID not in allIDs]
+            if np.size(missing) > 0:
+                raise ValueError(f'Flyby IDs {missing} not found in {magFname}. Available flybys ' +
+                                 f'are {allIDs}.')
+        AMB = bool(f.attrs['PLANETMAG_MODEL'])
+        pdsFiles = json.loads(f.attrs['pdsFiles'])
+        names = magSeries + magAmbSeries if AMB else magSeries
+
+        data = {name: {} for name in ['t_UTC', 'ets'] + names}
+        for fbID in fbIDs:
+            fbGroup = f[fbID]
+            data['ets'][fbID] = fbGroup['ets'][...]
+            data['t_UTC'][fbID] = fbGroup['t_UTC'][...].astype(str)
+            for name in names:
+                data[name][fbID] = fbGroup[name][...]
+
+        data['fbInclude'] = json.loads(f.attrs['fbInclude'])
+        data['pdsFiles'] = {fbID: pdsFiles[fbID] for fbID in fbIDs}
+        if AMB:
+            data['ambModel'] = f.attrs['ambModel']
+        else:
+            data.update({name: None for name in ['ambModel'] + magAmbSeries})
+
+    return data
+
+
 def LoadMAG(Params, magFname, scName):
     """
-    Load reformatted MAG data from disk into a MAGdata class object.
+    Load reformatted MAG data from disk into a MAGdata class object. Only flybys listed in
+    Params.Trajec.fbInclude are read from disk.
 
     Parameters
     ----------
@@ -288,7 +590,8 @@ def LoadMAG(Params, magFname, scName):
         parent planet's System III frame.
     """
 
-    loadDict = loadmat(magFname)
+    fbList = Params.Trajec.fbInclude[scName]
+    loadDict = ReadMAGstore(magFname, fbIDs=None if fbList == 'all' else fbList)
     magData = MAGdataStruct(Params, magFname, loadDict)
     _, _, parent = spiceCode(Params.Trajec.targetBody)
     LoadKernels(Params, parent, scName)
@@ -298,6 +601,6 @@ def LoadMAG(Params, magFname, scName):
         log.debug(f'Evaluating {np.size(ets)} {magData.scName} positions relative to ' +
                   f'{Params.Trajec.targetBody} for flyby {fbID}.')
         magData.x_km[fbID], magData.y_km[fbID], magData.z_km[fbID], magData.r_km[fbID] \
-            = BodyDist_km(spiceSCname[scName], Params.Trajec.targetBody, ets)
+            = BodyDistCached_km(Params, spiceSCname[scName], Params.Trajec.targetBody, ets)
 
     return magData
@@ -3,11 +3,13 @@
 
 import logging
 import os.path
+import hashlib
 import numpy as np
 import spiceypy as spice
 from collections.abc import Iterable
 from PlanetProfile.Utilities.defineStructs import Constants, EOSlist
 from PlanetProfile import _SPICE
+from PlanetProfile.TrajecAnalysis import _MAGdir
 
 # Parallel processing
 import multiprocessing as mtp
@@ -20,6 +22,8 @@ else:
 mtpContext = mtp.get_context(mtpType)
 # Assign logger
 log = logging.getLogger('PlanetProfile')
+# Version number for cached SPICE evaluations. Increment when the file format changes.
+spiceCacheVer = 1
 
 def LoadKernels(Params, parent, scName):
     """ Load all SPICE kernels relevant to the task we intend.
@@ -90,6 +94,62 @@ def BodyDist_km(spiceSC, bodyname, ets, coord=None):
     return x_km, y_km, z_km, r_km
 
 
+def BodyDistCached_km(Params, spiceSC, bodyname, ets, coord=None):
+    """ Return distance from spacecraft to target body in km for each ephemeris time
+        in ets, as BodyDist_km, but save the positions to disk in Params.Trajec.spiceCacheDir
+        (relative to the spacecraft MAG data directory, unless an absolute path is set)
+        and reload them on later calls with the same spacecraft, body, frame, ephemeris times,
+        and loaded kernels.
+    """
+    if not Params.Trajec.CACHE_SPICE:
+        return BodyDist_km(spiceSC, bodyname, ets, coord=coord)
+
+    spiceBody = bodyname.upper()
+    if coord is None:
+        coord = f'IAU_{spiceBody}'
+    etin = np.atleast_1d(np.asarray(ets, dtype=np.float_))
+
+    # Identify cache files by a hash of everything that determines the result
+    key = hashlib.sha1(f'{spiceCacheVer},{spiceSC},{spiceBody},{coord},{KernelSignature()}'.encode())
+    key.update(etin.tobytes())
+    fName = f'{spiceSC.replace(" ", "")}_{spiceBody}_{coord}_{np.size(etin)}pts_{key.hexdigest()[:16]}.npy'
+    cacheDir = os.path.join(_MAGdir, Params.Trajec.spiceCacheDir)
+    fPath = os.path.join(cacheDir, fName)
+
+    if os.path.isfile(fPath):
+        log.debug(f'Reloading cached {spiceSC} positions relative to {spiceBody} from {fPath}.')
+        pos = np.load(fPath)
+    else:
+        pos, _ = spice.spkpos(spiceSC, etin, coord, 'NONE', spiceBody)
+        pos = np.asarray(pos)
+        os.makedirs(cacheDir, exist_ok=True)
+        # Write to a temporary file first so other processes never read a partial file
+        tmpPath = f'{fPath[:-4]}.{os.getpid()}.tmp.npy'
+        np.save(tmpPath, pos)
+        os.replace(tmpPath, fPath)
+        log.debug(f'Cached {spiceSC} positions relative to {spiceBody} to {fPath}.')
+
+    x_km = pos[:, 0]
+    y_km = pos[:, 1]
+    z_km = pos[:, 2]
+    r_km = np.sqrt(x_km**2 + y_km**2 + z_km**2)
+
+    return x_km, y_km, z_km, r_km
+
+
+def KernelSignature():
+    """ Return a string identifying all currently loaded SPICE kernels by file name and size,
+        for invalidating cached SPICE evaluations when kernels change.
+    """
+    kernels = []
+    for i in range(spice.ktotal('ALL')):
+        kFile = spice.kdata(i, 'ALL')[0]
+        kSize = os.path.getsize(kFile) if os.path.isfile(kFile) else 0
+        kernels.append(f'{os.path.basename(kFile)}:{kSize}')
+
+    return ';'.join(kernels)
+
+
 def BodyVel_kms(spiceSC, bodyname, ets, coord=None):
     """ Return relative velocity between spacecraft and target body in km/s for each ephemeris time
         in ets.
@@ -185,9 +245,7 @@ def RotateFrameManual(vec, axisIn, ang_rad, O=None):
 
     # Translate origin for coordinate transformations
     if O is not None:
-        if np.size(O) == 3:
-            transVec = np.array([vec[i,:] - O for i in range(np.shape(vec)[0])])
-        elif np.shape(vec) == np.shape(O):
+        if np.size(O) == 3 or np.shape(vec) == np.shape(O):
             transVec = vec - O
         else:
             raise ValueError('Origin transformation must be a single point or one for each vec.')
@@ -195,27 +253,42 @@ def RotateFrameManual(vec, axisIn, ang_rad, O=None):
         transVec = vec * 1
 
     # Construct rotation matrices
-    rot = np.array([[
-        [np.cos(ang) + axis[i,0]**2*(1-np.cos(ang)), axis[i,0]*axis[i,1]*(1-np.cos(ang)) - axis[i,2]*np.sin(ang), axis[i,0]*axis[i,2]*(1-np.cos(ang)) + axis[i,1]*np.sin(ang)],
-        [axis[i,1]*axis[i,0]*(1-np.cos(ang)) + axis[i,2]*np.sin(ang), np.cos(ang) + axis[i,1]**2*(1-np.cos(ang)), axis[i,1]*axis[i,2]*(1-np.cos(ang) - axis[i,0]*np.sin(ang))],
-        [axis[i,2]*axis[i,0]*(1-np.cos(ang)) - axis[i,1]*np.sin(ang), axis[i,2]*axis[i,1]*(1-np.cos(ang)) + axis[i,0]*np.sin(ang), np.cos(ang) + axis[i,2]**2*(1-np.cos(ang))]
-    ] for i, ang in enumerate(ang_rad)])
-
+    ang_rad = np.atleast_1d(ang_rad)
     if ONE_ROT:
-        outVec = np.array([
-            np.dot(rot[0,:,:], tVec)
-            for tVec in transVec
-        ])
+        rot = GetRotMatsManual(axis[0,:], ang_rad[0])
+        outVec = transVec @ rot.T
     else:
-        outVec = np.array([
-            np.dot(rot[i,:,:], tVec)
-            for i, tVec in enumerate(transVec)
-        ])
+        rot = GetRotMatsManual(axis, ang_rad)
+        outVec = np.einsum('nij,nj->ni', rot, transVec)
 
     return outVec
 
 
 
+def GetRotMatsManual(axis, ang_rad):
+    """ Construct rotation matrices for right-handed rotations by ang_rad about axis, as used in
+        RotateFrameManual. Inputs are broadcast against each other, so that many rotations can
+        be constructed at once.
+
+        Args:
+            axis (float, shape ...x3): Axis vectors about which to rotate.
+            ang_rad (float, shape ...): Rotation angles in radians.
+        Returns:
+            rot (float, shape ...x3x3): Rotation matrices.
+    """
+    ax, ay, az = axis[..., 0], axis[..., 1], axis[..., 2]
+    cosAng = np.cos(ang_rad)
+    sinAng = np.sin(ang_rad)
+    cosComp = 1 - cosAng
+    rot = np.stack((
+        np.stack((cosAng + ax**2*cosComp, ax*ay*cosComp - az*sinAng, ax*az*cosComp + ay*sinAng), axis=-1),
+        np.stack((ay*ax*cosComp + az*sinAng, cosAng + ay**2*cosComp, ay*az*(cosComp - ax*sinAng)), axis=-1),
+        np.stack((az*ax*cosComp - ay*sinAng, az*ay*cosComp + ax*sinAng, cosAng + az**2*cosComp), axis=-1)
+    ), axis=-2)
+
+    return rot
+
+
 def spiceCode(name):
     if name == 'Pioneer 11':
         code, parent = (-24, 0)
@@ -1,7 +1,7 @@
 """ Default trajectory analysis settings """
 from PlanetProfile.Utilities.defineStructs import TrajecParamsStruct
 
-configTrajecVersion = 1  # Integer number for config file version. Increment when new settings are added to the default config file.
+configTrajecVersion = 3  # Integer number for config file version. Increment when new settings are added to the default config file.
 
 def trajecAssign():
     Trajec = TrajecParamsStruct()
@@ -14,6 +14,10 @@ def trajecAssign():
     Trajec.FORCE_MAG_RECALC = False  # Whether to read in MAG data from disk and regenerate reformatted HDF5 version.
     Trajec.EXPANDED_RANGE = False  # Whether to plot an expanded set of B measurements farther from the encounter CA, with range set by etExpandRange_s. Overridden by REDUCED_RANGE for plotting purposes.
     Trajec.PLANETMAG_MODEL = False  # Whether to load in evaluated magnetic field models printed to disk from PlanetMag instead of directly evaluating excitation moments
+    Trajec.CACHE_SPICE = True  # Whether to save spacecraft positions evaluated from SPICE kernels to disk for quick reloading
+    Trajec.spiceCacheDir = 'SpiceCache'  # Directory in which to save cached spacecraft positions. Relative paths are within the SpacecraftMAGdata directory.
+    Trajec.junoWindow_s = None  # Range in seconds centered on CA within which to load Juno MAG data. Only day files overlapping this range are read. If None, all days in each perijove are loaded. Must be None with PLANETMAG_MODEL.
+    Trajec.magCadence_s = None  # Cadence in seconds to which to decimate Juno MAG data on load, by averaging within time bins. If None, data are kept at full resolution. Must be None with PLANETMAG_MODEL.
 
     Trajec.fbInclude = {  # Set to 'all' or a list of strings of encounter ID numbers
         'Cassini': 'all',
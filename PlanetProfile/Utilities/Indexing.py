@@ -86,7 +86,8 @@ def PhaseInv(phaseStr):
 
 
 def GetPhaseIndices(phase):
-    """ Get indices for each phase of ice/liquid
+    """ Get indices for each phase of ice/liquid, from a single stable sort of the phase
+        profile instead of searching the whole profile for each phase
 
         Args:
             phase (int, shape N)
@@ -94,32 +95,40 @@ def GetPhaseIndices(phase):
             indsLiquid, indsIceI, ... indsFe (int, shape 0-M): lists of indices corresponding to each phase.
                 Variable length.
     """
-    # Avoid an annoying problem where np.where returns an empty array for a length-1 list,
-    # by making sure the input value(s) are a numpy array:
-    phase = np.array(phase)
-
-    indsLiquid = np.where(phase==0)[0]
-    indsIceI = np.where(phase==1)[0]
-    indsIceIwet = np.where(phase==-1)[0]
-    indsIceII = np.where(phase==2)[0]
-    indsIceIIund = np.where(phase==-2)[0]
-    indsIceIII = np.where(phase==3)[0]
-    indsIceIIIund = np.where(phase==-3)[0]
-    indsIceV = np.where(phase==5)[0]
-    indsIceVund = np.where(phase==-5)[0]
-    indsIceVI = np.where(phase==6)[0]
-    indsIceVIund = np.where(phase==-6)[0]
-    indsClath = np.where(phase==Constants.phaseClath)[0]
-    indsClathWet = np.where(phase==-Constants.phaseClath)[0]
-    indsSil = np.where(np.logical_and(phase>=Constants.phaseSil, phase<Constants.phaseSil+10))[0]
-    indsSilLiq = np.where(phase==Constants.phaseSil)[0]
-    indsSilI = np.where(phase==Constants.phaseSil+1)[0]
-    indsSilII = np.where(phase==Constants.phaseSil+2)[0]
-    indsSilIII = np.where(phase==Constants.phaseSil+3)[0]
-    indsSilV = np.where(phase==Constants.phaseSil+5)[0]
-    indsSilVI = np.where(phase==Constants.phaseSil+6)[0]
-    indsFe = np.where(phase>=Constants.phaseFe)[0]
+    # Make sure the input value(s) are a 1D numpy array, so a single layer sorts like a profile
+    phase = np.atleast_1d(np.array(phase))
+    # A stable sort keeps the layers of each phase in increasing order
+    iSort = np.argsort(phase, kind='stable')
+    phaseSorted = phase[iSort]
+    phaseIDs = np.array([0, 1, -1, 2, -2, 3, -3, 5, -5, 6, -6, Constants.phaseClath, -Constants.phaseClath,
+                         Constants.phaseSil, Constants.phaseSil+1, Constants.phaseSil+2, Constants.phaseSil+3,
+                         Constants.phaseSil+5, Constants.phaseSil+6])
+    iLow = np.searchsorted(phaseSorted, phaseIDs, side='left')
+    iHigh = np.searchsorted(phaseSorted, phaseIDs, side='right')
+
+    indsLiquid, indsIceI, indsIceIwet, indsIceII, indsIceIIund, indsIceIII, indsIceIIIund, indsIceV, indsIceVund, \
+        indsIceVI, indsIceVIund, indsClath, indsClathWet, indsSilLiq, indsSilI, indsSilII, indsSilIII, indsSilV, \
+        indsSilVI = (iSort[lo:hi] for lo, hi in zip(iLow, iHigh))
+    # Ranges of phase IDs span several phases, so put their layers back in increasing order
+    iSilLow, iSilHigh, iFeLow = np.searchsorted(phaseSorted, [Constants.phaseSil, Constants.phaseSil+10,
+                                                              Constants.phaseFe], side='left')
+    indsSil = np.sort(iSort[iSilLow:iSilHigh])
+    indsFe = np.sort(iSort[iFeLow:])
 
     return indsLiquid, indsIceI, indsIceIwet, indsIceII, indsIceIIund, indsIceIII, indsIceIIIund, indsIceV, indsIceVund, \
                indsIceVI, indsIceVIund, indsClath, indsClathWet, indsSil, indsSilLiq, indsSilI, indsSilII, indsSilIII, \
                indsSilV, indsSilVI, indsFe
+
+
+def GetPlanetPhaseIndices(Planet):
+    """ Get the phase indices from GetPhaseIndices for Planet.phase. They are found once per
+        profile and cached on Planet, so that the electrical, seismic, and viscosity calculations
+        share them. The cache is refreshed whenever Planet.phase has changed.
+
+        Returns:
+            indsLiquid, indsIceI, ... indsFe (int, shape 0-M): As returned by GetPhaseIndices.
+    """
+    if Planet.phaseInds is None or not np.array_equal(Planet.phaseInds[0], Planet.phase):
+        Planet.phaseInds = (np.copy(Planet.phase), GetPhaseIndices(Planet.phase))
+
+    return Planet.phaseInds[1]
@@ -0,0 +1,92 @@
+"""
+Persistent worker pool shared between parallel calculations. Wrapping a session in
+PoolSession keeps one pool of worker processes alive for every parallel call made within
+it, instead of starting up and tearing down a new pool for each call.
+"""
+
+import logging
+import numpy as np
+
+# Parallel processing
+import multiprocessing as mtp
+import platform
+plat = platform.system()
+if plat == 'Windows':
+    mtpType = 'spawn'
+else:
+    mtpType = 'fork'
+mtpContext = mtp.get_context(mtpType)
+
+# Assign logger
+log = logging.getLogger('PlanetProfile')
+
+# Settings and pool for the outermost active PoolSession, if any
+_session = {'ACTIVE': False, 'nCores': None, 'pool': None}
+
+
+class PoolSession:
+    """ Context manager that keeps a single worker pool open for all parallel calculations
+        made within it, which get the pool from GetPool. The pool is started on first use,
+        so workers are forked as late as possible and inherit anything loaded before then.
+        Nested sessions reuse the pool of the outermost one. No pool is opened if
+        Params.DO_PARALLEL is False.
+
+        Usage:
+            with PoolSession(Params):
+                PlanetGrid = GridPlanetProfileFunc(PlanetProfile, PlanetGrid, Params)
+                ...
+    """
+    def __init__(self, Params, nCores=None):
+        if nCores is None:
+            nCores = np.min([Params.maxCores, Params.threadLimit])
+        self.nCores = nCores
+        self.DO_PARALLEL = Params.DO_PARALLEL
+        self.OWNER = False
+
+    def __enter__(self):
+        if self.DO_PARALLEL and not _session['ACTIVE']:
+            _session['ACTIVE'] = True
+            _session['nCores'] = self.nCores
+            self.OWNER = True
+        return self
+
+    def __exit__(self, excType, excVal, excTb):
+        if self.OWNER:
+            pool = _session['pool']
+            if pool is not None:
+                if excType is None:
+                    pool.close()
+                else:
+                    pool.terminate()
+                pool.join()
+                log.debug('Closed persistent pool.')
+            _session['ACTIVE'] = False
+            _session['nCores'] = None
+            _session['pool'] = None
+            self.OWNER = False
+        return False
+
+
+def GetPool(nCores):
+    """ Get a worker pool for a parallel calculation: the session pool if a PoolSession
+        is active, or else a new pool of nCores workers.
+
+        Returns:
+            pool (multiprocessing.Pool): Pool to submit jobs to.
+            SESSION (bool): Whether pool belongs to a PoolSession. Pass to ReleasePool when done.
+    """
+    if _session['ACTIVE']:
+        if _session['pool'] is None:
+            log.debug(f'Starting persistent pool with {_session["nCores"]} workers.')
+            _session['pool'] = mtpContext.Pool(_session['nCores'])
+        return _session['pool'], True
+    return mtpContext.Pool(nCores), False
+
+
+def ReleasePool(pool, SESSION):
+    """ Close a pool obtained from GetPool, unless it belongs to the active PoolSession. """
+    if not SESSION:
+        pool.close()
+        pool.join()
+
+    return
@@ -557,7 +557,7 @@ def SetupFilenames(Planet, Params, exploreAppend=None, figExploreAppend=None):
     DataFiles = DataFilesSubstruct(datPath, saveBase + saveLabel, Planet.Ocean.comp, inductBase=inductBase,
                                    exploreAppend=exploreAppend, EXPLORE=(Params.DO_INDUCTOGRAM or
                                        Params.DO_EXPLOREOGRAM or Params.INDUCTOGRAM_IN_PROGRESS),
-                                   inductAppend=inductAppend)
+                                   inductAppend=inductAppend, BINARY=Params.BINARY_PROFILES)
     FigureFiles = FigureFilesSubstruct(figPath, saveBase + saveLabel, FigMisc.xtn,
                                        comp=Planet.Ocean.comp, exploreBase=exploreBase, inductBase=inductBase,
                                        exploreAppend=figExploreAppend, inductAppend=inductAppend)
@@ -20,16 +20,17 @@ def GetLayerMeans(PlanetList, Params):
     # Get flags to pass on regarding types of layers we have
     Params.yesPorousRock = np.any([Planet.Do.POROUS_ROCK for Planet in PlanetList])
     Params.yesPorousIce = np.any([Planet.Do.POROUS_ICE for Planet in PlanetList])
-    Params.yesClath = np.any([np.any(abs(Planet.phase) == Constants.phaseClath) for Planet in PlanetList])
-    Params.yesIceIIIund = np.any([np.any(Planet.phase == -3) for Planet in PlanetList])
-    Params.yesIceIII = np.any([np.any(Planet.phase == 3) for Planet in PlanetList])
-    Params.yesIceVund = np.any([np.any(Planet.phase == -5) for Planet in PlanetList])
-    Params.yesIceV = np.any([np.any(Planet.phase == 5) for Planet in PlanetList])
-    Params.yesIceVI = np.any([np.any(abs(Planet.phase) == 6) for Planet in PlanetList])
-    Params.yesWetHPs = np.any([np.any(Planet.phase == 5) or np.any(Planet.phase == 6) for Planet in PlanetList])
+    present = GetPhasePresence(PlanetList)
+    Params.yesClath = np.any(present['Clath'])
+    Params.yesIceIIIund = np.any(present['IIIund'])
+    Params.yesIceIII = np.any(present['III'])
+    Params.yesIceVund = np.any(present['Vund'])
+    Params.yesIceV = np.any(present['V'])
+    Params.yesIceVI = np.any(present['VI'])
+    Params.yesWetHPs = np.any(np.logical_or(present['V'], present['VI']))
     Params.yesInduction = np.any([Planet.Magnetic.Binm_nT is not None for Planet in PlanetList])
 
-    for Planet in PlanetList:
+    for k, Planet in enumerate(PlanetList):
         # Mean values are set to nan by default. Set relevant values here.
 
         if Planet.Do.VALID:
@@ -75,44 +76,46 @@ def GetLayerMeans(PlanetList, Params):
 
             # Hydrosphere layer means
             if not Planet.Do.NO_H2O:
-                iCond = Planet.z_m[:-1] < Planet.eLid_m
-                iConv = np.logical_and(Planet.z_m[:-1] >= Planet.eLid_m, Planet.z_m[:-1] < Planet.zb_km*1e3)
-                iCondI = abs(Planet.phase[iCond]) == 1
-                iCondClath = abs(Planet.phase[iCond]) == Constants.phaseClath
-                iConvI = abs(Planet.phase[iConv]) == 1
-                iConvClath = abs(Planet.phase[iConv]) == Constants.phaseClath
+                zTop_m = Planet.z_m[:-1]
+                absPhase = np.abs(Planet.phase)
+                iCond = zTop_m < Planet.eLid_m
+                iConv = np.logical_and(zTop_m >= Planet.eLid_m, zTop_m < Planet.zb_km*1e3)
+                iCondI = np.logical_and(iCond, absPhase == 1)
+                iCondClath = np.logical_and(iCond, absPhase == Constants.phaseClath)
+                iConvI = np.logical_and(iConv, absPhase == 1)
+                iConvClath = np.logical_and(iConv, absPhase == Constants.phaseClath)
                 if np.any(iCondI):
-                    Planet.Ocean.rhoCondMean_kgm3['Ih'] = np.sum(Planet.MLayer_kg[iCond][iCondI]) / np.sum(Planet.VLayer_m3[iCond][iCondI])
+                    Planet.Ocean.rhoCondMean_kgm3['Ih'] = np.sum(Planet.MLayer_kg[iCondI]) / np.sum(Planet.VLayer_m3[iCondI])
                     # Get mean conductivity, ignoring spherical effects
                     if Params.CALC_CONDUCT:
-                        Planet.Ocean.sigmaCondMean_Sm['Ih'] = np.mean(Planet.sigma_Sm[iCond][iCondI])
+                        Planet.Ocean.sigmaCondMean_Sm['Ih'] = np.mean(Planet.sigma_Sm[iCondI])
                     # Get mean shear modulus, ignoring spherical effects
                     if Params.CALC_SEISMIC:
-                        Planet.Ocean.GScondMean_GPa['Ih'] = np.mean(Planet.Seismic.GS_GPa[iCond][iCondI])
+                        Planet.Ocean.GScondMean_GPa['Ih'] = np.mean(Planet.Seismic.GS_GPa[iCondI])
                 if np.any(iConvI):
-                    Planet.Ocean.rhoConvMean_kgm3['Ih'] = np.sum(Planet.MLayer_kg[iConv][iConvI]) / np.sum(Planet.VLayer_m3[iConv][iConvI])
+                    Planet.Ocean.rhoConvMean_kgm3['Ih'] = np.sum(Planet.MLayer_kg[iConvI]) / np.sum(Planet.VLayer_m3[iConvI])
                     if Params.CALC_CONDUCT:
-                        Planet.Ocean.sigmaConvMean_Sm['Ih'] = np.mean(Planet.sigma_Sm[iConv][iConvI])
+                        Planet.Ocean.sigmaConvMean_Sm['Ih'] = np.mean(Planet.sigma_Sm[iConvI])
                     if Params.CALC_SEISMIC:
-                        Planet.Ocean.GSconvMean_GPa['Ih'] = np.mean(Planet.Seismic.GS_GPa[iConv][iConvI])
+                        Planet.Ocean.GSconvMean_GPa['Ih'] = np.mean(Planet.Seismic.GS_GPa[iConvI])
                 if np.any(iCondClath):
-                    Planet.Ocean.rhoCondMean_kgm3['Clath'] = np.sum(Planet.MLayer_kg[iCond][iCondClath]) / np.sum(Planet.VLayer_m3[iCond][iCondClath])
+                    Planet.Ocean.rhoCondMean_kgm3['Clath'] = np.sum(Planet.MLayer_kg[iCondClath]) / np.sum(Planet.VLayer_m3[iCondClath])
                     if Params.CALC_CONDUCT:
-                        Planet.Ocean.sigmaCondMean_Sm['Clath'] = np.mean(Planet.sigma_Sm[iCond][iCondClath])
+                        Planet.Ocean.sigmaCondMean_Sm['Clath'] = np.mean(Planet.sigma_Sm[iCondClath])
                     if Params.CALC_SEISMIC:
-                        Planet.Ocean.GScondMean_GPa['Clath'] = np.mean(Planet.Seismic.GS_GPa[iCond][iCondClath])
+                        Planet.Ocean.GScondMean_GPa['Clath'] = np.mean(Planet.Seismic.GS_GPa[iCondClath])
                 if np.any(iConvClath):
-                    Planet.Ocean.rhoConvMean_kgm3['Clath'] = np.sum(Planet.MLayer_kg[iConv][iConvClath]) / np.sum(Planet.VLayer_m3[iConv][iConvClath])
+                    Planet.Ocean.rhoConvMean_kgm3['Clath'] = np.sum(Planet.MLayer_kg[iConvClath]) / np.sum(Planet.VLayer_m3[iConvClath])
                     if Params.CALC_CONDUCT:
-                        Planet.Ocean.sigmaConvMean_Sm['Clath'] = np.mean(Planet.sigma_Sm[iConv][iConvClath])
+                        Planet.Ocean.sigmaConvMean_Sm['Clath'] = np.mean(Planet.sigma_Sm[iConvClath])
                     if Params.CALC_SEISMIC:
-                        Planet.Ocean.GSconvMean_GPa['Clath'] = np.mean(Planet.Seismic.GS_GPa[iConv][iConvClath])
+                        Planet.Ocean.GSconvMean_GPa['Clath'] = np.mean(Planet.Seismic.GS_GPa[iConvClath])
 
                 if Planet.Do.BOTTOM_ICEIII or Planet.Do.BOTTOM_ICEV:
-                    iCondIII = np.logical_and(Planet.z_m[:-1] >= Planet.z_m[Planet.Steps.nIbottom],
-                                                           Planet.z_m[:-1] < Planet.z_m[Planet.Steps.nIbottom] + Planet.eLidIII_m)
-                    iConvIII = np.logical_and(Planet.z_m[:-1] >= Planet.z_m[Planet.Steps.nIbottom] + Planet.eLidIII_m,
-                                                           Planet.z_m[:-1] < Planet.z_m[Planet.Steps.nIIIbottom])
+                    iCondIII = np.logical_and(zTop_m >= Planet.z_m[Planet.Steps.nIbottom],
+                                                           zTop_m < Planet.z_m[Planet.Steps.nIbottom] + Planet.eLidIII_m)
+                    iConvIII = np.logical_and(zTop_m >= Planet.z_m[Planet.Steps.nIbottom] + Planet.eLidIII_m,
+                                                           zTop_m < Planet.z_m[Planet.Steps.nIIIbottom])
                     if np.sum(iCondIII) > 0:
                         Planet.Ocean.rhoCondMean_kgm3['III'] = np.sum(Planet.MLayer_kg[iCondIII]) / np.sum(Planet.VLayer_m3[iCondIII])
                     if np.sum(iConvIII) > 0:
@@ -130,10 +133,10 @@ def GetLayerMeans(PlanetList, Params):
                             Planet.Ocean.GSconvMean_GPa['III'] = np.mean(Planet.Seismic.GS_GPa[iConvIII])
 
                 if Planet.Do.BOTTOM_ICEV:
-                    iCondV = np.logical_and(Planet.z_m[:-1] >= Planet.z_m[Planet.Steps.nIIIbottom],
-                                                         Planet.z_m[:-1] < Planet.z_m[Planet.Steps.nIIIbottom] + Planet.eLidV_m)
-                    iConvV = np.logical_and(Planet.z_m[:-1] >= Planet.z_m[Planet.Steps.nIIIbottom] + Planet.eLidV_m,
-                                                         Planet.z_m[:-1] < Planet.z_m[Planet.Steps.nSurfIce])
+                    iCondV = np.logical_and(zTop_m >= Planet.z_m[Planet.Steps.nIIIbottom],
+                                                         zTop_m < Planet.z_m[Planet.Steps.nIIIbottom] + Planet.eLidV_m)
+                    iConvV = np.logical_and(zTop_m >= Planet.z_m[Planet.Steps.nIIIbottom] + Planet.eLidV_m,
+                                                         zTop_m < Planet.z_m[Planet.Steps.nSurfIce])
                     if np.sum(iCondV) > 0:
                         Planet.Ocean.rhoCondMean_kgm3['V'] = np.sum(Planet.MLayer_kg[iCondV]) / np.sum(Planet.VLayer_m3[iCondV])
                     if np.sum(iConvV) > 0:
@@ -150,82 +153,124 @@ def GetLayerMeans(PlanetList, Params):
                             Planet.Ocean.GSconvMean_GPa['V'] = np.mean(Planet.Seismic.GS_GPa[iConvV])
 
                 # Non-underplate ice layer sizes
-                if np.any(abs(Planet.phase) == 1):
-                    Planet.zIceI_m = np.min(Planet.z_m[:-1][abs(Planet.phase) == 1])
-                    Planet.dzIceI_km = (next(z_m for i, z_m in enumerate(Planet.z_m[:-1])
-                                            if i > np.where(abs(Planet.phase) == 1)[0][0]
-                                               and not abs(Planet.phase[i]) == 1) - Planet.zIceI_m) / 1e3
+                iWetHP = np.logical_or(Planet.phase == 3, np.logical_or(Planet.phase == 5, Planet.phase == 6))
+                if present['Ih'][k]:
+                    iIceI = absPhase == 1
+                    iTop = np.argmax(iIceI)
+                    Planet.zIceI_m = zTop_m[iTop]
+                    Planet.dzIceI_km = (LayerEndDepth(zTop_m, iIceI, iTop) - Planet.zIceI_m) / 1e3
                 else:
                     Planet.zIceI_m = np.nan
                     Planet.dzIceI_km = np.nan
-                if np.any(abs(Planet.phase) == Constants.phaseClath):
+                if present['Clath'][k]:
                     # Note that this differs from Planet.zClath_m, which is used to set the thickness/depth of the BOTTOM
                     # of the clathrate lid in the "top" clathrate model.
-                    Planet.zClath_km = np.min(Planet.z_m[:-1][abs(Planet.phase) == Constants.phaseClath])/1e3
-                    Planet.dzClath_km = np.max(Planet.z_m[:-1][abs(Planet.phase) == Constants.phaseClath])/1e3 \
-                                       - Planet.zClath_km
+                    zClath_m = zTop_m[absPhase == Constants.phaseClath]
+                    Planet.zClath_km = np.min(zClath_m)/1e3
+                    Planet.dzClath_km = np.max(zClath_m)/1e3 - Planet.zClath_km
                 else:
                     Planet.zClath_km = np.nan
                     Planet.dzClath_km = np.nan
-                if np.any(Planet.phase == -3):
-                    Planet.zIceIIIund_m = np.min(Planet.z_m[:-1][abs(Planet.phase) == 3])
+                if present['IIIund'][k]:
+                    Planet.zIceIIIund_m = np.min(zTop_m[absPhase == 3])
                     Planet.dzIceIIIund_km = (Planet.z_m[Planet.Steps.nIIIbottom] - Planet.z_m[Planet.Steps.nIbottom])/1e3
                 else:
                     Planet.zIceIIIund_m = np.nan
                     Planet.dzIceIIIund_km = np.nan
-                if np.any(Planet.phase == 3):
-                    Planet.zIceIII_m = np.min(Planet.z_m[:-1][Planet.phase == 3])
-                    Planet.dzIceIII_km = (next(z_m for i, z_m in enumerate(Planet.z_m[:-1])
-                                            if i > np.where(Planet.phase == 3)[0][0]
-                                               and not Planet.phase[i] in [0, 3]) - Planet.zIceIII_m) / 1e3
-                    Planet.Ocean.rhoMeanIIIwet_kgm3 = np.mean(Planet.rho_kgm3[Planet.phase == 3])
+                if present['III'][k]:
+                    iIceIII = Planet.phase == 3
+                    iTop = np.argmax(iIceIII)
+                    Planet.zIceIII_m = zTop_m[iTop]
+                    Planet.dzIceIII_km = (LayerEndDepth(zTop_m, np.logical_or(iIceIII, Planet.phase == 0), iTop)
+                                          - Planet.zIceIII_m) / 1e3
+                    Planet.Ocean.rhoMeanIIIwet_kgm3 = np.mean(Planet.rho_kgm3[iIceIII])
                     if Params.CALC_CONDUCT:
-                        Planet.Ocean.sigmaMeanIIIwet_Sm = np.mean(Planet.sigma_Sm[Planet.phase == 3])
+                        Planet.Ocean.sigmaMeanIIIwet_Sm = np.mean(Planet.sigma_Sm[iIceIII])
                     if Params.CALC_SEISMIC:
-                        Planet.Ocean.GSmeanIIIwet_GPa = np.mean(Planet.Seismic.GS_GPa[Planet.phase == 3])
-                if np.any(Planet.phase == -5):
-                    Planet.zIceVund_m = np.min(Planet.z_m[:-1][Planet.phase == -5])
+                        Planet.Ocean.GSmeanIIIwet_GPa = np.mean(Planet.Seismic.GS_GPa[iIceIII])
+                if present['Vund'][k]:
+                    Planet.zIceVund_m = np.min(zTop_m[Planet.phase == -5])
                     Planet.dzIceVund_km = Planet.zb_km - Planet.z_m[Planet.Steps.nIIIbottom]/1e3
                 else:
                     Planet.zIceVund_m = np.nan
                     Planet.dzIceVund_km = np.nan
-                if np.any(Planet.phase == 5):
-                    Planet.zIceV_m = np.min(Planet.z_m[:-1][Planet.phase == 5])
-                    Planet.dzIceV_km = (next(z_m for i, z_m in enumerate(Planet.z_m[:-1])
-                                            if i > np.where(Planet.phase == 5)[0][0]
-                                               and not Planet.phase[i] in [0, 5]) - Planet.zIceV_m) / 1e3
-                    Planet.Ocean.rhoMeanVwet_kgm3 = np.mean(Planet.rho_kgm3[Planet.phase == 5])
+                if present['V'][k]:
+                    iIceV = Planet.phase == 5
+                    iTop = np.argmax(iIceV)
+                    Planet.zIceV_m = zTop_m[iTop]
+                    Planet.dzIceV_km = (LayerEndDepth(zTop_m, np.logical_or(iIceV, Planet.phase == 0), iTop)
+                                        - Planet.zIceV_m) / 1e3
+                    Planet.Ocean.rhoMeanVwet_kgm3 = np.mean(Planet.rho_kgm3[iIceV])
                     if Params.CALC_CONDUCT:
-                        Planet.Ocean.sigmaMeanVwet_Sm = np.mean(Planet.sigma_Sm[Planet.phase == 5])
+                        Planet.Ocean.sigmaMeanVwet_Sm = np.mean(Planet.sigma_Sm[iIceV])
                     if Params.CALC_SEISMIC:
-                        Planet.Ocean.GSmeanVwet_GPa = np.mean(Planet.Seismic.GS_GPa[Planet.phase == 5])
+                        Planet.Ocean.GSmeanVwet_GPa = np.mean(Planet.Seismic.GS_GPa[iIceV])
                 else:
                     Planet.zIceV_m = np.nan
                     Planet.dzIceV_km = np.nan
-                if np.any(abs(Planet.phase) == 6):
-                    Planet.zIceVI_m = np.min(Planet.z_m[:-1][abs(Planet.phase) == 6])
-                    Planet.dzIceVI_km = (next(z_m for i, z_m in enumerate(Planet.z_m[:-1])
-                                            if i > np.where(abs(Planet.phase) == 6)[0][0]
-                                               and not Planet.phase[i] in [-6, 0, 6]) - Planet.zIceVI_m) / 1e3
+                if present['VI'][k]:
+                    iIceVI = absPhase == 6
+                    iTop = np.argmax(iIceVI)
+                    Planet.zIceVI_m = zTop_m[iTop]
+                    Planet.dzIceVI_km = (LayerEndDepth(zTop_m, np.logical_or(iIceVI, Planet.phase == 0), iTop)
+                                         - Planet.zIceVI_m) / 1e3
                     Planet.Ocean.rhoMeanVI_kgm3 = np.mean(Planet.rho_kgm3[Planet.phase == 6])
                     if Params.CALC_CONDUCT:
                         Planet.Ocean.sigmaMeanVI_Sm = np.mean(Planet.sigma_Sm[Planet.phase == 6])
                     if Params.CALC_SEISMIC:
-                        Planet.Ocean.GSmeanVI_GPa = np.mean(Planet.Seismic.GS_GPa[abs(Planet.phase) == 6])
+                        Planet.Ocean.GSmeanVI_GPa = np.mean(Planet.Seismic.GS_GPa[iIceVI])
                 else:
                     Planet.zIceVI_m = np.nan
                     Planet.dzIceVI_km = np.nan
-                if np.any(Planet.phase == 3) or np.any(Planet.phase == 5) or np.any(Planet.phase == 6):
-                    Planet.dzWetHPs_km = (next(z_m for i, z_m in enumerate(Planet.z_m[:-1])
-                                            if i > np.where(np.logical_or(Planet.phase == 3, 
-                                                            np.logical_or(Planet.phase == 5, Planet.phase == 6)))[0][0]
-                                               and not Planet.phase[i] in [0, 3, 5, 6]) - Planet.zIceVI_m) / 1e3
+                if np.any(iWetHP):
+                    Planet.dzWetHPs_km = (LayerEndDepth(zTop_m, np.logical_or(iWetHP, Planet.phase == 0), np.argmax(iWetHP))
+                                          - Planet.zIceVI_m) / 1e3
                 else:
                     Planet.dzWetHPs_km = np.nan
 
     return PlanetList, Params
 
 
+def GetPhasePresence(PlanetList):
+    """ Find which ice phases are present in each model, with one pass over the phase
+        profiles of all models stacked into a single padded 2D array.
+
+        Returns:
+            present (dict of bool, shape nModels): Whether each model contains each ice phase, keyed by
+                'Ih', 'Clath', 'IIIund' and 'Vund' (underplate ice III and V), 'III' and 'V' (in-ocean
+                ice III and V), and 'VI'.
+    """
+    nSteps = np.array([np.size(Planet.phase) for Planet in PlanetList])
+    # Pad with liquid (phase 0), which does not match any of the ice phases below
+    phase = np.zeros((np.size(nSteps), np.max(nSteps, initial=0)), dtype=np.int_)
+    phase[np.arange(np.shape(phase)[1]) < nSteps[:, np.newaxis]] = np.concatenate([Planet.phase for Planet in PlanetList])
+    absPhase = np.abs(phase)
+    present = {
+        'Ih': np.any(absPhase == 1, axis=1),
+        'Clath': np.any(absPhase == Constants.phaseClath, axis=1),
+        'IIIund': np.any(phase == -3, axis=1),
+        'III': np.any(phase == 3, axis=1),
+        'Vund': np.any(phase == -5, axis=1),
+        'V': np.any(phase == 5, axis=1),
+        'VI': np.any(absPhase == 6, axis=1)
+    }
+
+    return present
+
+
+def LayerEndDepth(z_m, inLayer, iTop):
+    """ Get the depth of the first layer below iTop that is not part of the layer group.
+
+        Args:
+            z_m (float, shape N): Depth of the top of each layer in m
+            inLayer (bool, shape N): Whether each layer belongs to the group
+            iTop (int): Index of the top layer in the group
+        Returns:
+            zEnd_m (float): Depth of the top of the first layer after iTop not in the group
+    """
+    return z_m[iTop + 1 + np.flatnonzero(~inLayer[iTop+1:])[0]]
+
+
 def PrintGeneralSummary(PlanetList, Params):
     """ Print out all of the bulk calculation outputs the user
         is likely to want for understanding the model and/or
@@ -467,7 +512,8 @@ def PrintLayerSummaryLatex(PlanetList, Params):
     log.info(FigMisc.latexPreamble)
 
     log.info('Layer tables:')
-    for Planet in PlanetList:
+    present = GetPhasePresence(PlanetList)
+    for k, Planet in enumerate(PlanetList):
         title = f'\section*{{{Planet.name}}}'
         if Planet.Do.NO_H2O:
             surfIceLayers = ''
@@ -600,7 +646,7 @@ def PrintLayerSummaryLatex(PlanetList, Params):
 
             # In-ocean HP ices
             HPiceLayers = ''
-            if np.any(Planet.phase == 3):
+            if present['III'][k]:
                 wetIceIIIlayers = newline + tab.join([wetIceIIIlbl,
                                                     f'\\num{{{(Planet.Bulk.R_m - Planet.zIceIII_m)/1e3:.1f}}}',
                                                     f'\\num{{{Planet.Ocean.rhoMeanIIIwet_kgm3:.0f}}}',
@@ -608,7 +654,7 @@ def PrintLayerSummaryLatex(PlanetList, Params):
                                                     f'\\num{{{Planet.Ocean.GSmeanIIIwet_GPa:.1f}}}',
                                                     f'\\num{{{Planet.Ocean.sigmaMeanIIIwet_Sm:.1e}}}']) + endl
                 HPiceLayers = HPiceLayers + wetIceIIIlayers
-            if np.any(Planet.phase == 5):
+            if present['V'][k]:
                 wetIceVlayers = newline + tab.join([wetIceVlbl,
                                                     f'\\num{{{(Planet.Bulk.R_m - Planet.zIceV_m)/1e3:.1f}}}',
                                                     f'\\num{{{Planet.Ocean.rhoMeanVwet_kgm3:.0f}}}',
@@ -616,7 +662,7 @@ def PrintLayerSummaryLatex(PlanetList, Params):
                                                     f'\\num{{{Planet.Ocean.GSmeanVwet_GPa:.1f}}}',
                                                     f'\\num{{{Planet.Ocean.sigmaMeanVwet_Sm:.1e}}}']) + endl
                 HPiceLayers = HPiceLayers + wetIceVlayers
-            if np.any(abs(Planet.phase) == 6):
+            if present['VI'][k]:
                 iceVIlayers = newline + tab.join([iceVIlbl,
                                                   f'\\num{{{(Planet.Bulk.R_m - Planet.zIceVI_m)/1e3:.1f}}}',
                                                   f'\\num{{{Planet.Ocean.rhoMeanVI_kgm3:.0f}}}',
@@ -0,0 +1,50 @@
+"""
+Tracing: Functions for printing per-layer debug messages from the layer propagation loops
+without paying for message formatting when they would not be printed
+"""
+
+import logging
+
+# Assign logger
+log = logging.getLogger('PlanetProfile')
+
+# Format for per-layer messages. Arguments are formatted by the logger only when the message is emitted.
+layerFmt = 'il: %d; P_MPa: %.3f; T_K: %.3f; phase: %d'
+
+
+def TraceLayers(Params):
+    """ Check whether per-layer messages should be printed. Call once ahead of a loop over layers
+        and test the result inside the loop, so that loops skip per-layer messages entirely
+        when Params.TRACE_LAYERS is False or debug messages would not be printed anyway.
+
+        Returns:
+            TRACE (bool): Whether to print per-layer messages.
+    """
+    return Params.TRACE_LAYERS and log.isEnabledFor(logging.DEBUG)
+
+
+def LogLayer(i, P_MPa, T_K, phase):
+    """ Print a debug message with the state of a single layer. Check TraceLayers before calling
+        this from loops over layers.
+
+        Args:
+            i (int): Layer array index.
+            P_MPa, T_K (float): Pressure and temperature of the layer.
+            phase (int): Phase ID of the layer.
+    """
+    log.debug(layerFmt, i, P_MPa, T_K, phase)
+
+
+def LogLayers(Params, iStart, iEnd, P_MPa, T_K, phase):
+    """ Print debug messages with the state of each layer from iStart to iEnd, e.g. after a
+        range of layers has been evaluated all at once.
+
+        Args:
+            iStart, iEnd (int): Layer array indices of the first layer to print and the end
+                of the range.
+            P_MPa, T_K (float, shape N): Pressures and temperatures, indexed by layer.
+            phase (int, shape N): Phase IDs, indexed by layer.
+    """
+    if TraceLayers(Params):
+        for i in range(iStart, iEnd):
+            LogLayer(i, P_MPa[i], T_K[i], phase[i])
@@ -481,6 +481,7 @@ class PlanetStruct:
         """ Derived quantities (assigned during PlanetProfile runs) """
         # Layer arrays
         self.phase = None  # Phase of the layer input as an integer: ocean=0, ice I through VI are 1 through 6, clathrate=Constants.phaseClath, silicates=Constants.phaseSil, iron=Constants.phaseFe.
+        self.phaseInds = None  # Cached copy of phase and its phase indices from GetPlanetPhaseIndices, reused by post-processing calculations
         self.r_m = None  # Distance from center of body to the outer bound of current layer in m
         self.z_m = None  # Distance from surface of body to the outer bound of current layer in m
         self.T_K = None  # Temperature of each layer in K
@@ -587,7 +588,7 @@ class PlanetStruct:
 # Construct filenames for data, saving/reloading
 class DataFilesSubstruct:
     def __init__(self, datPath, saveBase, comp, inductBase=None, exploreAppend=None,
-                 inductAppend=None, EXPLORE=False):
+                 inductAppend=None, EXPLORE=False, BINARY=False):
         if inductBase is None:
             inductBase = saveBase
         if exploreAppend is None:
@@ -614,7 +615,10 @@ class DataFilesSubstruct:
                 os.makedirs(self.fNameSeis)
 
         self.fName = os.path.join(self.path, saveBase)
-        self.saveFile = self.fName + '.txt'
+        if BINARY:
+            self.saveFile = self.fName + '.npz'
+        else:
+            self.saveFile = self.fName + '.txt'
         self.mantCoreFile = self.fName + '_mantleCore.txt'
         self.permFile = self.fName + '_mantlePerm.txt'
         self.fNameSeis = os.path.join(self.seisPath, saveBase)
@@ -622,8 +626,8 @@ class DataFilesSubstruct:
         self.minEOSyanFile = os.path.join(self.fNameSeis, 'yannos.dat')
         self.AxiSEMfile = self.fNameSeis + '_AxiSEM.bm'
         self.fNameExplore = self.fName + f'_{self.exploreAppend}ExploreOgram'
-        self.exploreOgramFile = f'{self.fNameExplore}.mat'
-        self.invertOgramFile = f'{self.fNameExplore}Inversion.mat'
+        self.exploreOgramFile = f'{self.fNameExplore}.h5'
+        self.invertOgramFile = f'{self.fNameExplore}Inversion.h5'
         self.fNameInduct = os.path.join(self.inductPath, saveBase)
         self.inductLayersFile = self.fNameInduct + '_inductLayers.txt'
         self.inducedMomentsFile = self.fNameInduct + '_inducedMoments.mat'
@@ -910,6 +914,8 @@ class ConductLayerParamsStruct:
         self.CONCENTRIC_ASYM = False  # Whether to map a single asymmetric shape to all layers, concentrically, scaling by their radii.
         self.ALLOW_LOW_PMAX = False  # Whether to allow Magnetic.pMax to be set to an integer less than 2.
         self.asymFstring = 'Shape_4piNormDepth'
+        self.CACHE_XID = True  # Whether to save and reload asymmetric induction mixing coefficient (Xid) tables from an on-disk cache
+        self.XidCacheDir = 'XidCache'  # Directory in which to store cached Xid tables. Relative paths are within the PlanetProfile/MagneticInduction package directory.
 
 
 """ Excitation spectrum settings """
@@ -982,6 +988,7 @@ class ExplorationStruct:
         self.sigmaIonos_Sm = None  # Values set of outermost ionosphere Pedersen conductivity in S/m.
         self.Htidal_Wm3 = None  # Values of Sil.Htidal_Wm3 set.
         self.Qrad_Wkg = None  # Values of Sil.Qrad_Wkg set.
+        self.qSurf_Wm2 = None  # Values of surface heat flux in W/m^2 set.
         self.rhoSilMean_kgm3 = None  # Values of Sil.rhoMean_kgm3 result (also equal to those set for all but phi inductOtype).
         self.rhoCoreMean_kgm3 = None  # Values of Core.rhoMean_kgm3 result (also equal to those set for all but phi inductOtype).
         self.sigmaMean_Sm = None  # Mean ocean conductivity result in S/m.
@@ -2313,6 +2320,10 @@ class TrajecParamsStruct:
         self.EXPANDED_RANGE = False  # Whether to plot an expanded set of B measurements farther from the encounter CA, with range set by etExpandRange_s
         self.REDUCED_RANGE = False  # Whether to plot a reduced range of B measurements near the encounter CA, with range set by etReducedRange_s
         self.PLANETMAG_MODEL = False  # Whether to load in evaluated magnetic field models printed to disk from PlanetMag instead of directly evaluating excitation moments
+        self.CACHE_SPICE = True  # Whether to save spacecraft positions evaluated from SPICE kernels to disk for quick reloading
+        self.spiceCacheDir = 'SpiceCache'  # Directory in which to save cached spacecraft positions. Relative paths are within the SpacecraftMAGdata directory.
+        self.junoWindow_s = None  # Range in seconds centered on CA within which to load Juno MAG data. Only day files overlapping this range are read. If None, all days in each perijove are loaded.
+        self.magCadence_s = None  # Cadence in seconds to which to decimate Juno MAG data on load, by averaging within time bins. If None, data are kept at full resolution.
         self.fbInclude = None  # Dict of list of flyby/rev/periapse number strings to include in analysis, or 'all' to include all available
         self.fbRange_Rp = None  # Maximum distance in planetary radii (of parent planet, for moons) within which to mark flyby encounters
         self.etPredRange_s = None  # Range in seconds for the span across closest approach to use for predicted spacecraft trajectories, i.e. those for which we do not yet have data
@@ -2416,6 +2427,9 @@ class ModelDataStruct:
         self.BxAll_nT = None  # Concatenated array of BxIAU across all considered flybys
         self.ByAll_nT = None  # Concatenated array of ByIAU across all considered flybys
         self.BzAll_nT = None  # Concatenated array of BzIAU across all considered flybys
+        self.BiBasis = {}  # Dict of scName: fbID: (nLin, mLin) tuples: Nnm x 3 x nPts array of IAU field components from a unit induced moment for each n, m along the trajectory
+        self.phasesExc = {}  # Dict of scName: fbID: omegaExc_radps tuple: nExc x nPts array of complex excitation phases exp(-i*omega*t) along the trajectory
+        self.geomPhiO = {}  # Dict of scName: fbID: dict of trajectory geometry in the PHI_OMEGA frame used in Alfven wing calcs
 
         if loadDict is None:
             self.fitProfileFname = None
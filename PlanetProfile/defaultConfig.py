@@ -5,7 +5,7 @@ Overridden by any settings contained within PPBody.py files.
 import os
 from PlanetProfile.Utilities.defineStructs import ParamsStruct, ExploreParamsStruct, Constants
 
-configVersion = 15  # Integer number for config file version. Increment when new settings are added to the default config file.
+configVersion = 19  # Integer number for config file version. Increment when new settings are added to the default config file.
 
 def configAssign():
     Params = ParamsStruct()
@@ -15,6 +15,7 @@ def configAssign():
     Params.QUIET =         False  # Hides all log messages except warnings and errors
     Params.QUIET_MOONMAG = True  # If True, sets MoonMag logging level to WARNING, otherwise uses the same as PlanetProfile.
     Params.QUIET_LBF = True  # If True, sets lbftd and mlbspline logging levels to ERROR, otherwise uses the same as PlanetProfile.
+    Params.TRACE_LAYERS = True  # Whether to print a debug message for every layer as it is evaluated when VERBOSE is True. Set to False to skip per-layer messages entirely in large runs.
     Params.printFmt = '[%(levelname)s] %(message)s'  # Format for printing log messages
     # The below flags allow or prevents extrapolation of EOS functions beyond the definition grid.
     Params.EXTRAP_ICE = {'Ih':False, 'II':False, 'III':False, 'V':False, 'VI':False, 'Clath':False}
@@ -40,8 +41,10 @@ def configAssign():
     Params.DO_PARALLEL =      True  # Whether to use multiprocessing module for parallel computation where applicable
     Params.threadLimit =      1000  # Upper limit to number of processors/threads for parallel computation
     Params.FORCE_EOS_RECALC = False  # Whether to reuse previously loaded EOS functions for multi-profile runs
+    Params.REUSE_ICE_SHELLS = False  # Whether to reuse conductive ice shell profiles calculated for previous models with identical shell inputs, e.g. for exploreograms varying only interior properties. Each saved shell is kept in memory until the end of the run.
     Params.SKIP_INNER =       False  # Whether to skip past everything but ocean calculations after MoI matching (for large induction studies)
     Params.NO_SAVEFILE =      False  # Whether to prevent printing run outputs to disk. Saves time and disk space for large induction studies.
+    Params.BINARY_PROFILES =  False  # Whether to save profiles as binary .npz files instead of fixed-width text. Binary profiles are much faster to write and reload, but are not human-readable.
     Params.DISP_LAYERS =      True  # Whether to display layer depths and heat fluxes for user
     Params.DISP_TABLE =       True  # Whether to print latex-formatted table
     Params.ALLOW_BROKEN_MODELS = False  # Whether to continue running models that don't match physical constraints (i.e. MoI), with many values set to nan. Currently only implemented for CONSTANT_INNER_DENSITY = True and only allows broken MoI matching. Broken Tb_K matching is also intended.
@@ -95,6 +98,7 @@ def configAssign():
     ExploreParams.yRange = [249.0, 272.5]  # Same as above for y variable
     ExploreParams.nx = 30  # Number of points to use in linspace with above x range
     ExploreParams.ny = 24  # Same as above for y
+    ExploreParams.CONVECT_LOOKUP = False  # Whether to tabulate the pure water melting curve once before running exploreogram models and interpolate in it for ice shell convection, instead of finding the melting temperature for each model
 
     # Reference profile settings
     # Salinities of reference melting curves in ppt
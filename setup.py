@@ -31,7 +31,8 @@ setup(
         'gsw >= 3.6.16',
         'spiceypy >= 6.0.0',
         'cmasher >= 1.6.3',
-        'hdf5storage >= 0.1.19'
+        'hdf5storage >= 0.1.19',
+        'h5py >= 3.9.0'
     ],
     include_package_data=True  # Files to include are listed in MANIFEST.in
 )